@@ -0,0 +1,141 @@
+"""
+Benchmark: decoding /productsList bodies.
+
+Compares the previous parse_api_response (text read twice on errors,
+json.loads of the str) with the current one (bytes read once, orjson when
+installed), decoding into Product records, and finding one product by
+full decode plus search vs. lazy iteration. Also reports the memory the
+decoded catalog retains as dicts vs. slotted records. The catalog is the
+local site's, repeated to the requested size:
+
+    python -m benchmarks.api_decoding --products 5000 --iterations 50
+
+Records are not the fast path: decode_products checks and converts every
+field (prices to Decimal), which makes it about half as fast as the legacy
+helper, in exchange for about half the retained memory. iter_products
+only beats a full decode when the match is in the first part of the
+catalog (see --position).
+"""
+import argparse
+import json
+import statistics
+import time
+import tracemalloc
+
+from local_site.server import PRODUCTS
+from utils import helper
+from utils.api_records import decode_products, iter_products
+from utils.helper import parse_api_response
+
+
+class StaticResponse:
+    """Stand-in for Playwright's APIResponse serving a fixed body."""
+
+    def __init__(self, body: bytes):
+        self._body = body
+
+    def body(self) -> bytes:
+        return self._body
+
+    def text(self) -> str:
+        return self._body.decode()
+
+
+def legacy_parse_api_response(response) -> dict:
+    """parse_api_response before it read bytes once through load_json."""
+    try:
+        return json.loads(response.text())
+    except json.JSONDecodeError as e:
+        raise ValueError(f"Invalid JSON response: {response.text()}") from e
+
+
+def stdlib_parse_api_response(response) -> dict:
+    """parse_api_response with orjson unavailable."""
+    backend, helper.orjson = helper.orjson, None
+    try:
+        return parse_api_response(response)
+    finally:
+        helper.orjson = backend
+
+
+def build_body(count: int) -> bytes:
+    products = [
+        {**product, "id": index + 1, "name": f"{product['name']} {index}"}
+        for index, product in zip(range(count), PRODUCTS * (count // len(PRODUCTS) + 1))
+    ]
+    return json.dumps({"responseCode": 200, "products": products}).encode()
+
+
+def timed(function, iterations: int) -> list[float]:
+    durations = []
+    for _ in range(iterations):
+        started = time.perf_counter()
+        function()
+        durations.append(time.perf_counter() - started)
+    return durations
+
+
+def retained(function) -> int:
+    """Bytes allocated by function that are still held by its result."""
+    tracemalloc.start()
+    result = function()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return size
+
+
+def report(name: str, durations: list[float], baseline: float) -> None:
+    median = statistics.median(durations)
+    print(f"{name:<36} median {median * 1000:8.2f} ms   {baseline / median:5.1f}x")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="API response decoding benchmark")
+    parser.add_argument("--products", type=int, default=2000, help="Products in the catalog")
+    parser.add_argument("--iterations", type=int, default=30)
+    parser.add_argument(
+        "--position", type=float, default=0.1, help="Where in the catalog the searched product is (0-1)"
+    )
+    args = parser.parse_args()
+
+    body = build_body(args.products)
+
+    def response() -> StaticResponse:
+        # A new response per call: decode_response caches per response
+        return StaticResponse(body)
+
+    index = int((args.products - 1) * args.position)
+    target = f"{PRODUCTS[index % len(PRODUCTS)]['name']} {index}"
+    print(
+        f"{args.products} products, {len(body) / 1024:.0f} KiB, "
+        f"JSON backend: {'orjson' if helper.orjson else 'json'}"
+    )
+
+    def full_search():
+        return next(p for p in parse_api_response(response())["products"] if p["name"] == target)
+
+    def lazy_search():
+        return next(p for p in iter_products(response()) if p.name == target)
+
+    cases = {
+        "legacy parse_api_response": lambda: legacy_parse_api_response(response()),
+        "parse_api_response (json)": lambda: stdlib_parse_api_response(response()),
+        "parse_api_response": lambda: parse_api_response(response()),
+        "decode_products (records)": lambda: decode_products(response()),
+        "find product: parse and search": full_search,
+        "find product: iter_products": lazy_search,
+    }
+    baseline = None
+    for name, function in cases.items():
+        durations = timed(function, args.iterations)
+        baseline = baseline or statistics.median(durations)
+        report(name, durations, baseline)
+
+    dicts = retained(lambda: parse_api_response(response())["products"])
+    records = retained(lambda: decode_products(response()))
+    print(f"retained: dicts {dicts / 1024:.0f} KiB, records {records / 1024:.0f} KiB")
+
+
+if __name__ == "__main__":
+    main()
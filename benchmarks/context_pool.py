@@ -0,0 +1,88 @@
+"""
+Benchmark: fresh browser context per test vs. pooled contexts.
+
+Runs the same short "test" (open a page of the local stand-in site, wait
+for its readiness locator, close the page) N times per model and reports
+throughput. Video and tracing can be switched on to match pytest.ini:
+
+    python -m benchmarks.context_pool --iterations 50 --video --tracing
+"""
+import argparse
+import statistics
+import tempfile
+import time
+
+from playwright.sync_api import Browser, sync_playwright
+
+from local_site.server import LocalSite
+from pages.products_page import ProductsPage
+from utils.config import configure_base_url
+from utils.context_pool import BrowserContextPool
+
+
+def run_test(context) -> None:
+    page = context.new_page()
+    ProductsPage(page).navigate()
+    page.close()
+
+
+def per_test_model(browser: Browser, iterations: int, context_args: dict, tracing: bool) -> list[float]:
+    durations = []
+    for _ in range(iterations):
+        started = time.perf_counter()
+        context = browser.new_context(**context_args)
+        if tracing:
+            context.tracing.start(screenshots=True, snapshots=True, sources=True)
+        run_test(context)
+        if tracing:
+            context.tracing.stop()
+        context.close()
+        durations.append(time.perf_counter() - started)
+    return durations
+
+
+def pooled_model(browser: Browser, iterations: int, context_args: dict) -> list[float]:
+    pool = BrowserContextPool(browser, size=2)
+    durations = []
+    for _ in range(iterations):
+        started = time.perf_counter()
+        context = pool.acquire(context_args)
+        run_test(context)
+        pool.release(context)
+        durations.append(time.perf_counter() - started)
+    pool.close()
+    return durations
+
+
+def report(name: str, durations: list[float]) -> None:
+    total = sum(durations)
+    print(
+        f"{name:<12} {len(durations) / total:7.1f} tests/s   "
+        f"median {statistics.median(durations) * 1000:7.1f} ms   "
+        f"max {max(durations) * 1000:7.1f} ms"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Browser context pool benchmark")
+    parser.add_argument("--iterations", type=int, default=30)
+    parser.add_argument("--browser", default="chromium", choices=("chromium", "firefox", "webkit"))
+    parser.add_argument("--video", action="store_true", help="Record video, as --video=retain-on-failure does")
+    parser.add_argument("--tracing", action="store_true", help="Trace per context, as --tracing=retain-on-failure does")
+    args = parser.parse_args()
+
+    with LocalSite() as site, tempfile.TemporaryDirectory() as video_dir, sync_playwright() as playwright:
+        configure_base_url(site.url)
+        browser = getattr(playwright, args.browser).launch()
+        context_args = {"record_video_dir": video_dir} if args.video else {}
+
+        # Warm up the browser and the site once so neither model pays for it
+        per_test_model(browser, 1, context_args, tracing=False)
+
+        report("per-test", per_test_model(browser, args.iterations, context_args, args.tracing))
+        report("pooled", pooled_model(browser, args.iterations, context_args))
+        browser.close()
+
+
+if __name__ == "__main__":
+    main()
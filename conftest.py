@@ -2,20 +2,28 @@
 Pytest configuration and shared fixtures.
 
 Fixture Scopes:
-- session: Browser instance (provided by pytest-playwright)
+- session: Browser instance (provided by pytest-playwright), auth state cache,
+  account pool, account cleanup queue, API request context pool,
+  API schema registry, API matrix runner, browser context pool, product catalog
+- process: local stand-in site (--local-site), served from the controller
 - function: Page, page objects, API client (test isolation)
 """
 import logging
 import os
 import shutil
+import subprocess
 import sys
 import platform
+import tempfile
+from datetime import timedelta
 from typing import Generator
 
 import allure
 import pytest
-from playwright.sync_api import Page
+from playwright.sync_api import BrowserContext, Page, TimeoutError as PlaywrightTimeoutError
 
+from local_site.server import LocalSite
+from pages.base_page import BasePage
 from pages.auth_page import AuthPage
 from pages.products_page import ProductsPage
 from pages.registration_page import RegistrationPage
@@ -23,58 +31,484 @@ from pages.contactus_page import ContactUsPage
 from pages.cart_page import CartPage
 from pages.checkout_page import CheckoutPage
 from pages.payment_page import PaymentPage
+from utils.account_cleanup import AccountCleanupQueue
+from utils.account_pool import AccountPool
 from utils.api_client import APIClient
-from utils.constants import USER_DATA
+from utils.api_matrix import APIMatrix
+from utils.api_metrics import APIMetrics, parse_latency_budget
+from utils.artifacts import attach_page_screenshots, attach_report_artifacts
+from utils.auth_state import AuthStateCache, login_with_form_post
+from utils.catalog import CatalogCache, ProductCatalog
+from utils.context_pool import BrowserContextPool
+from utils.config import configure_base_url, resolve_base_url
+from utils.constants import URLS, USER_DATA
+from utils.har import HarArchive
+from utils.helper import parse_api_response
+from utils.network import THIRD_PARTY_DOMAINS, RequestBlocker
+from utils.profiler import StepProfiler
+from utils.request_pool import RequestContextPool
+from utils.scheduling import DurationScheduling
+from utils.schemas import SchemaRegistry
+
+
+# Fixture names (including aliases) whose tests get a pre-authenticated context
+AUTHENTICATED_FIXTURES = ("logged_in_user", "login_user")
+
+# Seconds provisioned_user waits on an empty pool before registering on its own
+ACCOUNT_POOL_LEASE_TIMEOUT = 2.0
+
+# Seconds the session waits for the account pool producer to empty the pool
+ACCOUNT_POOL_SHUTDOWN_TIMEOUT = 30.0
+
+# Milliseconds logged_in_user waits for the account name after logging in again
+RELOGIN_TIMEOUT_MS = 10_000
+
+# pytest-playwright artifact options --record-on-rerun switches per attempt
+ARTIFACT_OPTIONS = ("tracing", "video", "screenshot")
+
+account_pool_key = pytest.StashKey[AccountPool]()
+account_producer_key = pytest.StashKey[subprocess.Popen]()
+local_site_key = pytest.StashKey[LocalSite]()
+leaked_accounts_key = pytest.StashKey[list]()
+request_pool_stats_key = pytest.StashKey[dict]()
+context_pool_stats_key = pytest.StashKey[dict]()
+har_misses_key = pytest.StashKey[list]()
+profiler_key = pytest.StashKey[StepProfiler]()
+scheduler_key = pytest.StashKey[DurationScheduling]()
+api_metrics_key = pytest.StashKey[APIMetrics]()
+budget_violations_key = pytest.StashKey[list]()
 
 
 # =============================================================================
 # Pytest Hooks
 # =============================================================================
 
+def pytest_addoption(parser):
+    """Register custom command line options."""
+    parser.addoption(
+        "--auth-cache",
+        choices=("off", "worker", "shared"),
+        default="worker",
+        help="Reuse a stored login for logged_in_user: off, per xdist worker, "
+             "or shared across workers (file-locked). Default: worker.",
+    )
+    parser.addoption(
+        "--account-pool",
+        type=int,
+        default=0,
+        metavar="N",
+        help="Keep N pre-registered accounts ready for provisioned_user, "
+             "shared by all xdist workers. Default: 0 (disabled).",
+    )
+    parser.addoption(
+        "--api-pool-size",
+        type=int,
+        default=1,
+        metavar="N",
+        help="Idle API request contexts each worker keeps for reuse. Default: 1.",
+    )
+    parser.addoption(
+        "--context-pool",
+        type=int,
+        default=0,
+        metavar="N",
+        help="Idle browser contexts each worker keeps warm and resets between tests; "
+             "bypassed while --video or --tracing is on. Default: 0 (a fresh context per test).",
+    )
+    parser.addoption(
+        "--catalog-ttl",
+        type=float,
+        default=300,
+        metavar="SECONDS",
+        help="How long a fetched product catalog is reused. Default: 300.",
+    )
+    parser.addoption(
+        "--shared-catalog",
+        action="store_true",
+        help="Share the product catalog between xdist workers through an on-disk cache.",
+    )
+    parser.addoption(
+        "--local-site",
+        action="store_true",
+        help="Run against a local stand-in of automationexercise.com "
+             "(in-memory accounts, no network).",
+    )
+    parser.addoption(
+        "--block-requests",
+        action="store_true",
+        help="Abort ad, analytics and web font requests in every browser context.",
+    )
+    parser.addoption(
+        "--wait-until",
+        choices=("commit", "domcontentloaded", "load", "networkidle"),
+        help="Event page objects wait for when navigating. "
+             "Default: domcontentloaded, then the page's readiness locator.",
+    )
+    parser.addoption(
+        "--har",
+        choices=("off", "record", "replay"),
+        default="off",
+        help="Record each UI test's traffic to the site as a HAR archive, "
+             "or replay it from the archive instead of the network. Default: off.",
+    )
+    parser.addoption(
+        "--har-dir",
+        default="hars",
+        help="Directory of the HAR archives, relative to the rootdir. Default: hars.",
+    )
+    parser.addoption(
+        "--har-max-age",
+        type=float,
+        default=14,
+        metavar="DAYS",
+        help="Archives older than this are not replayed; the test uses the network. Default: 14.",
+    )
+    parser.addoption(
+        "--har-not-found",
+        choices=("fallback", "abort"),
+        default="fallback",
+        help="What replay does with requests missing from the archive. Default: fallback (network).",
+    )
+    parser.addoption(
+        "--schedule-by-duration",
+        action="store_true",
+        help="Hand out tests to xdist workers longest first, from the durations of "
+             "previous runs (pytest cache). Requires --dist=loadgroup, whose xdist_group "
+             "marks it honors.",
+    )
+    parser.addoption(
+        "--record-on-rerun",
+        action="store_true",
+        help="Run tests without tracing, video and screenshots, and rerun failed ones "
+             "with all three on (needs pytest-rerunfailures; --reruns defaults to 1).",
+    )
+    parser.addoption(
+        "--profile",
+        nargs="?",
+        const="profile.json",
+        metavar="PATH",
+        help="Time allure steps, navigations and Playwright actions: attach a per-test "
+             "breakdown to Allure and write session totals to PATH (default: profile.json).",
+    )
+    parser.addoption(
+        "--api-metrics",
+        nargs="?",
+        const="api-metrics",
+        metavar="PATH",
+        help="Write per-endpoint API latency percentiles and sizes of the session to "
+             "PATH.json and PATH.csv (default: api-metrics).",
+    )
+    parser.addoption(
+        "--api-latency-budget",
+        type=parse_latency_budget,
+        action="append",
+        default=[],
+        metavar="ENDPOINT=MS",
+        help='Latency budget of an API endpoint: "POST /verifyLogin=500", "/productsList=800" '
+             'or "*=1000" for all (repeatable).',
+    )
+    parser.addoption(
+        "--api-budget-mode",
+        choices=("warn", "fail"),
+        default="warn",
+        help="What API calls over their latency budget do at the end of the session: warn lists "
+             "them, fail also fails the run. Default: warn.",
+    )
+    parser.addoption(
+        "--schema-validation",
+        choices=("fail", "warn", "off"),
+        default="warn",
+        help="What an API response breaking its endpoint's schema (utils/schemas.py) does: "
+             "fail the call that got it, warn, or nothing. Default: warn.",
+    )
+
+
+def pytest_configure(config):
+    """
+    Apply the navigation and base URL settings, then start the local site
+    and the account pool producer (controller process only).
+    """
+    wait_until = config.getoption("--wait-until")
+    if wait_until:
+        BasePage.WAIT_UNTIL = wait_until
+    
+    if config.getoption("--record-on-rerun"):
+        if not config.pluginmanager.hasplugin("rerunfailures"):
+            raise pytest.UsageError("--record-on-rerun requires pytest-rerunfailures")
+        if not config.getoption("--reruns"):
+            config.option.reruns = 1
+    
+    dist = config.getoption("dist", "no")
+    if config.getoption("--schedule-by-duration") and dist not in ("loadgroup", "no"):
+        raise pytest.UsageError(
+            f"--schedule-by-duration replaces the loadgroup scheduler, but --dist={dist}; "
+            "run it with --dist=loadgroup"
+        )
+    
+    if config.getoption("--profile"):
+        profiler = StepProfiler()
+        profiler.install()
+        config.stash[profiler_key] = profiler
+    
+    if hasattr(config, "workerinput"):
+        configure_base_url(config.workerinput["base_url"])
+        pool_dir = config.workerinput.get("account_pool_dir")
+        if pool_dir:
+            config.stash[account_pool_key] = AccountPool(pool_dir)
+        return
+    
+    if config.getoption("--local-site"):
+        site = LocalSite().start()
+        config.stash[local_site_key] = site
+        configure_base_url(site.url)
+    else:
+        configure_base_url(resolve_base_url(config))
+    
+    pool_size = config.getoption("--account-pool")
+    # Collecting runs no test, so it would only register and delete accounts
+    if pool_size <= 0 or config.option.collectonly:
+        return
+    
+    pool = AccountPool(tempfile.mkdtemp(prefix="account-pool-"))
+    config.stash[account_producer_key] = subprocess.Popen(
+        [
+            sys.executable, "-m", "utils.account_pool", str(pool.pool_dir),
+            "--size", str(pool_size), "--base-url", URLS.BASE_URL,
+        ],
+        cwd=config.rootpath,
+    )
+    config.stash[account_pool_key] = pool
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_configure_node(node):
+    """Hand the resolved base URL and the account pool location to each xdist worker."""
+    node.workerinput["base_url"] = URLS.BASE_URL
+    pool = node.config.stash.get(account_pool_key, None)
+    if pool is not None:
+        node.workerinput["account_pool_dir"] = str(pool.pool_dir)
+
+
+def pytest_unconfigure(config):
+    """
+    Remove the profiler, wait for the producer to delete the pooled accounts
+    (killing it after ACCOUNT_POOL_SHUTDOWN_TIMEOUT) and stop the local site,
+    which the producer may still be calling.
+    """
+    profiler = config.stash.get(profiler_key, None)
+    if profiler is not None:
+        profiler.uninstall()
+    if hasattr(config, "workerinput"):
+        return
+    pool = config.stash.get(account_pool_key, None)
+    if pool is not None:
+        pool.stop()
+    producer = config.stash.get(account_producer_key, None)
+    if producer is not None:
+        try:
+            producer.wait(ACCOUNT_POOL_SHUTDOWN_TIMEOUT)
+        except subprocess.TimeoutExpired:
+            producer.kill()
+            producer.wait()
+    site = config.stash.get(local_site_key, None)
+    if site is not None:
+        site.stop()
+
+
+def pytest_report_header(config):
+    """Show which deployment of the site the run targets."""
+    return f"base url: {URLS.BASE_URL}"
+
+
+def is_recorded_rerun(item) -> bool:
+    """Whether this attempt of the test is a rerun recorded by --record-on-rerun."""
+    return item.config.getoption("--record-on-rerun") and getattr(item, "execution_count", 1) > 1
+
+
+@pytest.hookimpl(hookwrapper=True)
 def pytest_runtest_setup(item):
-    """Convert @pytest.mark.tags to Allure tags."""
+    """
+    Convert @pytest.mark.tags to Allure tags, with --record-on-rerun turn
+    tracing, video and screenshots on for reruns only, and with --profile
+    start timing the test (fixture setup included).
+    """
+    profiler = item.config.stash.get(profiler_key, None)
+    if profiler is not None:
+        profiler.start_test()
+    
+    if item.config.getoption("--record-on-rerun"):
+        # pytest-playwright reads these when the test's artifacts recorder is set up and torn down
+        value = "on" if is_recorded_rerun(item) else "off"
+        for option in ARTIFACT_OPTIONS:
+            setattr(item.config.option, option, value)
+    
     for marker in item.iter_markers(name="tags"):
         for tag in marker.args:
             allure.dynamic.tag(tag)
+    yield
 
 
 @pytest.hookimpl(tryfirst=True, hookwrapper=True)
 def pytest_runtest_makereport(item, call):
-    """Attach screenshot and video to Allure on test failure."""
+    """
+    Store each phase's report for fixtures, and attach the screenshots, videos
+    and traces pytest-playwright kept for the test, and the --profile step
+    timings, to Allure.
+    """
     outcome = yield
     report = outcome.get_result()
     
     # Store report for other fixtures to access
     setattr(item, f"rep_{report.when}", report)
     
-    if report.when == "call" and report.failed:
-        page = item.funcargs.get("page")
-        if page:
-            # Attach screenshot
-            try:
-                allure.attach(
-                    page.screenshot(),
-                    name="Failure Screenshot",
-                    attachment_type=allure.attachment_type.PNG
-                )
-            except Exception:
-                pass  # Silently fail if screenshot capture fails
-            
-            # Attach video if available
-            try:
-                video = page.video
-                if video:
-                    video_path = video.path()
-                    # Video file might not be finalized yet, need to close page first
-                    # But we can't close page here, so we'll attach after page closes
-                    # Store path for later attachment
-                    setattr(item, "_video_path", video_path)
-            except Exception:
-                pass
+    # pytest-playwright lists its artifacts on the teardown report, once the
+    # contexts are closed and the videos written
+    if report.when == "teardown":
+        attach_report_artifacts(report, item.config.invocation_params.dir)
+        # Attached here: allure-pytest closes the test before pytest_runtest_protocol returns
+        profiler = item.config.stash.get(profiler_key, None)
+        breakdown = profiler.finish_test(item.nodeid) if profiler is not None else ""
+        if breakdown:
+            allure.attach(breakdown, name="Step Timings", attachment_type=allure.attachment_type.TEXT)
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_xdist_make_scheduler(config, log):
+    """Use the duration-aware scheduler with --schedule-by-duration."""
+    if not config.getoption("--schedule-by-duration"):
+        return None
+    scheduler = DurationScheduling(config, log)
+    config.stash[scheduler_key] = scheduler
+    return scheduler
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_testnodedown(node, error):
+    """
+    Collect leaked accounts, pool counters, HAR misses, step timings and API
+    calls from an xdist worker.
+    """
+    workeroutput = getattr(node, "workeroutput", {})
+    node.config.stash.setdefault(api_metrics_key, APIMetrics()).extend(
+        APIMetrics.from_tuples(workeroutput.get("api_calls", []))
+    )
+    profiler = node.config.stash.get(profiler_key, None)
+    if profiler is not None and "profile" in workeroutput:
+        profiler.merge(workeroutput["profile"])
+    node.config.stash.setdefault(leaked_accounts_key, []).extend(
+        workeroutput.get("leaked_accounts", [])
+    )
+    node.config.stash.setdefault(har_misses_key, []).extend(workeroutput.get("har_misses", []))
+    for key, name in (
+        (request_pool_stats_key, "request_pool_stats"),
+        (context_pool_stats_key, "context_pool_stats"),
+    ):
+        totals = node.config.stash.setdefault(key, {})
+        for stat, count in workeroutput.get(name, {}).items():
+            totals[stat] = totals.get(stat, 0) + count
+
+
+def pytest_terminal_summary(terminalreporter, exitstatus, config):
+    """
+    Report request/browser context reuse, scheduling, slowest steps, API
+    latencies and budget violations, HAR replay misses and leaked test accounts.
+    """
+    stats = config.stash.get(request_pool_stats_key, {})
+    if stats.get("acquired"):
+        terminalreporter.line(
+            f"API request contexts: {stats['reused']}/{stats['acquired']} reused "
+            f"({stats['reused'] / stats['acquired']:.0%}), {stats['created']} created, "
+            f"{stats['isolated']} isolated, {stats['discarded']} discarded"
+        )
+    stats = config.stash.get(context_pool_stats_key, {})
+    if stats.get("acquired"):
+        terminalreporter.line(
+            f"Browser contexts: {stats['reused']}/{stats['acquired']} reused "
+            f"({stats['reused'] / stats['acquired']:.0%}), {stats['created']} created, "
+            f"{stats['discarded']} discarded"
+        )
+    scheduler = config.stash.get(scheduler_key, None)
+    if scheduler is not None and scheduler.report():
+        terminalreporter.line(scheduler.report())
+    
+    profiler = config.stash.get(profiler_key, None)
+    if profiler is not None and profiler.stats:
+        terminalreporter.section("slowest steps (total time)")
+        for step in profiler.as_dict()["steps"][:10]:
+            terminalreporter.line(
+                f"{step['total']:8.2f}s  {step['count']:4d}x  max {step['max']:6.2f}s  {step['name']}"
+            )
+        terminalreporter.line(f"Full profile: {config.rootpath / config.getoption('--profile')}")
+    
+    api_metrics = config.stash.get(api_metrics_key, None)
+    if config.getoption("--api-metrics") and api_metrics is not None and api_metrics.calls:
+        terminalreporter.section("API latency per endpoint")
+        for line in api_metrics.format_summary().splitlines():
+            terminalreporter.line(line)
+    
+    budget_violations = config.stash.get(budget_violations_key, [])
+    if budget_violations:
+        failing = config.getoption("--api-budget-mode") == "fail"
+        terminalreporter.section("API calls over their latency budget", red=failing, yellow=not failing)
+        for violation in budget_violations:
+            terminalreporter.line(violation)
+    
+    har_misses = config.stash.get(har_misses_key, [])
+    if har_misses:
+        terminalreporter.section("tests without a fresh HAR archive (used the network)", yellow=True)
+        for nodeid in sorted(har_misses):
+            terminalreporter.line(nodeid)
+    
+    leaked = config.stash.get(leaked_accounts_key, [])
+    if not leaked:
+        return
+    terminalreporter.section("leaked test accounts", yellow=True)
+    for email, _ in leaked:
+        terminalreporter.line(email)
 
 
 def pytest_sessionfinish(session, exitstatus):
-    """Generate environment.properties for Allure report."""
+    """
+    Hand worker results to the controller, write the session profile, API
+    metrics and test durations, check API latency budgets, and generate
+    environment.properties for Allure report.
+    """
+    profiler = session.config.stash.get(profiler_key, None)
+    if hasattr(session.config, "workeroutput"):
+        if profiler is not None:
+            session.config.workeroutput["profile"] = profiler.as_dict()
+        session.config.workeroutput["leaked_accounts"] = session.config.stash.get(
+            leaked_accounts_key, []
+        )
+        session.config.workeroutput["request_pool_stats"] = session.config.stash.get(
+            request_pool_stats_key, {}
+        )
+        session.config.workeroutput["context_pool_stats"] = session.config.stash.get(
+            context_pool_stats_key, {}
+        )
+        session.config.workeroutput["har_misses"] = session.config.stash.get(har_misses_key, [])
+        session.config.workeroutput["api_calls"] = session.config.stash.get(
+            api_metrics_key, APIMetrics()
+        ).as_tuples()
+    else:
+        if profiler is not None:
+            profiler.write(session.config.rootpath / session.config.getoption("--profile"))
+        api_metrics = session.config.stash.get(api_metrics_key, APIMetrics())
+        api_metrics_path = session.config.getoption("--api-metrics")
+        if api_metrics_path:
+            api_metrics.write(session.config.rootpath / api_metrics_path)
+        budget_violations = api_metrics.over_budget(dict(session.config.getoption("--api-latency-budget")))
+        session.config.stash[budget_violations_key] = budget_violations
+        if (
+            budget_violations
+            and session.config.getoption("--api-budget-mode") == "fail"
+            and session.exitstatus == pytest.ExitCode.OK
+        ):
+            session.exitstatus = pytest.ExitCode.TESTS_FAILED
+        scheduler = session.config.stash.get(scheduler_key, None)
+        if scheduler is not None:
+            scheduler.save()
+    
     allure_dir = session.config.getoption("--alluredir")
     if not allure_dir:
         return
@@ -86,7 +520,7 @@ def pytest_sessionfinish(session, exitstatus):
         "OS": platform.system(),
         "Python": sys.version.split()[0],
         "Platform": platform.machine(),
-        "Base URL": "https://automationexercise.com/"
+        "Base URL": URLS.BASE_URL
     }
     
     with open(os.path.join(allure_dir, "environment.properties"), "w") as f:
@@ -99,6 +533,151 @@ def pytest_sessionfinish(session, exitstatus):
         shutil.copy(categories_src, allure_dir)
 
 
+# =============================================================================
+# Browser Context Fixtures
+# =============================================================================
+
+@pytest.fixture(scope="session")
+def auth_state_cache(pytestconfig, tmp_path_factory) -> AuthStateCache | None:
+    """
+    Provide the stored-login cache for the available test user.
+
+    Returns None when disabled with --auth-cache=off.
+    """
+    mode = pytestconfig.getoption("--auth-cache")
+    if mode == "off":
+        return None
+    state_dir = tmp_path_factory.getbasetemp()
+    if mode == "shared" and hasattr(pytestconfig, "workerinput"):
+        # Parent of the worker basetemp is common to all xdist workers of
+        # this run; without xdist it is shared by every run, so keep the
+        # state in the run's own basetemp
+        state_dir = state_dir.parent
+    return AuthStateCache(state_dir, USER_DATA.AVAILABLE_USER, shared=mode == "shared")
+
+
+@pytest.fixture
+def browser_context_args(browser_context_args: dict, browser, request) -> dict:
+    """
+    Seed the context of authenticated tests with the cached login state.
+
+    Tests marked with @pytest.mark.fresh_login keep a clean context and log
+    in through the form instead. Reruns recorded by --record-on-rerun get a
+    video directory, which the session-wide args (built with video off) lack.
+    """
+    context_args = browser_context_args
+    needs_auth = any(name in request.fixturenames for name in AUTHENTICATED_FIXTURES)
+    cache = None
+    if needs_auth and not request.node.get_closest_marker("fresh_login"):
+        cache = request.getfixturevalue("auth_state_cache")
+    if cache is not None:
+        context_args = {**context_args, "storage_state": cache.get(browser, browser_context_args)}
+    
+    if is_recorded_rerun(request.node):
+        context_args = {**context_args, "record_video_dir": str(request.getfixturevalue("tmp_path") / "videos")}
+    return context_args
+
+
+@pytest.fixture(scope="session")
+def browser_context_pool(browser, pytestconfig) -> Generator[BrowserContextPool | None, None, None]:
+    """Provide the worker's pool of warm browser contexts, or None when --context-pool is 0."""
+    size = pytestconfig.getoption("--context-pool")
+    if size <= 0:
+        yield None
+        return
+    pool = BrowserContextPool(browser, size=size)
+    yield pool
+    pool.close()
+    pytestconfig.stash[context_pool_stats_key] = pool.stats
+
+
+@pytest.fixture
+def context(
+    new_context,
+    browser_context_args: dict,
+    browser_context_pool: BrowserContextPool | None,
+    pytestconfig,
+    request
+) -> Generator[BrowserContext, None, None]:
+    """
+    Provide the test's browser context, with request blocking and HAR record/replay.
+    
+    With --context-pool, the context comes from the worker's pool and is
+    reset afterwards; it is recreated after a failure, for HAR recording
+    and for tests marked @pytest.mark.fresh_context. The pool is bypassed
+    while --video or --tracing is on (recorded reruns included): a pooled
+    context would record every test's pages, and pytest-playwright starts
+    tracing only for contexts it creates.
+    
+    Request blocking is enabled for all tests with --block-requests (third-party
+    domains only), or per test with @pytest.mark.block_requests(*resource_types, domains=...).
+    Blocked requests are attached to the Allure report.
+    
+    With --har=record, a passing test's traffic to the site is saved as its
+    archive; with --har=replay, a fresh archive answers those requests
+    instead of the network (see utils/har.py).
+    """
+    har_mode = pytestconfig.getoption("--har")
+    pooled = (
+        browser_context_pool is not None
+        and har_mode != "record"
+        and not request.node.get_closest_marker("fresh_context")
+        # Set per test by --record-on-rerun (see pytest_runtest_setup)
+        and pytestconfig.getoption("--video") == "off"
+        and pytestconfig.getoption("--tracing") == "off"
+    )
+    if pooled:
+        # Same options pytest-playwright's new_context would use
+        args_marker = next(request.node.iter_markers("browser_context_args"), None)
+        context = browser_context_pool.acquire(
+            {**browser_context_args, **(args_marker.kwargs if args_marker else {})}
+        )
+    else:
+        context = new_context()
+    
+    marker = request.node.get_closest_marker("block_requests")
+    blocker = None
+    if marker is not None or pytestconfig.getoption("--block-requests"):
+        blocker = RequestBlocker(
+            domains=marker.kwargs.get("domains", THIRD_PARTY_DOMAINS) if marker else THIRD_PARTY_DOMAINS,
+            resource_types=marker.args if marker else (),
+        )
+        blocker.install(context)
+    
+    archive = HarArchive(pytestconfig.rootpath / pytestconfig.getoption("--har-dir"), request.node.nodeid)
+    if har_mode == "record":
+        recording_path = request.getfixturevalue("tmp_path") / "recording.har"
+        HarArchive.record(context, recording_path, URLS.BASE_URL)
+    elif har_mode == "replay":
+        max_age = timedelta(days=pytestconfig.getoption("--har-max-age"))
+        if archive.is_fresh(URLS.BASE_URL, max_age):
+            archive.replay(context, URLS.BASE_URL, not_found=pytestconfig.getoption("--har-not-found"))
+        else:
+            pytestconfig.stash.setdefault(har_misses_key, []).append(request.node.nodeid)
+    
+    yield context
+    
+    if blocker is not None and blocker.blocked_count:
+        allure.attach(
+            blocker.report(),
+            name="Blocked Requests",
+            attachment_type=allure.attachment_type.TEXT
+        )
+    
+    if har_mode == "record":
+        context.close()  # The recording is written when the context closes
+        report = getattr(request.node, "rep_call", None)
+        if report is not None and report.passed:
+            archive.save(recording_path, URLS.BASE_URL)
+    elif pooled:
+        reports = (getattr(request.node, f"rep_{when}", None) for when in ("setup", "call"))
+        failed = any(report is not None and report.failed for report in reports)
+        # pytest-playwright does not screenshot pooled contexts: capture them here
+        if failed and pytestconfig.getoption("--screenshot") != "off":
+            attach_page_screenshots(list(context.pages), request.getfixturevalue("tmp_path"))
+        browser_context_pool.release(context, reusable=not failed)
+
+
 # =============================================================================
 # Page Object Fixtures
 # =============================================================================
@@ -149,9 +728,17 @@ def payment_page(page: Page) -> PaymentPage:
 # =============================================================================
 
 @pytest.fixture
-def logged_in_user(auth_page: AuthPage) -> AuthPage:
+def logged_in_user(
+    auth_page: AuthPage,
+    auth_state_cache: AuthStateCache | None,
+    request
+) -> AuthPage:
     """
-    Navigate to auth page and log in with available test user.
+    Navigate to auth page with the available test user logged in.
+    
+    The context is pre-seeded from the stored login (see browser_context_args),
+    so the login form is only used when the cache is disabled, the test is
+    marked with @pytest.mark.fresh_login, or the stored session has expired.
     
     Returns:
         AuthPage instance with logged-in state.
@@ -160,7 +747,20 @@ def logged_in_user(auth_page: AuthPage) -> AuthPage:
         Does NOT assert login success - tests own their assertions.
     """
     auth_page.navigate_to_auth_page()
-    auth_page.fill_login_form(USER_DATA.AVAILABLE_USER)
+    if auth_state_cache is None or request.node.get_closest_marker("fresh_login"):
+        auth_page.fill_login_form(USER_DATA.AVAILABLE_USER)
+        return auth_page
+    
+    if not auth_page.user_account_name.is_visible():
+        # Stored session was rejected by the server: log in again and refresh it
+        auth_state_cache.invalidate()
+        auth_page.fill_login_form(USER_DATA.AVAILABLE_USER)
+        try:
+            auth_page.user_account_name.wait_for(state="visible", timeout=RELOGIN_TIMEOUT_MS)
+        except PlaywrightTimeoutError:
+            # Login failed: nothing to store, the test's assertions report it
+            return auth_page
+        auth_state_cache.save(auth_page.page.context)
     return auth_page
 
 
@@ -169,6 +769,9 @@ def registered_user(auth_page: AuthPage, request) -> dict:
     """
     Navigate to signup and fill initial signup form.
     
+    Reserved for tests of the registration UI itself; tests that only need
+    a fresh account should use provisioned_user.
+    
     Usage:
         @pytest.mark.parametrize("registered_user", [USER_DATA.get_new_user], indirect=True)
     
@@ -181,22 +784,167 @@ def registered_user(auth_page: AuthPage, request) -> dict:
     return user_data
 
 
+@pytest.fixture(scope="session")
+def account_pool(pytestconfig) -> AccountPool | None:
+    """Provide the shared account pool, or None when --account-pool is 0."""
+    return pytestconfig.stash.get(account_pool_key, None)
+
+
+@pytest.fixture
+def provisioned_user(
+    page: Page,
+    api_client: APIClient,
+    account_pool: AccountPool | None,
+    account_cleanup_queue: AccountCleanupQueue
+) -> Generator[dict, None, None]:
+    """
+    Provide a fresh account and log the page's context into it.
+    
+    Leases a pre-registered account from the pool when enabled, otherwise
+    creates one via the API. Skips the signup and account information forms
+    entirely; the account is queued for deletion via the API after the test
+    (a no-op if the test deleted it), or handed back to the pool producer.
+    
+    Returns:
+        Form data the account was registered with (includes 'email', 'password', 'name').
+    """
+    form_data = account_pool.lease(ACCOUNT_POOL_LEASE_TIMEOUT) if account_pool else None
+    leased = form_data is not None
+    if not leased:
+        response, form_data = api_client.register_new_user(USER_DATA.get_new_user())
+        if parse_api_response(response).get("responseCode") != 201:
+            raise RuntimeError(f"Account provisioning failed: {response.text()}")
+    
+    login_with_form_post(page.context, form_data)
+    yield form_data
+    
+    if leased:
+        account_pool.release(form_data)
+    else:
+        account_cleanup_queue.enqueue(form_data["email"], form_data["password"])
+
+
 # =============================================================================
 # API Test Fixtures
 # =============================================================================
 
+@pytest.fixture(scope="session")
+def api_request_pool(playwright, pytestconfig) -> Generator[RequestContextPool, None, None]:
+    """Provide the worker's pool of reusable API request contexts."""
+    pool = RequestContextPool(playwright, size=pytestconfig.getoption("--api-pool-size"))
+    yield pool
+    pool.close()
+    pytestconfig.stash[request_pool_stats_key] = pool.stats
+
+
+@pytest.fixture(scope="session")
+def schema_registry() -> SchemaRegistry:
+    """Provide the API response schemas, compiled once per worker."""
+    return SchemaRegistry()
+
+
+@pytest.fixture(scope="session")
+def api_matrix(schema_registry: SchemaRegistry, pytestconfig) -> Generator[APIMatrix, None, None]:
+    """
+    Provide the worker's concurrent runner of API case matrices.
+    
+    Responses are checked against their schemas unless --schema-validation
+    is off; a violation fails its case with "fail", and warns otherwise.
+    The calls are recorded into the session's API metrics.
+    
+    Usage:
+        def test_something(api_matrix):
+            results = api_matrix.run([APICase("Brands", "GET", "/brandsList", 200)])
+    """
+    schema_mode = pytestconfig.getoption("--schema-validation")
+    runner = APIMatrix(
+        schemas=schema_registry if schema_mode != "off" else None,
+        on_violation=schema_mode,
+        metrics=pytestconfig.stash.setdefault(api_metrics_key, APIMetrics()),
+    )
+    yield runner
+    runner.close()
+
+
+@pytest.fixture
+def api_client(
+    api_request_pool: RequestContextPool, schema_registry: SchemaRegistry, pytestconfig, request
+) -> Generator[APIClient, None, None]:
+    """
+    Provide APIClient instance backed by a pooled request context.
+    
+    Tests marked with @pytest.mark.isolated_api_context get a fresh
+    context that is disposed afterwards.
+    
+    The test's API latencies are attached to Allure and added to the
+    session metrics, which are checked against --api-latency-budget at the
+    end of the session. Responses breaking their schema warn or fail the
+    call that got them (--schema-validation).
+    """
+    isolated = request.node.get_closest_marker("isolated_api_context") is not None
+    api_context = api_request_pool.acquire(isolated=isolated)
+    metrics = APIMetrics()
+    schema_mode = pytestconfig.getoption("--schema-validation")
+    yield APIClient(
+        api_context, metrics, schema_registry if schema_mode != "off" else None, on_violation=schema_mode
+    )
+    api_request_pool.release(api_context)
+    
+    if not metrics.calls:
+        return
+    allure.attach(metrics.format_summary(), name="API Latency", attachment_type=allure.attachment_type.TEXT)
+    pytestconfig.stash.setdefault(api_metrics_key, APIMetrics()).extend(metrics)
+    violations = metrics.over_budget(dict(pytestconfig.getoption("--api-latency-budget")))
+    if violations:
+        allure.attach(
+            "\n".join(violations), name="API Latency Budget Exceeded", attachment_type=allure.attachment_type.TEXT
+        )
+
+
+@pytest.fixture(scope="session")
+def catalog_cache(pytestconfig, tmp_path_factory) -> CatalogCache:
+    """Provide the worker's product catalog cache."""
+    cache_dir = None
+    if pytestconfig.getoption("--shared-catalog"):
+        # Parent of the worker basetemp is common to all xdist workers
+        cache_dir = tmp_path_factory.getbasetemp().parent / "catalog"
+    return CatalogCache(ttl=pytestconfig.getoption("--catalog-ttl"), cache_dir=cache_dir)
+
+
 @pytest.fixture
-def api_client(playwright) -> Generator[APIClient, None, None]:
-    """Provide APIClient instance with automatic cleanup."""
-    api_context = playwright.request.new_context()
-    yield APIClient(api_context)
-    api_context.dispose()
+def product_catalog(catalog_cache: CatalogCache, api_client: APIClient) -> ProductCatalog:
+    """
+    Provide the product catalog with indexed lookups.
+    
+    Fetched at most once per TTL; prefer it over calling get_all_products
+    when a test only needs product data, not the endpoint itself.
+    
+    Usage:
+        def test_something(product_catalog):
+            product = product_catalog.by_name("Blue Top")
+    """
+    return catalog_cache.get(api_client)
+
+
+@pytest.fixture(scope="session")
+def account_cleanup_queue(pytestconfig) -> Generator[AccountCleanupQueue, None, None]:
+    """
+    Provide the session-level queue that deletes test accounts in the background.
+    
+    Accounts it fails to delete are listed at the end of the run.
+    """
+    queue = AccountCleanupQueue()
+    yield queue
+    leaked = queue.close()
+    pytestconfig.stash.setdefault(leaked_accounts_key, []).extend(leaked)
 
 
 @pytest.fixture
-def api_account_cleanup(api_client: APIClient) -> Generator[list, None, None]:
+def api_account_cleanup(account_cleanup_queue: AccountCleanupQueue) -> Generator[list, None, None]:
     """
-    Track and cleanup API test accounts after test completion.
+    Track API test accounts and queue them for deletion after the test.
+    
+    Teardown does not wait for the deletion; see account_cleanup_queue.
     
     Usage:
         def test_something(api_client, api_account_cleanup):
@@ -207,10 +955,7 @@ def api_account_cleanup(api_client: APIClient) -> Generator[list, None, None]:
     yield created_accounts
     
     for email, password in created_accounts:
-        try:
-            api_client.delete_account(email, password)
-        except Exception:
-            pass  # Best-effort cleanup
+        account_cleanup_queue.enqueue(email, password)
 
 
 # =============================================================================
@@ -233,35 +978,6 @@ def attach_logs_on_failure(caplog, request):
             )
 
 
-@pytest.fixture(autouse=True)
-def attach_video_on_failure(page: Page, request):
-    """Attach video to Allure report on test failure."""
-    yield
-    
-    # Check if test failed
-    if hasattr(request.node, "rep_call") and request.node.rep_call.failed:
-        try:
-            video = page.video
-            if video:
-                video_path = video.path()
-                # Close video to finalize the file
-                page.context.close()
-                
-                # Wait briefly for file to be written
-                import time
-                time.sleep(0.5)
-                
-                if os.path.exists(video_path):
-                    with open(video_path, "rb") as f:
-                        allure.attach(
-                            f.read(),
-                            name="Failure Video",
-                            attachment_type=allure.attachment_type.WEBM
-                        )
-        except Exception:
-            pass  # Silently fail if video attachment fails
-
-
 # Backward compatibility aliases
 login_user = logged_in_user
 register_user = registered_user
@@ -0,0 +1,223 @@
+"""
+Load-test entry point: replay the scenarios of loadtest/scenarios.py as
+weighted virtual users.
+
+- API users are asyncio tasks sharing one async request context.
+- UI users are threads, each driving its own browser (sync Playwright is
+  bound to the thread that started it), so --ui-users bounds the browsers.
+
+Users start evenly over the ramp-up and repeat weighted scenarios until the
+duration is over. Latency percentiles, throughput and error rates are
+reported per step and per scenario iteration:
+
+    python -m loadtest.runner --local-site --users 20 --ui-users 2 --duration 60 --ramp-up 10
+    python -m loadtest.runner --base-url https://staging.example.com/ --scenario verify_login=3
+"""
+import argparse
+import asyncio
+import json
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
+
+from playwright.async_api import async_playwright
+from playwright.sync_api import sync_playwright
+
+from loadtest.scenarios import API_SCENARIOS, UI_SCENARIOS, Scenario, VirtualUser
+from local_site.server import LocalSite
+from utils.api_metrics import percentile
+from utils.async_api_client import AsyncAPIClient
+from utils.config import configure_base_url
+from utils.constants import URLS
+
+
+# Step name under which whole scenario iterations are recorded
+ITERATION = "(iteration)"
+PERCENTILES = (50, 90, 95, 99)
+
+
+class LoadStats:
+    """Thread-safe latency and error counts per (scenario, step)."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._latencies: dict[tuple[str, str], list[float]] = {}
+        self._errors: dict[tuple[str, str], int] = {}
+
+    def record(self, scenario: str, step: str, latency: float, failed: bool) -> None:
+        key = (scenario, step)
+        with self._lock:
+            self._latencies.setdefault(key, []).append(latency)
+            if failed:
+                self._errors[key] = self._errors.get(key, 0) + 1
+
+    def summary(self, elapsed: float) -> list[dict]:
+        """One row per (scenario, step): count, errors, throughput and latency percentiles in ms."""
+        rows = []
+        with self._lock:
+            for (scenario, step), latencies in sorted(self._latencies.items()):
+                latencies = sorted(latencies)
+                errors = self._errors.get((scenario, step), 0)
+                row = {
+                    "scenario": scenario,
+                    "step": step,
+                    "count": len(latencies),
+                    "errors": errors,
+                    "error_rate": errors / len(latencies),
+                    "per_second": len(latencies) / elapsed,
+                }
+                for pct in PERCENTILES:
+                    row[f"p{pct}_ms"] = percentile(latencies, pct) * 1000
+                row["max_ms"] = latencies[-1] * 1000
+                rows.append(row)
+        return rows
+
+
+def format_summary(rows: list[dict]) -> str:
+    header = f"{'scenario / step':<48} {'count':>7} {'err%':>6} {'req/s':>7}" + "".join(
+        f" {f'p{pct}':>8}" for pct in PERCENTILES
+    ) + f" {'max':>8}"
+    lines = [header, "-" * len(header)]
+    for row in rows:
+        lines.append(
+            f"{row['scenario'] + ' / ' + row['step']:<48} {row['count']:>7} "
+            f"{row['error_rate']:>6.1%} {row['per_second']:>7.2f}"
+            + "".join(f" {row[f'p{pct}_ms']:>8.1f}" for pct in PERCENTILES)
+            + f" {row['max_ms']:>8.1f}"
+        )
+    lines.append("(latencies in ms)")
+    return "\n".join(lines)
+
+
+def pick(scenarios: list[Scenario], rng: random.Random) -> Scenario:
+    return rng.choices(scenarios, weights=[scenario.weight for scenario in scenarios])[0]
+
+
+async def run_api_users(
+    scenarios: list[Scenario], users: int, ramp_up: float, deadline: float, stats: LoadStats
+) -> None:
+    """Run API virtual users as tasks until the deadline."""
+    async with async_playwright() as playwright:
+        request = await playwright.request.new_context()
+        client = AsyncAPIClient(request, max_concurrency=users, report_steps=False)
+
+        async def virtual_user(index: int) -> None:
+            rng = random.Random()
+            await asyncio.sleep(ramp_up * index / users)
+            while time.monotonic() < deadline:
+                scenario = pick(scenarios, rng)
+                user = VirtualUser(stats, scenario.name)
+                try:
+                    with user.step(ITERATION):
+                        await scenario.run(client, user)
+                except Exception:
+                    pass  # Counted as a failed step and iteration
+
+        await asyncio.gather(*(virtual_user(index) for index in range(users)))
+        await request.dispose()
+
+
+def run_ui_user(
+    index: int, scenarios: list[Scenario], users: int, ramp_up: float, deadline: float,
+    stats: LoadStats, browser_name: str,
+) -> None:
+    """Run one UI virtual user, with its own browser, until the deadline."""
+    rng = random.Random()
+    time.sleep(ramp_up * index / users)
+    with sync_playwright() as playwright:
+        browser = getattr(playwright, browser_name).launch()
+        while time.monotonic() < deadline:
+            scenario = pick(scenarios, rng)
+            user = VirtualUser(stats, scenario.name)
+            context = browser.new_context()
+            try:
+                with user.step(ITERATION):
+                    scenario.run(context, user)
+            except Exception:
+                pass  # Counted as a failed step and iteration
+            finally:
+                context.close()
+        browser.close()
+
+
+def select_scenarios(available: tuple[Scenario, ...], selection: dict[str, int]) -> list[Scenario]:
+    """Scenarios named in selection (with their weights there), or all when nothing is selected."""
+    if not selection:
+        return list(available)
+    return [
+        Scenario(scenario.name, selection[scenario.name] or scenario.weight, scenario.run)
+        for scenario in available
+        if scenario.name in selection
+    ]
+
+
+def parse_scenario(value: str) -> tuple[str, int]:
+    name, _, weight = value.partition("=")
+    known = {scenario.name for scenario in API_SCENARIOS + UI_SCENARIOS}
+    if name not in known:
+        raise argparse.ArgumentTypeError(f"unknown scenario {name!r}, choose from {', '.join(sorted(known))}")
+    return name, int(weight) if weight else 0
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Load test with weighted virtual-user scenarios")
+    parser.add_argument("--users", type=int, default=10, help="Concurrent API users")
+    parser.add_argument("--ui-users", type=int, default=0, help="Concurrent UI users, one browser each")
+    parser.add_argument("--duration", type=float, default=30, help="Seconds from the first user starting")
+    parser.add_argument("--ramp-up", type=float, default=5, help="Seconds over which users start")
+    parser.add_argument(
+        "--scenario",
+        type=parse_scenario,
+        action="append",
+        default=[],
+        metavar="NAME[=WEIGHT]",
+        help="Run only the given scenarios, optionally reweighted (repeatable)",
+    )
+    parser.add_argument("--browser", default="chromium", choices=("chromium", "firefox", "webkit"))
+    parser.add_argument("--base-url", help="Deployment of the site to load")
+    parser.add_argument("--local-site", action="store_true", help="Load a local stand-in of the site")
+    parser.add_argument("--json", help="Also write the summary rows to this file")
+    args = parser.parse_args()
+
+    selection = dict(args.scenario)
+    api_scenarios = select_scenarios(API_SCENARIOS, selection)
+    ui_scenarios = select_scenarios(UI_SCENARIOS, selection)
+    if selection and not api_scenarios:
+        args.users = 0
+    if selection and not ui_scenarios:
+        args.ui_users = 0
+
+    with LocalSite() if args.local_site else nullcontext() as site:
+        if site is not None:
+            configure_base_url(site.url)
+        elif args.base_url:
+            configure_base_url(args.base_url)
+        print(f"Loading {URLS.BASE_URL} with {args.users} API and {args.ui_users} UI users for {args.duration:g}s")
+
+        stats = LoadStats()
+        started = time.monotonic()
+        deadline = started + args.duration
+        with ThreadPoolExecutor(max_workers=max(args.ui_users, 1)) as executor:
+            ui_users = [
+                executor.submit(
+                    run_ui_user, index, ui_scenarios, args.ui_users, args.ramp_up, deadline, stats, args.browser
+                )
+                for index in range(args.ui_users)
+            ]
+            if args.users:
+                asyncio.run(run_api_users(api_scenarios, args.users, args.ramp_up, deadline, stats))
+            for future in ui_users:
+                future.result()
+        elapsed = time.monotonic() - started
+
+    rows = stats.summary(elapsed)
+    print(format_summary(rows))
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump({"elapsed": elapsed, "users": args.users, "ui_users": args.ui_users, "rows": rows}, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,144 @@
+"""
+Virtual-user scenarios for the load test.
+
+Each scenario replays a flow the functional tests already cover, built
+from the same clients and page objects, and times its steps through the
+VirtualUser it is given:
+
+- API scenarios are coroutines driving a shared AsyncAPIClient.
+- UI scenarios are synchronous and get a fresh browser context per iteration.
+
+A step fails when it raises; API steps also fail on an unexpected
+responseCode.
+"""
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Callable
+
+from pages.cart_page import CartPage
+from pages.checkout_page import CheckoutPage
+from pages.payment_page import PaymentPage
+from pages.products_page import ProductsPage
+from utils.async_api_client import AsyncAPIClient
+from utils.auth_state import login_with_form_post
+from utils.constants import PAYMENT_DATA, USER_DATA
+from utils.helper import parse_async_api_response
+
+
+class ScenarioError(Exception):
+    """A step got a response other than the one the flow expects."""
+
+
+class VirtualUser:
+    """Times the steps of one scenario iteration into the run's statistics."""
+
+    def __init__(self, stats, scenario: str):
+        """
+        Args:
+            stats: LoadStats collecting the timings.
+            scenario: Name of the scenario being run.
+        """
+        self.stats = stats
+        self.scenario = scenario
+
+    @contextmanager
+    def step(self, name: str):
+        """Time the enclosed block as a step; an exception marks it failed and propagates."""
+        started = time.perf_counter()
+        try:
+            yield
+        except Exception:
+            self.stats.record(self.scenario, name, time.perf_counter() - started, failed=True)
+            raise
+        self.stats.record(self.scenario, name, time.perf_counter() - started, failed=False)
+
+
+@dataclass(frozen=True)
+class Scenario:
+    """A weighted flow; virtual users pick scenarios in proportion to their weights."""
+    name: str
+    weight: int
+    run: Callable
+
+
+async def expect_response_code(response, expected: int) -> None:
+    body = await parse_async_api_response(response)
+    if body.get("responseCode") != expected:
+        raise ScenarioError(f"Expected responseCode {expected}, got {body}")
+
+
+# =============================================================================
+# API scenarios
+# =============================================================================
+
+async def browse_products(client: AsyncAPIClient, user: VirtualUser) -> None:
+    with user.step("GET /productsList"):
+        await expect_response_code(await client.get_all_products(), 200)
+
+
+async def verify_login(client: AsyncAPIClient, user: VirtualUser) -> None:
+    with user.step("POST /verifyLogin"):
+        await expect_response_code(await client.verify_login(USER_DATA.AVAILABLE_USER), 200)
+
+
+async def account_lifecycle(client: AsyncAPIClient, user: VirtualUser) -> None:
+    with user.step("POST /createAccount"):
+        response, form_data = await client.register_new_user(USER_DATA.get_new_user())
+        await expect_response_code(response, 201)
+    with user.step("GET /getUserDetailByEmail"):
+        await expect_response_code(await client.get_user_details_by_email(form_data["email"]), 200)
+    with user.step("DELETE /deleteAccount"):
+        response = await client.delete_account(form_data["email"], form_data["password"])
+        await expect_response_code(response, 200)
+
+
+API_SCENARIOS = (
+    Scenario("browse_products", 5, browse_products),
+    Scenario("verify_login", 3, verify_login),
+    Scenario("account_lifecycle", 1, account_lifecycle),
+)
+
+
+# =============================================================================
+# UI scenarios
+# =============================================================================
+
+def search_products(context, user: VirtualUser) -> None:
+    products_page = ProductsPage(context.new_page())
+    with user.step("Open products page"):
+        products_page.navigate()
+    with user.step("Search products"):
+        products_page.search_product("top")
+        products_page.searched_products_header.wait_for()
+
+
+def checkout(context, user: VirtualUser) -> None:
+    """The flow of test_place_order_login_before_checkout."""
+    with user.step("Log in"):
+        login_with_form_post(context, USER_DATA.AVAILABLE_USER)
+    page = context.new_page()
+    products_page = ProductsPage(page)
+    cart_page = CartPage(page)
+    checkout_page = CheckoutPage(page)
+    payment_page = PaymentPage(page)
+    with user.step("Add product to cart"):
+        products_page.navigate()
+        products_page.add_product_to_cart()
+        products_page.click_view_cart()
+        cart_page.product_items.first.wait_for()
+    with user.step("Place order"):
+        cart_page.click_checkout()
+        checkout_page.delivery_address.wait_for()
+        checkout_page.enter_comment("Load test order")
+        checkout_page.click_place_order()
+    with user.step("Pay"):
+        payment_page.enter_payment_details(PAYMENT_DATA.DEFAULT)
+        payment_page.click_pay_and_confirm()
+        payment_page.order_placed_container.wait_for()
+
+
+UI_SCENARIOS = (
+    Scenario("search_products", 3, search_products),
+    Scenario("checkout", 1, checkout),
+)
@@ -0,0 +1,603 @@
+"""
+Local stand-in for automationexercise.com.
+
+Serves trimmed copies of the site's pages (only the markup the page objects
+and locators rely on) and the /api endpoints used by APIClient, backed by
+in-memory accounts, sessions and carts. Lets the suite run hermetically at
+loopback speed:
+
+    pytest --local-site
+    python -m local_site.server --port 8000   # standalone, e.g. for the perf lab
+"""
+import argparse
+import html
+import itertools
+import json
+import secrets
+import threading
+from http import cookies
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from string import Template
+from urllib.parse import parse_qs, urlsplit
+
+from utils.constants import ADDRESS_DATA, USER_DATA
+
+
+TEMPLATES_DIR = Path(__file__).parent / "templates"
+
+SESSION_COOKIE = "sessionid"
+
+MONTHS = [
+    "January", "February", "March", "April", "May", "June",
+    "July", "August", "September", "October", "November", "December",
+]
+COUNTRIES = ["India", "United States", "Canada", "Australia", "Israel", "New Zealand", "Singapore"]
+
+WOMEN, MEN, KIDS = ({"usertype": name} for name in ("Women", "Men", "Kids"))
+
+# Subset of the live catalog, same shape as /api/productsList
+PRODUCTS = [
+    {"id": 1, "name": "Blue Top", "price": "Rs. 500", "brand": "Polo",
+     "category": {"usertype": WOMEN, "category": "Tops"}},
+    {"id": 2, "name": "Men Tshirt", "price": "Rs. 400", "brand": "H&M",
+     "category": {"usertype": MEN, "category": "Tshirts"}},
+    {"id": 3, "name": "Sleeveless Dress", "price": "Rs. 1000", "brand": "Madame",
+     "category": {"usertype": WOMEN, "category": "Dress"}},
+    {"id": 4, "name": "Stylish Dress", "price": "Rs. 1500", "brand": "Madame",
+     "category": {"usertype": WOMEN, "category": "Dress"}},
+    {"id": 5, "name": "Winter Top", "price": "Rs. 600", "brand": "Mast & Harbour",
+     "category": {"usertype": WOMEN, "category": "Tops"}},
+    {"id": 6, "name": "Summer White Top", "price": "Rs. 400", "brand": "H&M",
+     "category": {"usertype": WOMEN, "category": "Tops"}},
+    {"id": 7, "name": "Madame Top For Women", "price": "Rs. 1000", "brand": "Madame",
+     "category": {"usertype": WOMEN, "category": "Tops"}},
+    {"id": 8, "name": "Fancy Green Top", "price": "Rs. 700", "brand": "Polo",
+     "category": {"usertype": WOMEN, "category": "Tops"}},
+    {"id": 11, "name": "Little Girls Mr. Panda Shirt", "price": "Rs. 543", "brand": "Allen Solly Junior",
+     "category": {"usertype": KIDS, "category": "Tops & Shirts"}},
+    {"id": 12, "name": "Sleeveless Unicorn Patch Gown - Pink", "price": "Rs. 1050", "brand": "Kookie Kids",
+     "category": {"usertype": KIDS, "category": "Dress"}},
+    {"id": 28, "name": "Pure Cotton V-Neck T-Shirt", "price": "Rs. 1299", "brand": "Biba",
+     "category": {"usertype": MEN, "category": "Tshirts"}},
+    {"id": 33, "name": "Soft Stretch Jeans", "price": "Rs. 799", "brand": "Babyhug",
+     "category": {"usertype": MEN, "category": "Jeans"}},
+    {"id": 43, "name": "GRAPHIC DESIGN MEN T SHIRT - BLUE", "price": "Rs. 1389", "brand": "Mast & Harbour",
+     "category": {"usertype": MEN, "category": "Tshirts"}},
+]
+PRODUCTS_BY_ID = {product["id"]: product for product in PRODUCTS}
+BRANDS = [
+    {"id": index, "brand": brand}
+    for index, brand in enumerate(dict.fromkeys(product["brand"] for product in PRODUCTS), start=1)
+]
+
+# /api/createAccount form fields, in the order the live API reports missing ones
+ACCOUNT_FIELDS = [
+    "name", "email", "password", "title", "birth_date", "birth_month", "birth_year",
+    "firstname", "lastname", "company", "address1", "address2", "country",
+    "zipcode", "state", "city", "mobile_number",
+]
+
+
+def _load_templates() -> dict[str, Template]:
+    return {path.stem: Template(path.read_text()) for path in TEMPLATES_DIR.glob("*.html")}
+
+
+def _options(values, selected: str = "") -> str:
+    return "".join(
+        f'<option value="{value}"{" selected" if value == selected else ""}>{label}</option>'
+        for value, label in values
+    )
+
+
+def _price(product: dict) -> int:
+    return int(product["price"].removeprefix("Rs. "))
+
+
+class SiteState:
+    """In-memory accounts, sessions and carts, safe to share between request threads."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.accounts: dict[str, dict] = {}
+        self.sessions: dict[str, dict] = {}
+        self._account_ids = itertools.count(1)
+        self.seed_account(USER_DATA.AVAILABLE_USER)
+
+    def add_account(self, account: dict) -> None:
+        """Register an account (ACCOUNT_FIELDS) under the next id, which it keeps until deleted."""
+        self.accounts[account["email"]] = {"id": next(self._account_ids), **account}
+
+    def seed_account(self, user_data: dict) -> None:
+        """Register a UI-style user (USER_DATA shape) with the default address."""
+        address = ADDRESS_DATA.DEFAULT
+        self.add_account({
+            "name": user_data["name"],
+            "email": user_data["email"],
+            "password": user_data["password"],
+            "title": "Mr",
+            "birth_date": user_data["day"],
+            "birth_month": user_data["month"],
+            "birth_year": user_data["year"],
+            "firstname": address["first_name"],
+            "lastname": address["last_name"],
+            "company": address["company"],
+            "address1": address["address"],
+            "address2": address["address2"],
+            "country": address["country"],
+            "zipcode": address["zipcode"],
+            "state": address["state"],
+            "city": address["city"],
+            "mobile_number": address["phone"],
+        })
+
+    def session(self, session_id: str) -> dict:
+        return self.sessions.setdefault(session_id, {"email": None, "cart": {}})
+
+    def authenticate(self, email: str, password: str) -> dict | None:
+        account = self.accounts.get(email)
+        if account is None or account["password"] != password:
+            return None
+        return account
+
+
+class SiteRequestHandler(BaseHTTPRequestHandler):
+    """Routes page and /api requests of the stand-in site."""
+
+    server: "LocalSiteServer"
+    protocol_version = "HTTP/1.1"
+    # Headers and body go out as separate writes; with Nagle on, the body
+    # waits for the client's delayed ACK (~40 ms) on a kept-alive connection
+    disable_nagle_algorithm = True
+
+    # ------------------------------------------------------------------ plumbing
+
+    def log_message(self, format, *args) -> None:
+        pass  # Keep pytest output clean; one line per request would drown it
+
+    def do_GET(self) -> None:
+        self._dispatch("GET")
+
+    def do_POST(self) -> None:
+        self._dispatch("POST")
+
+    def do_PUT(self) -> None:
+        self._dispatch("PUT")
+
+    def do_DELETE(self) -> None:
+        self._dispatch("DELETE")
+
+    def _dispatch(self, method: str) -> None:
+        url = urlsplit(self.path)
+        self.query = {key: values[0] for key, values in parse_qs(url.query).items()}
+        self.form = self._read_form()
+        self._load_session()
+        path = url.path.rstrip("/") or "/"
+
+        if path.startswith("/api/"):
+            handler = getattr(self, "api_" + path.removeprefix("/api/"), None)
+            if handler is None:
+                return self._send(404, "Not Found", "text/plain")
+            with self.state.lock:
+                body = handler(method)
+            self.new_session = False  # The API is stateless: no session cookie
+            return self._send(200, json.dumps(body), "application/json")
+
+        name, _, arg = path.strip("/").partition("/")
+        handler = getattr(self, f"page_{method.lower()}_{name or 'home'}", None)
+        # Only pages with a positional parameter (a product id...) take a path
+        # argument; HTML fragments such as login_error are keyword-only
+        if handler is None or (arg and handler.__code__.co_argcount < 2):
+            return self._send(404, "Not Found", "text/plain")
+        with self.state.lock:
+            handler(arg) if arg else handler()
+
+    def _read_form(self) -> dict[str, str]:
+        length = int(self.headers.get("Content-Length") or 0)
+        if not length:
+            return {}
+        body = self.rfile.read(length)
+        if not self.headers.get("Content-Type", "").startswith("application/x-www-form-urlencoded"):
+            return {}  # Multipart uploads (contact form) are accepted but not inspected
+        return {key: values[0] for key, values in parse_qs(body.decode()).items()}
+
+    def _load_session(self) -> None:
+        jar = cookies.SimpleCookie(self.headers.get("Cookie", ""))
+        morsel = jar.get(SESSION_COOKIE)
+        self.new_session = morsel is None
+        self.session_id = morsel.value if morsel else secrets.token_hex(16)
+
+    @property
+    def state(self) -> SiteState:
+        return self.server.state
+
+    @property
+    def session(self) -> dict:
+        return self.state.session(self.session_id)
+
+    @property
+    def user(self) -> dict | None:
+        return self.state.accounts.get(self.session["email"])
+
+    def _send(self, status: int, body: str, content_type: str, headers: dict = None) -> None:
+        payload = body.encode()
+        self.send_response(status)
+        self.send_header("Content-Type", f"{content_type}; charset=utf-8")
+        self.send_header("Content-Length", str(len(payload)))
+        if self.new_session:
+            self.send_header("Set-Cookie", f"{SESSION_COOKIE}={self.session_id}; Path=/; HttpOnly")
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        if self.command != "HEAD":
+            self.wfile.write(payload)
+
+    def _redirect(self, location: str) -> None:
+        self._send(302, "", "text/html", {"Location": location})
+
+    def _render(self, template: str, title: str = "Automation Exercise", **values) -> None:
+        templates = self.server.templates
+        content = templates[template].substitute(csrf_token=secrets.token_hex(16), **values)
+        user = self.user
+        if user:
+            account_links = (
+                '<li><a href="/logout"><i class="fa fa-lock"></i> Logout</a></li>'
+                '<li><a href="/delete_account"><i class="fa fa-trash-o"></i> Delete Account</a></li>'
+                f'<li><a><i class="fa fa-user"></i> Logged in as <b>{html.escape(user["name"])}</b></a></li>'
+            )
+        else:
+            account_links = '<li><a href="/login"><i class="fa fa-lock"></i> Signup / Login</a></li>'
+        document = templates["layout"].substitute(title=title, account_links=account_links, content=content)
+        self._send(200, document, "text/html")
+
+    def _message(self, qa: str, heading: str, message: str) -> None:
+        self._render("message", title=f"Automation Exercise - {heading}", qa=qa, heading=heading, message=message)
+
+    def _cart_rows(self) -> str:
+        rows = []
+        for product_id, quantity in self.session["cart"].items():
+            product = PRODUCTS_BY_ID[product_id]
+            rows.append(self.server.templates["cart_row"].substitute(
+                id=product_id,
+                name=product["name"],
+                category=f'{product["category"]["usertype"]["usertype"]} > {product["category"]["category"]}',
+                price=product["price"],
+                quantity=quantity,
+                total=f"Rs. {_price(product) * quantity}",
+            ))
+        return "".join(rows)
+
+    # ------------------------------------------------------------------- pages
+
+    def page_get_home(self) -> None:
+        self._render("home")
+
+    def page_get_test_cases(self) -> None:
+        self._render("test_cases", title="Automation Practice Website for UI Testing - Test Cases")
+
+    def page_get_login(self, *, login_error: str = "", signup_error: str = "") -> None:
+        self._render(
+            "login",
+            title="Automation Exercise - Signup / Login",
+            login_error=login_error,
+            signup_error=signup_error,
+        )
+
+    def page_post_login(self) -> None:
+        account = self.state.authenticate(self.form.get("email", ""), self.form.get("password", ""))
+        if account is None:
+            return self.page_get_login(
+                login_error='<p style="color: red;">Your email or password is incorrect!</p>'
+            )
+        self.session["email"] = account["email"]
+        self._redirect("/")
+
+    def page_get_logout(self) -> None:
+        self.session["email"] = None
+        self._redirect("/login")
+
+    def page_post_signup(self) -> None:
+        if self.form.get("form_type") == "create_account":
+            return self._create_account()
+        name, email = self.form.get("name", ""), self.form.get("email", "")
+        if email in self.state.accounts:
+            return self.page_get_login(signup_error='<p style="color: red;">Email Address already exist!</p>')
+        self._render(
+            "signup",
+            title="Automation Exercise - Signup",
+            name=html.escape(name),
+            email=html.escape(email),
+            day_options=_options([("", "Day")] + [(str(day), str(day)) for day in range(1, 32)]),
+            month_options=_options([("", "Month")] + [(str(i), m) for i, m in enumerate(MONTHS, 1)]),
+            year_options=_options([("", "Year")] + [(str(year), str(year)) for year in range(2021, 1899, -1)]),
+            country_options=_options([(country, country) for country in COUNTRIES]),
+        )
+
+    def _create_account(self) -> None:
+        form = self.form
+        email = form.get("email_address", "")
+        if email in self.state.accounts:
+            return self.page_get_login(signup_error='<p style="color: red;">Email Address already exist!</p>')
+        self.state.add_account({
+            "name": form.get("name", ""),
+            "email": email,
+            "password": form.get("password", ""),
+            "title": form.get("title", ""),
+            "birth_date": form.get("days", ""),
+            "birth_month": MONTHS[int(form["months"]) - 1] if form.get("months") else "",
+            "birth_year": form.get("years", ""),
+            "firstname": form.get("first_name", ""),
+            "lastname": form.get("last_name", ""),
+            "company": form.get("company", ""),
+            "address1": form.get("address1", ""),
+            "address2": form.get("address2", ""),
+            "country": form.get("country", ""),
+            "zipcode": form.get("zipcode", ""),
+            "state": form.get("state", ""),
+            "city": form.get("city", ""),
+            "mobile_number": form.get("mobile_number", ""),
+        })
+        self.session["email"] = email
+        self._redirect("/account_created")
+
+    def page_get_account_created(self) -> None:
+        self._message(
+            "account-created",
+            "Account Created!",
+            "Congratulations! Your new account has been successfully created!",
+        )
+
+    def page_get_delete_account(self) -> None:
+        if self.user:
+            del self.state.accounts[self.user["email"]]
+        self.session["email"] = None
+        self._message("account-deleted", "Account Deleted!", "Your account has been permanently deleted!")
+
+    def page_get_products(self) -> None:
+        search = self.query.get("search", "").strip().lower()
+        products = [product for product in PRODUCTS if search in product["name"].lower()]
+        card = self.server.templates["product_card"]
+        self._render(
+            "products",
+            title="Automation Exercise - All Products",
+            heading="Searched Products" if search else "All Products",
+            products="".join(card.substitute(product) for product in products),
+        )
+
+    def page_get_product_details(self, product_id: str) -> None:
+        product = PRODUCTS_BY_ID.get(int(product_id)) if product_id.isdigit() else None
+        if product is None:
+            return self._send(404, "Not Found", "text/plain")
+        self._render(
+            "product_details",
+            title="Automation Exercise - Product Details",
+            name=product["name"],
+            price=product["price"],
+            brand=product["brand"],
+            category=f'{product["category"]["usertype"]["usertype"]} > {product["category"]["category"]}',
+        )
+
+    def page_get_add_to_cart(self, product_id: str) -> None:
+        if not product_id.isdigit() or int(product_id) not in PRODUCTS_BY_ID:
+            return self._send(404, "Not Found", "text/plain")
+        cart = self.session["cart"]
+        cart[int(product_id)] = cart.get(int(product_id), 0) + 1
+        self._send(200, "Added", "text/plain")
+
+    def page_get_delete_cart(self, product_id: str) -> None:
+        self.session["cart"].pop(int(product_id) if product_id.isdigit() else None, None)
+        self._redirect("/view_cart")
+
+    def page_get_view_cart(self) -> None:
+        if self.user:
+            checkout_button = '<a class="btn btn-default check_out" href="/checkout">Proceed To Checkout</a>'
+        else:
+            checkout_button = (
+                '<a class="btn btn-default check_out" '
+                "onclick=\"document.getElementById('checkoutModal').classList.add('show')\">"
+                "Proceed To Checkout</a>"
+            )
+        self._render(
+            "cart",
+            title="Automation Exercise - Checkout",
+            rows=self._cart_rows(),
+            checkout_button=checkout_button,
+        )
+
+    def page_get_checkout(self) -> None:
+        user = self.user
+        if user is None:
+            return self._redirect("/view_cart")
+        address = "".join(f'<li class="address_{css}">{value}</li>' for css, value in (
+            ("firstname address_lastname", f'{user["title"]}. {user["firstname"]} {user["lastname"]}'),
+            ("address1 address_address2", user["company"]),
+            ("address1 address_address2", user["address1"]),
+            ("address1 address_address2", user["address2"]),
+            ("city address_state_name address_postcode", f'{user["city"]} {user["state"]} {user["zipcode"]}'),
+            ("country_name", user["country"]),
+            ("phone", user["mobile_number"]),
+        ))
+        self._render("checkout", title="Automation Exercise - Checkout", address=address, rows=self._cart_rows())
+
+    def page_get_payment(self) -> None:
+        if self.user is None:
+            return self._redirect("/login")
+        self._render("payment", title="Automation Exercise - Payment")
+
+    def page_post_payment(self) -> None:
+        cart = self.session["cart"]
+        amount = sum(_price(PRODUCTS_BY_ID[pid]) * quantity for pid, quantity in cart.items())
+        cart.clear()
+        self._redirect(f"/payment_done/{amount}")
+
+    def page_get_payment_done(self, amount: str = "0") -> None:
+        self._render("payment_done", title="Automation Exercise - Order Placed", amount=html.escape(amount))
+
+    def page_get_contact_us(self, *, status: str = "") -> None:
+        self._render("contact_us", title="Automation Exercise - Contact Us", status=status)
+
+    def page_post_contact_us(self) -> None:
+        self.page_get_contact_us(
+            status='<div class="status alert alert-success">'
+                   "Success! Your details have been submitted successfully.</div>"
+        )
+
+    # ---------------------------------------------------------------------- api
+
+    @staticmethod
+    def _not_supported() -> dict:
+        return {"responseCode": 405, "message": "This request method is not supported."}
+
+    def api_productsList(self, method: str) -> dict:
+        if method != "GET":
+            return self._not_supported()
+        return {"responseCode": 200, "products": PRODUCTS}
+
+    def api_brandsList(self, method: str) -> dict:
+        if method != "GET":
+            return self._not_supported()
+        return {"responseCode": 200, "brands": BRANDS}
+
+    def api_searchProduct(self, method: str) -> dict:
+        if method != "POST":
+            return self._not_supported()
+        term = self.form.get("search_product", "").lower()
+        if not term:
+            return {
+                "responseCode": 400,
+                "message": "Bad request, search_product parameter is missing in POST request.",
+            }
+        products = [
+            product for product in PRODUCTS
+            if term in product["name"].lower() or term in product["category"]["category"].lower()
+        ]
+        return {"responseCode": 200, "products": products}
+
+    def api_createAccount(self, method: str) -> dict:
+        if method != "POST":
+            return self._not_supported()
+        missing = next((field for field in ACCOUNT_FIELDS if not self.form.get(field)), None)
+        if missing in ("name", "email", "password"):
+            return {
+                "responseCode": 400,
+                "message": f"Bad request, {missing} parameter is missing in POST request.",
+            }
+        if self.form["email"] in self.state.accounts:
+            return {"responseCode": 400, "message": "Email already exists!"}
+        self.state.add_account({field: self.form.get(field, "") for field in ACCOUNT_FIELDS})
+        return {"responseCode": 201, "message": "User created!"}
+
+    def api_updateAccount(self, method: str) -> dict:
+        if method != "PUT":
+            return self._not_supported()
+        if not self.form.get("email") or not self.form.get("password"):
+            return {
+                "responseCode": 400,
+                "message": "Bad request, email or password parameter is missing in PUT request.",
+            }
+        account = self.state.authenticate(self.form["email"], self.form["password"])
+        if account is None:
+            return {"responseCode": 404, "message": "Account not found!"}
+        account.update({field: self.form[field] for field in ACCOUNT_FIELDS if self.form.get(field)})
+        return {"responseCode": 200, "message": "User updated!"}
+
+    def api_verifyLogin(self, method: str) -> dict:
+        if method != "POST":
+            return self._not_supported()
+        if not self.form.get("email") or not self.form.get("password"):
+            return {
+                "responseCode": 400,
+                "message": "Bad request, email or password parameter is missing in POST request.",
+            }
+        if self.state.authenticate(self.form["email"], self.form["password"]) is None:
+            return {"responseCode": 404, "message": "User not found!"}
+        return {"responseCode": 200, "message": "User exists!"}
+
+    def api_deleteAccount(self, method: str) -> dict:
+        if method != "DELETE":
+            return self._not_supported()
+        account = self.state.authenticate(self.form.get("email", ""), self.form.get("password", ""))
+        if account is None:
+            return {"responseCode": 404, "message": "Account not found!"}
+        del self.state.accounts[account["email"]]
+        return {"responseCode": 200, "message": "Account deleted!"}
+
+    def api_getUserDetailByEmail(self, method: str) -> dict:
+        if method != "GET":
+            return self._not_supported()
+        email = self.query.get("email")
+        if not email:
+            return {
+                "responseCode": 400,
+                "message": "Bad request, email parameter is missing in GET request.",
+            }
+        account = self.state.accounts.get(email)
+        if account is None:
+            return {"responseCode": 404, "message": "Account not found with this email, try another email!"}
+        user = {key: value for key, value in account.items() if key != "password"}
+        user["first_name"], user["last_name"] = user.pop("firstname"), user.pop("lastname")
+        user["birth_day"] = user.pop("birth_date")
+        return {"responseCode": 200, "user": user}
+
+
+class LocalSiteServer(ThreadingHTTPServer):
+    """Threaded HTTP server holding the stand-in site's state."""
+
+    daemon_threads = True
+
+    def __init__(self, address: tuple[str, int]):
+        super().__init__(address, SiteRequestHandler)
+        self.state = SiteState()
+        self.templates = _load_templates()
+
+
+class LocalSite:
+    """
+    Run the stand-in site on a background thread.
+
+    Usage:
+        with LocalSite() as site:
+            URLS.rebase(site.url)
+    """
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0):
+        self.server = LocalSiteServer((host, port))
+        self._thread = threading.Thread(target=self.server.serve_forever, name="local-site", daemon=True)
+
+    @property
+    def url(self) -> str:
+        host, port = self.server.server_address[:2]
+        return f"http://{host}:{port}/"
+
+    def start(self) -> "LocalSite":
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self.server.shutdown()
+        self.server.server_close()
+
+    def __enter__(self) -> "LocalSite":
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Local stand-in for automationexercise.com")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    args = parser.parse_args()
+    server = LocalSiteServer((args.host, args.port))
+    print(f"Serving on http://{args.host}:{args.port}/")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -21,6 +21,8 @@ class AuthPageLocators:
     SIGNUP_EMAIL_INPUT = "[data-qa='signup-email']"
     SIGNUP_BTN = "[data-qa='signup-button']"
     INCORRECT_CREDENTIALS_ERROR = "form[action='/login'] p"
+    EXISTING_EMAIL_ERROR = "text=Email Address already exist!"
+    ACCOUNT_INFO_HEADER = "text=Enter Account Information"
     DELETE_ACCOUNT_BTN = "a[href='/delete_account']"
     ACCOUNT_DELETED_TEXT = "[data-qa='account-deleted']"
     ACCOUNT_DELETED_CONTINUE = "[data-qa='continue-button']"
@@ -72,6 +74,7 @@ class ProductsPageLocators:
     CONTINUE_SHOPPING_BTN = ".modal-footer button.btn-success"
 
 class CartPageLocators:
+    CART_INFO = "#cart_info"
     PRODUCTS_LIST = "tbody"
     PRODUCT_ITEMS = "tr"
     PRODUCT_NAME = "td.cart_description h4 a"
@@ -1,45 +1,43 @@
-from playwright.sync_api import Page
 import allure
 
-from pages.base_page import BasePage
-from utils.constants import URLS
+from pages.base_page import BasePage, LazyLocator
 from locators.locators import AuthPageLocators, CommonLocators
 
 
 class AuthPage(BasePage):
     """Page object for /login page handling login and signup forms."""
     
-    URL = URLS.BASE_URL + "login"
+    PATH = "login"
+    READY_LOCATOR = AuthPageLocators.LOGIN_FORM
+    __slots__ = ()
 
-    def __init__(self, page: Page):
-        super().__init__(page)
-        # Login form
-        self.login_form = page.locator(AuthPageLocators.LOGIN_FORM)
-        self.login_email_input = page.locator(AuthPageLocators.LOGIN_EMAIL_INPUT)
-        self.login_password_input = page.locator(AuthPageLocators.LOGIN_PASSWORD_INPUT)
-        self.login_btn = page.locator(AuthPageLocators.LOGIN_BTN)
-        
-        # Signup form
-        self.signup_form = page.locator(AuthPageLocators.SIGNUP_FORM)
-        self.signup_name_input = page.locator(AuthPageLocators.SIGNUP_NAME_INPUT)
-        self.signup_email_input = page.locator(AuthPageLocators.SIGNUP_EMAIL_INPUT)
-        self.signup_btn = page.locator(AuthPageLocators.SIGNUP_BTN)
-        
-        # Shared elements
-        self.user_account_name = page.locator(CommonLocators.USER_ACCOUNT_NAME)
-        self.logout_btn = page.locator(CommonLocators.LOGOUT_BTN)
-        
-        # Error messages
-        self.incorrect_credentials_error = page.locator(AuthPageLocators.INCORRECT_CREDENTIALS_ERROR)
-        self.existing_email_error = page.get_by_text("Email Address already exist!")
-        
-        # Account management
-        self.delete_account_btn = page.locator(AuthPageLocators.DELETE_ACCOUNT_BTN)
-        self.account_deleted_text = page.locator(AuthPageLocators.ACCOUNT_DELETED_TEXT)
-        self.account_deleted_continue = page.locator(AuthPageLocators.ACCOUNT_DELETED_CONTINUE)
-        
-        # Registration flow
-        self.account_info_header = page.get_by_text("Enter Account Information")
+    # Login form
+    login_form = LazyLocator(AuthPageLocators.LOGIN_FORM)
+    login_email_input = LazyLocator(AuthPageLocators.LOGIN_EMAIL_INPUT)
+    login_password_input = LazyLocator(AuthPageLocators.LOGIN_PASSWORD_INPUT)
+    login_btn = LazyLocator(AuthPageLocators.LOGIN_BTN)
+
+    # Signup form
+    signup_form = LazyLocator(AuthPageLocators.SIGNUP_FORM)
+    signup_name_input = LazyLocator(AuthPageLocators.SIGNUP_NAME_INPUT)
+    signup_email_input = LazyLocator(AuthPageLocators.SIGNUP_EMAIL_INPUT)
+    signup_btn = LazyLocator(AuthPageLocators.SIGNUP_BTN)
+
+    # Shared elements
+    user_account_name = LazyLocator(CommonLocators.USER_ACCOUNT_NAME)
+    logout_btn = LazyLocator(CommonLocators.LOGOUT_BTN)
+
+    # Error messages
+    incorrect_credentials_error = LazyLocator(AuthPageLocators.INCORRECT_CREDENTIALS_ERROR)
+    existing_email_error = LazyLocator(AuthPageLocators.EXISTING_EMAIL_ERROR)
+
+    # Account management
+    delete_account_btn = LazyLocator(AuthPageLocators.DELETE_ACCOUNT_BTN)
+    account_deleted_text = LazyLocator(AuthPageLocators.ACCOUNT_DELETED_TEXT)
+    account_deleted_continue = LazyLocator(AuthPageLocators.ACCOUNT_DELETED_CONTINUE)
+
+    # Registration flow
+    account_info_header = LazyLocator(AuthPageLocators.ACCOUNT_INFO_HEADER)
 
     @allure.step("Navigate to login/signup page")
     def navigate_to_auth_page(self) -> None:
@@ -1,17 +1,205 @@
-from playwright.sync_api import Page
+from urllib.parse import urlsplit
+
+from playwright.sync_api import Locator, Page
+
+from utils.constants import URLS
+
+
+# Applies [name, selector, value] fields in one evaluate() call; returns the
+# names of the fields it could not set, to be filled by Playwright actions
+FILL_FORM_SCRIPT = """
+([fields, strict]) => {
+    const valueSetters = {
+        INPUT: Object.getOwnPropertyDescriptor(HTMLInputElement.prototype, "value").set,
+        TEXTAREA: Object.getOwnPropertyDescriptor(HTMLTextAreaElement.prototype, "value").set,
+    };
+    const notify = (element) => {
+        element.dispatchEvent(new Event("input", { bubbles: true }));
+        element.dispatchEvent(new Event("change", { bubbles: true }));
+    };
+    const isInteractable = (element) => {
+        const style = getComputedStyle(element);
+        return element.getClientRects().length > 0 && style.visibility !== "hidden"
+            && !element.disabled && !element.readOnly;
+    };
+    const actions = [];
+    const skipped = [];
+    for (const [name, selector, value] of fields) {
+        let matches = [];
+        try {
+            matches = document.querySelectorAll(selector);
+        } catch (error) {
+            // Playwright-only selector syntax (text=, :has-text()): not resolvable here
+        }
+        const element = matches.length === 1 ? matches[0] : null;
+        if (!element || (strict && !isInteractable(element))) {
+            skipped.push(name);
+            continue;
+        }
+        const type = (element.type || "").toLowerCase();
+        const isToggle = element.tagName === "INPUT" && (type === "checkbox" || type === "radio");
+        if (typeof value === "boolean") {
+            if (!isToggle || (type === "radio" && !value)) {
+                skipped.push(name);
+            } else if (element.checked !== value) {
+                // A real click, so the page's own click handlers run too
+                actions.push(() => element.click());
+            }
+        } else if (element.tagName === "SELECT") {
+            const option = [...element.options].find((o) => o.value === value || o.label === value);
+            if (!option) {
+                skipped.push(name);
+            } else {
+                actions.push(() => { element.value = option.value; notify(element); });
+            }
+        } else if (element.tagName in valueSetters && !isToggle && type !== "file") {
+            // The prototype setter, so frameworks tracking the value see the change
+            actions.push(() => { valueSetters[element.tagName].call(element, value); notify(element); });
+        } else {
+            skipped.push(name);
+        }
+    }
+    actions.forEach((action) => action());
+    return skipped;
+}
+"""
+
+# Reads {field: selector} text out of each row element for read_rows()
+READ_ROWS_SCRIPT = """
+(rows, fields) => rows.map((row) => {
+    const record = {};
+    for (const [field, selector] of Object.entries(fields)) {
+        const cell = row.querySelector(selector);
+        record[field] = cell ? cell.textContent.trim() : null;
+    }
+    return record;
+})
+"""
+
+
+class PageURL:
+    """Resolve a page class's PATH against the configured base URL on access."""
+    
+    def __get__(self, instance, owner) -> str:
+        return "" if owner.PATH is None else URLS.BASE_URL + owner.PATH
+
+
+class LazyLocator:
+    """
+    Page object attribute backed by a selector from locators/locators.py.
+    
+    page.locator() is called on first access only; the Locator is then
+    cached on the page object.
+    """
+    
+    __slots__ = ("selector", "name")
+    
+    def __init__(self, selector: str):
+        self.selector = selector
+    
+    def __set_name__(self, owner, name: str) -> None:
+        self.name = name
+    
+    def __get__(self, instance, owner) -> Locator:
+        if instance is None:
+            return self
+        locators = instance._locators
+        if self.name not in locators:
+            locators[self.name] = instance.page.locator(self.selector)
+        return locators[self.name]
 
 
 class BasePage:
     
-    URL: str = ""  # Override in subclasses
+    # Subclasses declare __slots__ = () to keep instances free of a __dict__
+    __slots__ = ("page", "_locators")
+    
+    PATH: str | None = None  # Override in subclasses, relative to the base URL
+    URL = PageURL()
+    # goto() wait strategy: "commit", "domcontentloaded", "load" or "networkidle"
+    WAIT_UNTIL = "domcontentloaded"
+    # Selector of the element that proves the page is usable; override in subclasses
+    READY_LOCATOR: str | None = None
     
     def __init__(self, page: Page):
         self.page = page
+        self._locators: dict[str, Locator] = {}
+    
+    def navigate(self, wait_until: str = None, force: bool = False) -> None:
+        """
+        Open the page unless the browser is already on it, then wait until it is ready.
+        
+        Args:
+            wait_until: goto() wait strategy for this navigation; defaults to WAIT_UNTIL.
+            force: Reload even if the browser is already on the page.
+        """
+        if self.PATH is None:
+            raise NotImplementedError("Subclass must define PATH class attribute")
+        if force or not self.is_current():
+            self.page.goto(self.URL, wait_until=wait_until or self.WAIT_UNTIL)
+        if self.READY_LOCATOR:
+            self.page.locator(self.READY_LOCATOR).wait_for()
+    
+    def is_current(self) -> bool:
+        """Whether the browser is on this page (fragment and trailing slash ignored)."""
+        current, target = urlsplit(self.page.url), urlsplit(self.URL)
+        return (current.scheme, current.netloc, current.path.rstrip("/"), current.query) == (
+            target.scheme, target.netloc, target.path.rstrip("/"), target.query
+        )
+    
+    def fill_form(self, fields: dict[str, str | bool], strict: bool = True) -> list[str]:
+        """
+        Fill several form fields in a single browser round trip.
+        
+        Text inputs and textareas get the value set, selects pick the option
+        with that value or label, checkboxes and radios are set to a bool value.
+        Every changed field receives input and change events. Fields that
+        cannot be set in bulk (missing, ambiguous or Playwright-only selector,
+        unknown option) are filled with regular per-field actions instead,
+        which wait for the field and fail with Playwright's usual errors.
+        
+        Args:
+            fields: Mapping of LazyLocator attribute name to value.
+            strict: Also fall back to per-field actions for fields that are
+                hidden, disabled or read-only, as Playwright actions would
+                refuse them. False sets them in bulk anyway.
+        
+        Returns:
+            Names of the fields filled by per-field actions.
+        """
+        if not fields:
+            return []
+        cls = type(self)
+        payload = [
+            [name, getattr(cls, name).selector, value if isinstance(value, bool) else str(value)]
+            for name, value in fields.items()
+        ]
+        # Actions auto-wait; a single evaluate() does not, so wait for the form once
+        getattr(self, payload[0][0]).wait_for(state="visible" if strict else "attached")
+        fallback = self.page.evaluate(FILL_FORM_SCRIPT, [payload, strict])
+        for name in fallback:
+            locator, value = getattr(self, name), fields[name]
+            if isinstance(value, bool):
+                locator.set_checked(value)
+            elif locator.evaluate("element => element.tagName") == "SELECT":
+                locator.select_option(str(value))
+            else:
+                locator.fill(str(value))
+        return fallback
     
-    def navigate(self) -> None:
-        if not self.URL:
-            raise NotImplementedError("Subclass must define URL class attribute")
-        self.page.goto(self.URL)
+    def read_rows(self, rows: Locator, fields: dict[str, str]) -> list[dict[str, str | None]]:
+        """
+        Read the text of several cells of every row in a single browser round trip.
+        
+        Args:
+            rows: Locator matching the rows (table rows, product cards, ...).
+            fields: Mapping of field name to a CSS selector relative to a row.
+        
+        Returns:
+            One dict per row with the trimmed text of each field, or None
+            where the row has no such cell.
+        """
+        return rows.evaluate_all(READ_ROWS_SCRIPT, fields)
     
     @property
     def current_url(self) -> str:
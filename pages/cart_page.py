@@ -1,25 +1,36 @@
-from playwright.sync_api import Page
+from dataclasses import dataclass
+from decimal import Decimal
+
 import allure
 
-from pages.base_page import BasePage
-from utils.constants import URLS
+from pages.base_page import BasePage, LazyLocator
 from locators.locators import CartPageLocators
+from utils.helper import parse_price
+
+
+@dataclass(frozen=True, slots=True)
+class CartRow:
+    """One product line of the cart."""
+    name: str
+    price: Decimal
+    quantity: int
+    total: Decimal
 
 
 class CartPage(BasePage):
     
-    URL = URLS.CART_URL
-
-    def __init__(self, page: Page):
-        super().__init__(page)
-        self.products_list = page.locator(CartPageLocators.PRODUCTS_LIST)
-        self.product_items = page.locator(CartPageLocators.PRODUCT_ITEMS)
-        self.product_name = page.locator(CartPageLocators.PRODUCT_NAME)
-        self.product_price = page.locator(CartPageLocators.PRODUCT_PRICE)
-        self.product_quantity = page.locator(CartPageLocators.PRODUCT_QUANTITY)
-        self.product_total_price = page.locator(CartPageLocators.PRODUCT_TOTAL_PRICE)
-        self.product_delete_btn = page.locator(CartPageLocators.PRODUCT_DELETE_BTN)
-        self.checkout_btn = page.locator(CartPageLocators.CHECKOUT_BTN)
+    PATH = "view_cart"
+    READY_LOCATOR = CartPageLocators.CART_INFO
+    __slots__ = ()
+
+    products_list = LazyLocator(CartPageLocators.PRODUCTS_LIST)
+    product_items = LazyLocator(CartPageLocators.PRODUCT_ITEMS)
+    product_name = LazyLocator(CartPageLocators.PRODUCT_NAME)
+    product_price = LazyLocator(CartPageLocators.PRODUCT_PRICE)
+    product_quantity = LazyLocator(CartPageLocators.PRODUCT_QUANTITY)
+    product_total_price = LazyLocator(CartPageLocators.PRODUCT_TOTAL_PRICE)
+    product_delete_btn = LazyLocator(CartPageLocators.PRODUCT_DELETE_BTN)
+    checkout_btn = LazyLocator(CartPageLocators.CHECKOUT_BTN)
 
     @allure.step("Navigate to cart page")
     def navigate_to_cart_page(self) -> None:
@@ -31,6 +42,26 @@ class CartPage(BasePage):
         """Get the number of displayed products."""
         return self.product_items.count()
 
+    @allure.step("Get cart rows")
+    def get_rows(self) -> list[CartRow]:
+        """Read every product line of the cart in a single browser round trip."""
+        rows = self.read_rows(self.product_items, {
+            "name": CartPageLocators.PRODUCT_NAME,
+            "price": CartPageLocators.PRODUCT_PRICE,
+            "quantity": CartPageLocators.PRODUCT_QUANTITY,
+            "total": CartPageLocators.PRODUCT_TOTAL_PRICE,
+        })
+        return [
+            CartRow(
+                name=row["name"],
+                price=parse_price(row["price"]),
+                quantity=int(row["quantity"]),
+                total=parse_price(row["total"]),
+            )
+            for row in rows
+            if row["name"] is not None  # Header and empty-cart rows
+        ]
+
     @allure.step("Click checkout")
     def click_checkout(self) -> None:
         """Click 'Checkout' button."""
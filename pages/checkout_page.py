@@ -1,24 +1,22 @@
-from playwright.sync_api import Page
 import allure
 
-from pages.base_page import BasePage
-from utils.constants import URLS
+from pages.base_page import BasePage, LazyLocator
 from locators.locators import CheckoutPageLocators
 
 
 class CheckoutPage(BasePage):
     """Page object for checkout/order review page."""
     
-    URL = URLS.CHECKOUT_URL
-
-    def __init__(self, page: Page):
-        super().__init__(page)
-        self.delivery_address = page.locator(CheckoutPageLocators.DELIVERY_ADDRESS)
-        self.billing_address = page.locator(CheckoutPageLocators.BILLING_ADDRESS)
-        self.cart_items = page.locator(CheckoutPageLocators.CART_ITEMS)
-        self.comment_textarea = page.locator(CheckoutPageLocators.COMMENT_TEXTAREA)
-        self.place_order_btn = page.locator(CheckoutPageLocators.PLACE_ORDER_BTN)
-        self.register_login_btn = page.locator(CheckoutPageLocators.REGISTER_LOGIN_BTN)
+    PATH = "checkout"
+    READY_LOCATOR = CheckoutPageLocators.DELIVERY_ADDRESS
+    __slots__ = ()
+
+    delivery_address = LazyLocator(CheckoutPageLocators.DELIVERY_ADDRESS)
+    billing_address = LazyLocator(CheckoutPageLocators.BILLING_ADDRESS)
+    cart_items = LazyLocator(CheckoutPageLocators.CART_ITEMS)
+    comment_textarea = LazyLocator(CheckoutPageLocators.COMMENT_TEXTAREA)
+    place_order_btn = LazyLocator(CheckoutPageLocators.PLACE_ORDER_BTN)
+    register_login_btn = LazyLocator(CheckoutPageLocators.REGISTER_LOGIN_BTN)
 
     @allure.step("Enter order comment")
     def enter_comment(self, comment: str) -> None:
@@ -1,26 +1,24 @@
-from playwright.sync_api import Page
 import allure
 
-from pages.base_page import BasePage
-from utils.constants import URLS
+from pages.base_page import BasePage, LazyLocator
 from locators.locators import ContactUsPageLocators
 import os
 
 class ContactUsPage(BasePage):
     
-    URL = URLS.CONTACT_US_URL
+    PATH = "contact_us"
+    READY_LOCATOR = ContactUsPageLocators.CONTACT_US_FORM
+    __slots__ = ()
 
-    def __init__(self, page: Page):
-        super().__init__(page)
-        self.get_in_touch_header = page.locator(ContactUsPageLocators.GET_IN_TOUCH_HEADER)
-        self.contact_us_form = page.locator(ContactUsPageLocators.CONTACT_US_FORM)
-        self.name_input = page.locator(ContactUsPageLocators.NAME_INPUT)
-        self.email_input = page.locator(ContactUsPageLocators.EMAIL_INPUT)
-        self.subject_input = page.locator(ContactUsPageLocators.SUBJECT_INPUT)
-        self.message_input = page.locator(ContactUsPageLocators.MESSAGE_INPUT)
-        self.file_input = page.locator(ContactUsPageLocators.FILE_INPUT)
-        self.submit_btn = page.locator(ContactUsPageLocators.SUBMIT_BTN)
-        self.success_message = page.locator(ContactUsPageLocators.SUCCESS_MESSAGE)
+    get_in_touch_header = LazyLocator(ContactUsPageLocators.GET_IN_TOUCH_HEADER)
+    contact_us_form = LazyLocator(ContactUsPageLocators.CONTACT_US_FORM)
+    name_input = LazyLocator(ContactUsPageLocators.NAME_INPUT)
+    email_input = LazyLocator(ContactUsPageLocators.EMAIL_INPUT)
+    subject_input = LazyLocator(ContactUsPageLocators.SUBJECT_INPUT)
+    message_input = LazyLocator(ContactUsPageLocators.MESSAGE_INPUT)
+    file_input = LazyLocator(ContactUsPageLocators.FILE_INPUT)
+    submit_btn = LazyLocator(ContactUsPageLocators.SUBMIT_BTN)
+    success_message = LazyLocator(ContactUsPageLocators.SUCCESS_MESSAGE)
 
     @allure.step("Navigate to contact us page")
     def navigate_to_contact_us_page(self) -> None:
@@ -1,37 +1,37 @@
-from playwright.sync_api import Page
 import allure
 
-from pages.base_page import BasePage
-from utils.constants import URLS
+from pages.base_page import BasePage, LazyLocator
 from locators.locators import PaymentPageLocators
 
 
 class PaymentPage(BasePage):
     """Page object for payment page."""
     
-    URL = URLS.PAYMENT_URL
-
-    def __init__(self, page: Page):
-        super().__init__(page)
-        self.name_on_card = page.locator(PaymentPageLocators.NAME_ON_CARD)
-        self.card_number = page.locator(PaymentPageLocators.CARD_NUMBER)
-        self.cvc = page.locator(PaymentPageLocators.CVC)
-        self.expiry_month = page.locator(PaymentPageLocators.EXPIRY_MONTH)
-        self.expiry_year = page.locator(PaymentPageLocators.EXPIRY_YEAR)
-        self.pay_confirm_btn = page.locator(PaymentPageLocators.PAY_CONFIRM_BTN)
-        self.success_message = page.locator(PaymentPageLocators.SUCCESS_MESSAGE)
-        self.order_placed_container = page.locator(PaymentPageLocators.ORDER_PLACED_CONTAINER)
-        self.download_invoice_btn = page.locator(PaymentPageLocators.DOWNLOAD_INVOICE_BTN)
-        self.continue_btn = page.locator(PaymentPageLocators.CONTINUE_BTN)
+    PATH = "payment"
+    READY_LOCATOR = PaymentPageLocators.NAME_ON_CARD
+    __slots__ = ()
+
+    name_on_card = LazyLocator(PaymentPageLocators.NAME_ON_CARD)
+    card_number = LazyLocator(PaymentPageLocators.CARD_NUMBER)
+    cvc = LazyLocator(PaymentPageLocators.CVC)
+    expiry_month = LazyLocator(PaymentPageLocators.EXPIRY_MONTH)
+    expiry_year = LazyLocator(PaymentPageLocators.EXPIRY_YEAR)
+    pay_confirm_btn = LazyLocator(PaymentPageLocators.PAY_CONFIRM_BTN)
+    success_message = LazyLocator(PaymentPageLocators.SUCCESS_MESSAGE)
+    order_placed_container = LazyLocator(PaymentPageLocators.ORDER_PLACED_CONTAINER)
+    download_invoice_btn = LazyLocator(PaymentPageLocators.DOWNLOAD_INVOICE_BTN)
+    continue_btn = LazyLocator(PaymentPageLocators.CONTINUE_BTN)
 
     @allure.step("Enter payment details")
     def enter_payment_details(self, payment_data: dict) -> None:
         """Fill in all payment card details."""
-        self.name_on_card.fill(payment_data["name_on_card"])
-        self.card_number.fill(payment_data["card_number"])
-        self.cvc.fill(payment_data["cvc"])
-        self.expiry_month.fill(payment_data["expiry_month"])
-        self.expiry_year.fill(payment_data["expiry_year"])
+        self.fill_form({
+            "name_on_card": payment_data["name_on_card"],
+            "card_number": payment_data["card_number"],
+            "cvc": payment_data["cvc"],
+            "expiry_month": payment_data["expiry_month"],
+            "expiry_year": payment_data["expiry_year"],
+        })
 
     @allure.step("Click Pay and Confirm Order")
     def click_pay_and_confirm(self) -> None:
@@ -1,30 +1,39 @@
-from playwright.sync_api import Page
+from dataclasses import dataclass
+from decimal import Decimal
+
 import allure
-from pages.base_page import BasePage
-from utils.constants import URLS
+from pages.base_page import BasePage, LazyLocator
 from locators.locators import ProductsPageLocators
+from utils.helper import parse_price
+
+
+@dataclass(frozen=True, slots=True)
+class ProductCard:
+    """One product of the products grid."""
+    name: str
+    price: Decimal
 
 
 class ProductsPage(BasePage):
     
-    URL = URLS.PRODUCTS_URL
-
-    def __init__(self, page: Page):
-        super().__init__(page)
-        self.products_list = page.locator(ProductsPageLocators.PRODUCTS_LIST)
-        self.product_items = page.locator(ProductsPageLocators.PRODUCT_ITEMS)
-        self.product_name = page.locator(ProductsPageLocators.PRODUCT_NAME)
-        self.product_price = page.locator(ProductsPageLocators.PRODUCT_PRICE)
-        self.add_to_cart_btn = page.locator(ProductsPageLocators.ADD_TO_CART_BTN)
-        self.view_product_btn = page.locator(ProductsPageLocators.VIEW_PRODUCT_BTN)
-        self.search_input = page.locator(ProductsPageLocators.SEARCH_INPUT)
-        self.search_btn = page.locator(ProductsPageLocators.SEARCH_BTN)
-        self.searched_products_header = page.locator(ProductsPageLocators.SEARCHED_PRODUCTS_HEADER)
-        self.product_detail_name = page.locator(ProductsPageLocators.PRODUCT_DETAIL_NAME)
-        self.product_detail_price = page.locator(ProductsPageLocators.PRODUCT_DETAIL_PRICE)
-        self.view_cart_btn = page.locator(ProductsPageLocators.VIEW_CART_BTN)
-        self.added_to_cart_msg = page.locator(ProductsPageLocators.ADDED_TO_CART_MSG)
-        self.continue_shopping_btn = page.locator(ProductsPageLocators.CONTINUE_SHOPPING_BTN)
+    PATH = "products"
+    READY_LOCATOR = ProductsPageLocators.PRODUCTS_LIST
+    __slots__ = ()
+
+    products_list = LazyLocator(ProductsPageLocators.PRODUCTS_LIST)
+    product_items = LazyLocator(ProductsPageLocators.PRODUCT_ITEMS)
+    product_name = LazyLocator(ProductsPageLocators.PRODUCT_NAME)
+    product_price = LazyLocator(ProductsPageLocators.PRODUCT_PRICE)
+    add_to_cart_btn = LazyLocator(ProductsPageLocators.ADD_TO_CART_BTN)
+    view_product_btn = LazyLocator(ProductsPageLocators.VIEW_PRODUCT_BTN)
+    search_input = LazyLocator(ProductsPageLocators.SEARCH_INPUT)
+    search_btn = LazyLocator(ProductsPageLocators.SEARCH_BTN)
+    searched_products_header = LazyLocator(ProductsPageLocators.SEARCHED_PRODUCTS_HEADER)
+    product_detail_name = LazyLocator(ProductsPageLocators.PRODUCT_DETAIL_NAME)
+    product_detail_price = LazyLocator(ProductsPageLocators.PRODUCT_DETAIL_PRICE)
+    view_cart_btn = LazyLocator(ProductsPageLocators.VIEW_CART_BTN)
+    added_to_cart_msg = LazyLocator(ProductsPageLocators.ADDED_TO_CART_MSG)
+    continue_shopping_btn = LazyLocator(ProductsPageLocators.CONTINUE_SHOPPING_BTN)
 
     @allure.step("Navigate to products page")
     def navigate_to_products_page(self) -> None:
@@ -41,6 +50,15 @@ class ProductsPage(BasePage):
         """Get the number of displayed products."""
         return self.product_items.count()
 
+    @allure.step("Get product cards")
+    def get_product_cards(self) -> list[ProductCard]:
+        """Read every product of the grid in a single browser round trip."""
+        rows = self.read_rows(self.product_items, {
+            "name": ProductsPageLocators.PRODUCT_NAME,
+            "price": ProductsPageLocators.PRODUCT_PRICE,
+        })
+        return [ProductCard(name=row["name"], price=parse_price(row["price"])) for row in rows]
+
     @allure.step("Click view product for item at index {index}")
     def click_view_product(self, index: int = 0) -> None:
         """Click 'View Product' for a specific product."""
@@ -5,11 +5,13 @@ Tests cover:
 - Login verification via API
 - Account registration via API
 - Account lifecycle (register -> login -> delete)
+- Account update
 """
 import pytest
 import allure
 
 from utils.api_client import APIClient
+from utils.api_records import decode_user
 from utils.constants import USER_DATA
 from utils.helper import parse_api_response
 
@@ -98,3 +100,29 @@ class TestAuthAPI:
             
             # Remove from cleanup since we deleted it
             api_account_cleanup.pop()
+
+    @pytest.mark.api
+    @pytest.mark.auth
+    @allure.story("Account Update")
+    @allure.title("API updates account details")
+    def test_update_account(self, api_client: APIClient, api_account_cleanup: list):
+        """
+        Given a registered user
+        When their details are updated via API
+        Then the user details should reflect the change
+        """
+        # Arrange
+        response, form_data = api_client.register_new_user(USER_DATA.get_new_user())
+        api_account_cleanup.append((form_data["email"], form_data["password"]))
+        assert parse_api_response(response)["responseCode"] == 201, "Registration failed"
+        updated = {**form_data, "name": "Updated Name", "city": "Updated City"}
+        
+        # Act
+        response = api_client.update_account(updated)
+        body = parse_api_response(response)
+        
+        # Assert
+        assert body["responseCode"] == 200, f"Update failed: {body}"
+        assert body["message"] == "User updated!", f"Unexpected message: {body}"
+        user = decode_user(api_client.get_user_details_by_email(form_data["email"]))
+        assert (user.name, user.city) == ("Updated Name", "Updated City"), f"Details not updated: {user}"
@@ -0,0 +1,59 @@
+"""
+API endpoint matrix tests.
+
+Tests cover:
+- Every endpoint with a supported method
+- Unsupported methods (405) and missing parameters (400)
+- Unknown credentials (404)
+"""
+import pytest
+import allure
+
+from utils.api_matrix import APICase, APIMatrix, format_results
+from utils.constants import USER_DATA
+
+
+NOT_SUPPORTED = "This request method is not supported."
+UNKNOWN_USER = {"email": "nobody_matrix@example.com", "password": "wrong-password"}
+AVAILABLE_LOGIN = {"email": USER_DATA.AVAILABLE_USER["email"], "password": USER_DATA.AVAILABLE_USER["password"]}
+
+ENDPOINT_MATRIX = [
+    APICase("All products", "GET", "/productsList", 200),
+    APICase("Products list rejects POST", "POST", "/productsList", 405, expected_message=NOT_SUPPORTED),
+    APICase("All brands", "GET", "/brandsList", 200),
+    APICase("Brands list rejects PUT", "PUT", "/brandsList", 405, expected_message=NOT_SUPPORTED),
+    APICase("Search products", "POST", "/searchProduct", 200, form={"search_product": "top"}),
+    APICase(
+        "Search without search_product", "POST", "/searchProduct", 400,
+        expected_message="Bad request, search_product parameter is missing in POST request.",
+    ),
+    APICase("Login with valid credentials", "POST", "/verifyLogin", 200, form=AVAILABLE_LOGIN,
+            expected_message="User exists!"),
+    APICase(
+        "Login without email", "POST", "/verifyLogin", 400, form={"password": AVAILABLE_LOGIN["password"]},
+        expected_message="Bad request, email or password parameter is missing in POST request.",
+    ),
+    APICase("Login rejects DELETE", "DELETE", "/verifyLogin", 405, expected_message=NOT_SUPPORTED),
+    APICase("Login with unknown credentials", "POST", "/verifyLogin", 404, form=UNKNOWN_USER,
+            expected_message="User not found!"),
+    APICase("Delete unknown account", "DELETE", "/deleteAccount", 404, form=UNKNOWN_USER,
+            expected_message="Account not found!"),
+]
+
+
+@pytest.mark.api
+@allure.feature("API Endpoints")
+@allure.story("Endpoint Matrix")
+@allure.title("Every endpoint answers each method and payload with the expected code")
+def test_endpoint_matrix(api_matrix: APIMatrix):
+    """
+    Given the matrix of endpoints, methods and payloads
+    When all cases are sent concurrently
+    Then each response has the expected responseCode, message and schema
+    """
+    # Act
+    results = api_matrix.run(ENDPOINT_MATRIX)
+
+    # Assert
+    failed = [result for result in results if not result.passed]
+    assert not failed, f"{len(failed)} of {len(results)} cases failed:\n{format_results(failed)}"
@@ -2,25 +2,28 @@
 Products API tests.
 
 Tests cover:
-- Retrieving product list via API
-- Product data structure validation
+- Retrieving product and brand lists via API
+- Product data structure validation (every product, against the schema)
+- Searching products via API, against the cached product catalog
 """
 import pytest
 import allure
 
 from utils.api_client import APIClient
+from utils.catalog import ProductCatalog
 from utils.helper import parse_api_response
+from utils.schemas import SchemaRegistry
 
 
 @pytest.mark.api
 @allure.feature("Products API")
 @allure.story("Product Listing")
 @allure.title("API returns all products with valid structure")
-def test_get_all_products(api_client: APIClient):
+def test_get_all_products(api_client: APIClient, schema_registry: SchemaRegistry):
     """
     Given the products API endpoint
     When a GET request is made
-    Then it should return a list of products with expected fields
+    Then it should return a list of products, each matching the product schema
     """
     # Act
     response = api_client.get_all_products()
@@ -32,9 +35,81 @@ def test_get_all_products(api_client: APIClient):
     assert isinstance(body["products"], list), f"'products' should be list: {type(body['products'])}"
     assert len(body["products"]) > 0, "Expected at least one product"
     
-    # Assert - Product structure (validate first product)
-    product = body["products"][0]
-    expected_fields = ["id", "name", "price", "brand", "category"]
-    for field in expected_fields:
-        assert field in product, f"Product missing '{field}': {product.keys()}"
+    # Assert - Product structure (every product), checked once with the call
+    violations = schema_registry.validate_response("GET /productsList", response)
+    assert not violations, "Products break the schema:\n" + "\n".join(violations)
     
+
+
+@pytest.mark.api
+@allure.feature("Products API")
+@allure.story("Brand Listing")
+@allure.title("API returns all brands with valid structure")
+def test_get_all_brands(api_client: APIClient, schema_registry: SchemaRegistry):
+    """
+    Given the brands API endpoint
+    When a GET request is made
+    Then it should return a list of brands, each with an id and a name
+    """
+    # Act
+    response = api_client.get_all_brands()
+    body = parse_api_response(response)
+    
+    # Assert
+    assert body["responseCode"] == 200, f"Expected 200, got {body}"
+    violations = schema_registry.validate_response("GET /brandsList", response)
+    assert not violations, "Brands break the schema:\n" + "\n".join(violations)
+
+
+@pytest.mark.api
+@pytest.mark.products_search
+@allure.feature("Products API")
+@allure.story("Product Search")
+@allure.title("API search returns only products related to the search term")
+def test_search_products(api_client: APIClient):
+    """
+    API-level equivalent of the UI test_product_search.
+    
+    Given the search product API endpoint
+    When a search term is posted
+    Then every product returned is related to the term
+    """
+    # Arrange
+    search_term = "top"
+    
+    # Act
+    response = api_client.search_products(search_term)
+    body = parse_api_response(response)
+    
+    # Assert
+    assert body["responseCode"] == 200, f"Expected 200, got {body}"
+    assert len(body["products"]) > 0, "Expected search results"
+    for product in body["products"]:
+        related = f"{product['name']} {product['category']['category']}".lower()
+        assert search_term in related, f"Product {product['name']} is not related to {search_term}"
+
+
+@pytest.mark.api
+@pytest.mark.products_search
+@allure.feature("Products API")
+@allure.story("Product Search")
+@allure.title("API search returns the catalog products whose name matches the term")
+def test_search_products_match_catalog(api_client: APIClient, product_catalog: ProductCatalog):
+    """
+    Given the product catalog
+    When a term is searched via API
+    Then every result is the catalog's product, and every catalog product named after the term is found
+    """
+    # Arrange
+    search_term = "dress"
+    
+    # Act
+    body = parse_api_response(api_client.search_products(search_term))
+    
+    # Assert
+    assert body["responseCode"] == 200, f"Expected 200, got {body}"
+    found = {product["id"]: product for product in body["products"]}
+    for product_id, product in found.items():
+        assert product == product_catalog.by_id(product_id), f"Search result differs from the catalog: {product}"
+    missing = [product["name"] for product in product_catalog.search(search_term) if product["id"] not in found]
+    assert not missing, f"Search for {search_term!r} missed {missing}"
@@ -20,14 +20,20 @@ from utils.constants import USER_DATA, SIGNUP_TEXTS
 @allure.feature("Authentication")
 @allure.story("Login")
 @allure.title("User can login with valid credentials")
-def test_login_with_valid_credentials(logged_in_user: AuthPage):
+def test_login_with_valid_credentials(auth_page: AuthPage):
     """
     Given a registered user
     When they login with valid credentials
     Then they should see their username in the header
     """
+    # Arrange
+    auth_page.navigate_to_auth_page()
+    
+    # Act
+    auth_page.fill_login_form(USER_DATA.AVAILABLE_USER)
+    
     # Assert
-    expect(logged_in_user.user_account_name).to_have_text(
+    expect(auth_page.user_account_name).to_have_text(
         f"Logged in as {USER_DATA.AVAILABLE_USER['name']}"
     )
 
@@ -55,6 +61,7 @@ def test_login_with_invalid_credentials(auth_page: AuthPage):
     )
 
 
+@pytest.mark.fresh_login  # Logout ends the server session shared via the auth cache
 @pytest.mark.tags("ui", "regression", "positive", "logout")
 @allure.feature("Authentication")
 @allure.story("Logout")
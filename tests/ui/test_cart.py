@@ -1,7 +1,48 @@
+"""
+Cart UI tests.
+
+Tests cover:
+- Cart lines for products added from the products page
+"""
 import pytest
 from playwright.sync_api import expect
 import allure
 
 from pages.cart_page import CartPage
+from pages.products_page import ProductsPage
 from utils.constants import URLS
 
+
+@pytest.mark.tags("ui", "regression", "positive", "cart")
+@pytest.mark.products_add_to_cart
+@pytest.mark.block_requests("image", "media", "font")
+@allure.feature("Cart")
+@allure.story("Cart Contents")
+@allure.title("Cart lists the added products with their price, quantity and total")
+def test_cart_lists_added_products(products_page: ProductsPage, cart_page: CartPage):
+    """
+    Given a user on the products page
+    When they add the first two products to the cart
+    And open the cart
+    Then the cart should list both products once
+    And each line should show the product's price and a matching total
+    """
+    # Arrange
+    products_page.navigate_to_products_page()
+    added = products_page.get_product_cards()[:2]
+    
+    # Act
+    products_page.add_product_to_cart()
+    products_page.click_continue_shopping()
+    products_page.add_product_to_cart(1)
+    products_page.click_view_cart()
+    
+    # Assert
+    expect(cart_page.page).to_have_url(URLS.CART_URL)
+    expect(cart_page.product_name).to_have_count(len(added))
+    rows = cart_page.get_rows()
+    assert [row.name for row in rows] == [card.name for card in added]
+    for row, card in zip(rows, added):
+        assert row.price == card.price, f"{row.name}: cart price {row.price} != listed price {card.price}"
+        assert row.quantity == 1, f"{row.name}: expected quantity 1, got {row.quantity}"
+        assert row.total == row.price * row.quantity, f"{row.name}: total {row.total} != price x quantity"
@@ -15,8 +15,7 @@ from pages.products_page import ProductsPage
 from pages.cart_page import CartPage
 from pages.checkout_page import CheckoutPage
 from pages.payment_page import PaymentPage
-from pages.registration_page import RegistrationPage
-from utils.constants import USER_DATA, PAYMENT_DATA
+from utils.constants import PAYMENT_DATA
 
 
 @pytest.mark.ui
@@ -58,33 +57,27 @@ def test_place_order_login_before_checkout(
     expect(payment_page.order_placed_container).to_be_visible()
 
 
-@pytest.mark.parametrize("registered_user", [USER_DATA.get_new_user], indirect=True)
 @pytest.mark.ui
 @pytest.mark.checkout
 @allure.feature("Checkout")
 @allure.story("Register Before Checkout")
 @allure.title("TC15: Place order after registration")
 def test_place_order_register_before_checkout(
-    auth_page: AuthPage,
-    registration_page: RegistrationPage,
+    provisioned_user: dict,
     products_page: ProductsPage,
     cart_page: CartPage,
     checkout_page: CheckoutPage,
-    payment_page: PaymentPage,
-    registered_user: dict
+    payment_page: PaymentPage
 ):
     """
     Given a new user who just registered
     When they add products and complete checkout
     Then the order should be placed successfully
-    And the account should be cleaned up
-    """
-    # Complete registration
-    expect(auth_page.account_info_header).to_be_visible()
-    registration_page.complete_registration(registered_user)
-    expect(registration_page.account_created_msg).to_be_visible()
-    registration_page.click_continue_btn()
     
+    Note:
+        Registration itself is covered by test_auth.py; the account is
+        provisioned via the API and deleted by the fixture.
+    """
     # Add product to cart
     products_page.navigate_to_products_page()
     products_page.add_product_to_cart()
@@ -105,8 +98,3 @@ def test_place_order_register_before_checkout(
     
     # Assert order success
     expect(payment_page.order_placed_container).to_be_visible()
-    
-    # Cleanup - delete account
-    payment_page.click_continue()
-    auth_page.click_delete_account_btn()
-    expect(auth_page.account_deleted_text).to_be_visible()
@@ -26,4 +26,4 @@ def test_navigation_to_test_cases_page(page: Page):
 
     # Assert
     with allure.step("Verify that the user is navigated to the test cases page"):
-        expect(page).to_have_url("https://automationexercise.com/test_cases")
+        expect(page).to_have_url(URLS.BASE_URL + "test_cases")
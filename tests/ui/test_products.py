@@ -15,6 +15,7 @@ from utils.constants import URLS
 
 @pytest.mark.tags("ui", "regression", "smoke", "positive", "products")
 @pytest.mark.products
+@pytest.mark.block_requests("image", "media", "font")
 @allure.feature("Products")
 @allure.story("Product Listing")
 @allure.title("Products page displays product list")
@@ -24,17 +25,25 @@ def test_products_page_displays_products(products_page: ProductsPage):
     When the page loads
     Then the products list should be visible
     And at least one product should be displayed
+    And every product should show a name and a price
     """
     # Arrange
     products_page.navigate_to_products_page()
     
+    # Act
+    cards = products_page.get_product_cards()
+    
     # Assert
     expect(products_page.products_list).to_be_visible()
-    assert products_page.get_products_count() > 0, "Expected at least one product"
+    assert cards, "Expected at least one product"
+    for card in cards:
+        assert card.name, f"Product without a name: {card}"
+        assert card.price > 0, f"Product {card.name} has no price"
 
 
 @pytest.mark.tags("ui", "regression", "positive", "products", "search")
 @pytest.mark.products_search
+@pytest.mark.block_requests("image", "media", "font")
 @allure.feature("Products")
 @allure.story("Product Search")
 @allure.title("User can search for products")
@@ -53,12 +62,11 @@ def test_product_search(products_page: ProductsPage):
     
     # Assert
     expect(products_page.searched_products_header).to_be_visible()
-    assert products_page.get_products_count() > 0, "Expected search results"
+    cards = products_page.get_product_cards()
+    assert cards, "Expected search results"
     #all the products related to search are visible
-    # extract all the product names and assert that they contain the search term
-    product_names = products_page.product_name.all_text_contents()
-    for name in product_names:
-        assert search_term.lower() in name.lower(), f"Product name {name} does not contain search term {search_term}"
+    for card in cards:
+        assert search_term.lower() in card.name.lower(), f"Product name {card.name} does not contain search term {search_term}"
 
 
 @pytest.mark.tags("ui", "regression", "positive", "products", "add to cart")
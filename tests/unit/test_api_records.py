@@ -0,0 +1,185 @@
+"""
+API record decoding unit tests.
+
+Tests cover:
+- Decoding a whole /productsList body into validated records
+- Lazy decoding that stops at the first match
+- Rejecting bodies without products and invalid entries
+- Decoding each response's body once
+"""
+import json
+from decimal import Decimal
+
+import pytest
+import allure
+
+from utils import helper
+from utils.api_records import Product, decode_products, decode_user, iter_products
+from utils.helper import decode_response
+
+
+class StaticResponse:
+    """Stand-in for Playwright's APIResponse serving a fixed body."""
+
+    def __init__(self, body: bytes | str):
+        self._body = body.encode() if isinstance(body, str) else body
+
+    def body(self) -> bytes:
+        return self._body
+
+
+def product(product_id: int, name: str = "Blue Top", price: str = "Rs. 500") -> dict:
+    return {
+        "id": product_id,
+        "name": name,
+        "price": price,
+        "brand": "Polo",
+        "category": {"usertype": {"usertype": "Women"}, "category": "Tops"},
+    }
+
+
+def products_response(*products: dict) -> StaticResponse:
+    return StaticResponse(json.dumps({"responseCode": 200, "products": list(products)}, indent=1))
+
+
+@pytest.mark.unit
+@allure.feature("API Records")
+class TestDecodeProducts:
+    """Tests of decode_products and decode_user."""
+
+    @allure.story("Full Decode")
+    @allure.title("Products decode into records with Decimal prices")
+    def test_decodes_products_into_records(self):
+        """
+        Given a /productsList body
+        When it is decoded into records
+        Then every product is a record with its category flattened and a Decimal price
+        """
+        # Arrange
+        response = products_response(product(1), product(2, "Men Tshirt", "Rs. 1,299.50"))
+
+        # Act
+        products = decode_products(response)
+
+        # Assert
+        assert products == [
+            Product(1, "Blue Top", Decimal("500"), "Polo", "Tops", "Women"),
+            Product(2, "Men Tshirt", Decimal("1299.50"), "Polo", "Tops", "Women"),
+        ]
+
+    @allure.story("Full Decode")
+    @allure.title("Bodies without products and invalid products are rejected")
+    @pytest.mark.parametrize("body", [
+        '{"responseCode": 200}',
+        '{"responseCode": 200, "products": {}}',
+        "not json",
+        json.dumps({"products": [{"id": 1, "name": "Blue Top"}]}),
+        json.dumps({"products": [product("1")]}),
+        json.dumps({"products": [product(1, price="free")]}),
+    ], ids=["no products", "products not a list", "not JSON", "missing fields", "wrong type", "no price"])
+    def test_rejects_invalid_bodies(self, body: str):
+        """
+        Given a body without a valid products array
+        When it is decoded into records
+        Then a ValueError is raised
+        """
+        # Act & Assert
+        with pytest.raises(ValueError):
+            decode_products(StaticResponse(body))
+
+    @allure.story("Full Decode")
+    @allure.title("A user decodes without the fields the record lacks")
+    def test_decodes_user(self):
+        """
+        Given a /getUserDetailByEmail body with an unknown field
+        When it is decoded into a record
+        Then the known fields are kept and the rest ignored
+        """
+        # Arrange
+        body = {"responseCode": 200, "user": {"id": 3, "name": "Ann", "email": "ann@example.com", "extra": 1}}
+
+        # Act
+        user = decode_user(StaticResponse(json.dumps(body)))
+
+        # Assert
+        assert (user.id, user.name, user.email, user.city) == (3, "Ann", "ann@example.com", "")
+
+    @allure.story("Decode Once")
+    @allure.title("A response's body is decoded once")
+    def test_decodes_each_response_once(self, monkeypatch):
+        """
+        Given a response
+        When it is parsed, decoded into records and decoded again
+        Then its body is decoded once and the same object is returned
+        """
+        # Arrange
+        decodes = []
+        load_json = helper.load_json
+        monkeypatch.setattr(helper, "load_json", lambda body: decodes.append(body) or load_json(body))
+        response = products_response(product(1))
+
+        # Act
+        body = helper.parse_api_response(response)
+        decode_products(response)
+
+        # Assert
+        assert decode_response(response) is body
+        assert len(decodes) == 1, f"Decoded {len(decodes)} times"
+
+
+@pytest.mark.unit
+@allure.feature("API Records")
+class TestIterProducts:
+    """Tests of the lazy iter_products."""
+
+    @allure.story("Lazy Decode")
+    @allure.title("Lazy decoding yields the same records as a full decode")
+    @pytest.mark.parametrize("count", [0, 1, 5])
+    def test_matches_full_decode(self, count: int):
+        """
+        Given a /productsList body
+        When its products are iterated lazily
+        Then the records equal those of a full decode
+        """
+        # Arrange
+        response = products_response(*(product(index + 1, f"Top {index}") for index in range(count)))
+
+        # Act & Assert
+        assert list(iter_products(response)) == decode_products(response)
+
+    @allure.story("Lazy Decode")
+    @allure.title("Lazy decoding stops at the match without reading the rest")
+    def test_stops_at_match(self):
+        """
+        Given a body that is malformed after its second product
+        When iteration stops at the second product
+        Then the malformed rest is never decoded
+        """
+        # Arrange
+        body = json.dumps({"products": [product(1), product(2, "Men Tshirt")]})
+        response = StaticResponse(body[:-2] + ', {"id": ]}')
+
+        # Act
+        match = next(p for p in iter_products(response) if p.name == "Men Tshirt")
+
+        # Assert
+        assert match.id == 2
+        with pytest.raises(ValueError):
+            list(iter_products(response))
+
+    @allure.story("Lazy Decode")
+    @allure.title("Lazy decoding rejects bodies without a products array")
+    @pytest.mark.parametrize("body", [
+        '{"responseCode": 200, "message": "no products"}',
+        '{"products": [' + json.dumps(product(1)) + ' ' + json.dumps(product(2)) + ']}',
+        '{"products": [' + json.dumps(product("1")) + ']}',
+    ], ids=["no array", "missing comma", "invalid product"])
+    def test_rejects_invalid_bodies(self, body: str):
+        """
+        Given a body without a valid products array
+        When its products are iterated lazily
+        Then a ValueError is raised
+        """
+        # Act & Assert
+        with pytest.raises(ValueError):
+            list(iter_products(StaticResponse(body)))
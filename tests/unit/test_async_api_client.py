@@ -0,0 +1,268 @@
+"""
+Async API client unit tests.
+
+Tests cover:
+- Bounding the requests in flight to max_concurrency
+- Latency measured without the wait for a concurrency slot
+- Recording calls into the client's metrics
+- Error propagation, and freeing the slot of a failed request
+- Parsing async responses
+"""
+import asyncio
+import json
+import time
+
+import pytest
+import allure
+from playwright.async_api import Error
+
+from utils.api_metrics import APIMetrics
+from utils.async_api_client import AsyncAPIClient
+from utils.constants import URLS
+from utils.helper import parse_async_api_response
+
+
+class FakeAsyncResponse:
+    """Stand-in for Playwright's async APIResponse."""
+
+    def __init__(self, status: int, body: bytes, headers: dict | None = None):
+        self.status = status
+        self.headers = headers or {}
+        self._body = body
+
+    async def body(self) -> bytes:
+        return self._body
+
+
+class FakeRequestContext:
+    """
+    Answers every fetch after `delay` seconds with its method and path as JSON.
+
+    Paths in `failing` raise like a connection error; `in_flight_max` is the
+    most fetches seen awaiting at once.
+    """
+
+    def __init__(self, delay: float = 0.01, status: int = 200, failing: tuple[str, ...] = (), content_length: bool = True):
+        self.delay = delay
+        self.status = status
+        self.failing = failing
+        self.content_length = content_length
+        self.fetches: list[tuple[str, str, dict]] = []
+        self.in_flight = 0
+        self.in_flight_max = 0
+
+    async def fetch(self, url: str, method: str, **kwargs) -> FakeAsyncResponse:
+        path = url.removeprefix(URLS.API_BASE_URL)
+        self.fetches.append((method, path, kwargs))
+        self.in_flight += 1
+        self.in_flight_max = max(self.in_flight_max, self.in_flight)
+        try:
+            await asyncio.sleep(self.delay)
+            if path in self.failing:
+                raise Error(f"connect ECONNREFUSED {url}")
+        finally:
+            self.in_flight -= 1
+        body = json.dumps({"method": method, "path": path}).encode()
+        headers = {"content-length": str(len(body))} if self.content_length else {}
+        return FakeAsyncResponse(self.status, body, headers)
+
+
+def client_for(request: FakeRequestContext, max_concurrency: int = 10) -> AsyncAPIClient:
+    return AsyncAPIClient(request, max_concurrency=max_concurrency, report_steps=False)
+
+
+@pytest.mark.unit
+@allure.feature("Async API Client")
+class TestConcurrency:
+    """Tests of the concurrency limit and the latency it leaves out."""
+
+    @allure.story("Concurrency")
+    @allure.title("No more than max_concurrency requests are in flight")
+    def test_concurrency_limit(self):
+        """
+        Given a client limited to 3 concurrent requests
+        When 12 calls are gathered
+        Then at most 3 are in flight at once
+        And the results come back in the order of the calls
+        """
+        # Arrange
+        request = FakeRequestContext()
+        client = client_for(request, max_concurrency=3)
+
+        # Act
+        async def run():
+            responses = await client.gather(*(client.call("GET", f"/item/{i}") for i in range(12)))
+            return [await parse_async_api_response(response) for response in responses]
+        results = asyncio.run(run())
+
+        # Assert
+        assert request.in_flight_max == 3
+        assert [result["path"] for result in results] == [f"/item/{i}" for i in range(12)]
+
+    @allure.story("Concurrency")
+    @allure.title("Latency does not include the wait for a concurrency slot")
+    def test_latency_excludes_queue_wait(self):
+        """
+        Given a client limited to 1 concurrent request
+        When 4 timed calls are gathered
+        Then the batch takes about 4 request times
+        But each call's latency is about one request time
+        """
+        # Arrange
+        delay = 0.05
+        client = client_for(FakeRequestContext(delay=delay), max_concurrency=1)
+
+        # Act
+        async def run():
+            return await client.gather(*(client.call_timed("GET", "/productsList") for _ in range(4)))
+        started = time.perf_counter()
+        results = asyncio.run(run())
+        elapsed = time.perf_counter() - started
+
+        # Assert
+        assert elapsed >= 4 * delay
+        latencies = [latency for _, latency in results]
+        assert all(delay <= latency < 2 * delay for latency in latencies), latencies
+        assert [call.latency for call in client.metrics.calls] == latencies
+
+
+@pytest.mark.unit
+@allure.feature("Async API Client")
+class TestMetrics:
+    """Tests of recording calls into APIMetrics."""
+
+    @allure.story("Metrics")
+    @allure.title("Calls are recorded by endpoint, status and body size")
+    @pytest.mark.parametrize("content_length", [True, False], ids=["content-length", "no-content-length"])
+    def test_calls_recorded(self, content_length: bool):
+        """
+        Given a client with its own metrics
+        When an endpoint method and a call with a query string are made
+        Then both are recorded under their method and path, without the query
+        And their size is the body size, with or without a Content-Length header
+        """
+        # Arrange
+        metrics = APIMetrics()
+        request = FakeRequestContext(status=201, content_length=content_length)
+        client = AsyncAPIClient(request, report_steps=False, metrics=metrics)
+
+        # Act
+        async def run():
+            first = await client.search_products("top")
+            second = await client.call("GET", "/getUserDetailByEmail?email=a@example.test")
+            return [len(await response.body()) for response in (first, second)]
+        sizes = asyncio.run(run())
+
+        # Assert
+        assert request.fetches[0] == ("POST", "/searchProduct", {"form": {"search_product": "top"}})
+        assert [(call.endpoint, call.status, call.size) for call in metrics.calls] == [
+            ("POST /searchProduct", 201, sizes[0]),
+            ("GET /getUserDetailByEmail", 201, sizes[1]),
+        ]
+
+
+@pytest.mark.unit
+@allure.feature("Async API Client")
+class TestErrors:
+    """Tests of failed requests."""
+
+    @allure.story("Errors")
+    @allure.title("A failed request is returned by gather(return_exceptions=True) and frees its slot")
+    def test_failed_request_in_batch(self):
+        """
+        Given a client limited to 1 concurrent request, and an endpoint that fails
+        When a batch including it is gathered with return_exceptions
+        Then its exception is returned in its position
+        And the requests after it still run and are recorded
+        """
+        # Arrange
+        request = FakeRequestContext(failing=("/brandsList",))
+        client = client_for(request, max_concurrency=1)
+
+        # Act
+        async def run():
+            return await client.gather(
+                client.get_all_products(),
+                client.get_all_brands(),
+                client.get_all_products(),
+                return_exceptions=True,
+            )
+        results = asyncio.run(run())
+
+        # Assert
+        assert isinstance(results[1], Error)
+        assert [response.status for response in (results[0], results[2])] == [200, 200]
+        assert [call.endpoint for call in client.metrics.calls] == ["GET /productsList"] * 2
+
+    @allure.story("Errors")
+    @allure.title("A failed request raises from gather by default")
+    def test_failed_request_raises(self):
+        """
+        Given an endpoint that fails
+        When a batch including it is gathered
+        Then its exception is raised
+        """
+        # Arrange
+        client = client_for(FakeRequestContext(failing=("/brandsList",)))
+
+        # Act & Assert
+        async def run():
+            return await client.gather(client.get_all_products(), client.get_all_brands())
+        with pytest.raises(Error, match="ECONNREFUSED"):
+            asyncio.run(run())
+
+    @allure.story("Errors")
+    @allure.title("An error status is returned, not raised")
+    def test_error_status_returned(self):
+        """
+        Given an API answering 500
+        When a call is made
+        Then the response is returned and recorded with its status
+        """
+        # Arrange
+        client = client_for(FakeRequestContext(status=500))
+
+        # Act
+        response = asyncio.run(client.verify_login({"email": "a@example.test", "password": "secret"}))
+
+        # Assert
+        assert response.status == 500
+        assert [(call.endpoint, call.status) for call in client.metrics.calls] == [("POST /verifyLogin", 500)]
+
+
+@pytest.mark.unit
+@allure.feature("Async API Client")
+class TestParseAsyncResponse:
+    """Tests of parse_async_api_response."""
+
+    @allure.story("Parsing")
+    @allure.title("A JSON body is decoded")
+    def test_valid_json(self):
+        """
+        Given an async response with a JSON body
+        When it is parsed
+        Then the decoded body is returned
+        """
+        # Arrange
+        response = FakeAsyncResponse(200, b'{"responseCode": 200, "message": "User exists!"}')
+
+        # Act
+        result = asyncio.run(parse_async_api_response(response))
+
+        # Assert
+        assert result == {"responseCode": 200, "message": "User exists!"}
+
+    @allure.story("Parsing")
+    @allure.title("A body that is not JSON raises ValueError with the body")
+    def test_invalid_json(self):
+        """
+        Given an async response with an HTML body
+        When it is parsed
+        Then ValueError is raised, quoting the body
+        """
+        # Arrange
+        response = FakeAsyncResponse(502, b"<html>Bad Gateway</html>")
+
+        # Act & Assert
+        with pytest.raises(ValueError, match="Invalid JSON response: <html>Bad Gateway</html>"):
+            asyncio.run(parse_async_api_response(response))
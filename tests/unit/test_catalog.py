@@ -0,0 +1,235 @@
+"""
+Product catalog unit tests.
+
+Tests cover:
+- Indexed lookups and price ranges
+- Reuse within the TTL and refetching after it
+- Revalidation of the on-disk copy with ETag (304 Not Modified)
+- Sharing the on-disk copy between caches (xdist workers)
+"""
+import json
+import threading
+import time
+from decimal import Decimal
+
+import pytest
+import allure
+
+from utils.catalog import CatalogCache, ProductCatalog
+
+
+def product(product_id: int, name: str, price: str, brand: str, category: str, usertype: str) -> dict:
+    return {
+        "id": product_id,
+        "name": name,
+        "price": price,
+        "brand": brand,
+        "category": {"usertype": {"usertype": usertype}, "category": category},
+    }
+
+
+PRODUCTS = [
+    product(1, "Blue Top", "Rs. 500", "Polo", "Tops", "Women"),
+    product(2, "Men Tshirt", "Rs. 400", "H&M", "Tshirts", "Men"),
+    product(3, "Pure Cotton V-Neck T-Shirt", "Rs. 1,299.50", "Biba", "Tshirts", "Men"),
+]
+
+
+class FakeResponse:
+    """Stand-in for Playwright's APIResponse."""
+
+    def __init__(self, status: int, body: dict | None = None, headers: dict | None = None):
+        self.status = status
+        self.headers = headers or {}
+        self._body = json.dumps(body).encode() if body is not None else b""
+
+    def body(self) -> bytes:
+        return self._body
+
+
+class FakeAPIClient:
+    """Serves /productsList, answering 304 to a matching If-None-Match."""
+
+    def __init__(self, products: list[dict], etag: str | None = None):
+        self.products = products
+        self.etag = etag
+        self.requests: list[dict | None] = []
+
+    @property
+    def base_url(self) -> str:
+        return "https://example.test/api"
+
+    def get_all_products(self, headers: dict = None) -> FakeResponse:
+        self.requests.append(headers)
+        if self.etag and (headers or {}).get("If-None-Match") == self.etag:
+            return FakeResponse(304, headers={"etag": self.etag})
+        body = {"responseCode": 200, "products": self.products}
+        return FakeResponse(200, body, {"etag": self.etag} if self.etag else {})
+
+
+@pytest.mark.unit
+@allure.feature("Product Catalog")
+class TestProductCatalog:
+    """Tests of ProductCatalog lookups."""
+
+    @allure.story("Lookups")
+    @allure.title("Products are found by id, name, brand, category and search term")
+    def test_lookups(self):
+        """
+        Given a catalog
+        When products are looked up by each index
+        Then the matching products are returned, case-insensitively
+        """
+        # Arrange
+        catalog = ProductCatalog(PRODUCTS)
+
+        # Act & Assert
+        assert len(catalog) == 3
+        assert catalog.by_id(2)["name"] == "Men Tshirt"
+        assert catalog.by_id(99) is None
+        assert catalog.by_name("blue top")["id"] == 1
+        assert [p["id"] for p in catalog.by_brand("POLO")] == [1]
+        assert [p["id"] for p in catalog.by_category("tshirts")] == [2, 3]
+        assert [p["id"] for p in catalog.by_category("Women")] == [1]
+        assert [p["id"] for p in catalog.search("t")] == [1, 2, 3]
+        assert catalog.by_brand("Unknown") == []
+
+    @allure.story("Lookups")
+    @allure.title("Prices parse as Decimals and ranges are sorted cheapest first")
+    def test_prices(self):
+        """
+        Given a catalog with a decimal, comma-grouped price
+        When products are filtered by price
+        Then the price is parsed exactly and matches are sorted by it
+        """
+        # Arrange
+        catalog = ProductCatalog(PRODUCTS)
+
+        # Act & Assert
+        assert ProductCatalog.price_of(PRODUCTS[2]) == Decimal("1299.50")
+        assert [p["id"] for p in catalog.priced_between(400, 1300)] == [2, 1, 3]
+        assert [p["id"] for p in catalog.priced_between(450, Decimal("1299.49"))] == [1]
+
+
+@pytest.mark.unit
+@allure.feature("Product Catalog")
+class TestCatalogCache:
+    """Tests of CatalogCache reuse, revalidation and sharing."""
+
+    @allure.story("TTL")
+    @allure.title("A catalog is reused within its TTL and fetched again after it")
+    @pytest.mark.parametrize("ttl, fetches", [(300, 1), (0, 3)])
+    def test_ttl(self, ttl: float, fetches: int):
+        """
+        Given a memory-only cache
+        When the catalog is requested three times
+        Then it is fetched once within the TTL, and every time once it has expired
+        """
+        # Arrange
+        cache = CatalogCache(ttl=ttl)
+        client = FakeAPIClient(PRODUCTS)
+
+        # Act
+        catalogs = [cache.get(client) for _ in range(3)]
+
+        # Assert
+        assert len(client.requests) == fetches
+        assert all(len(catalog) == 3 for catalog in catalogs)
+
+    @allure.story("Revalidation")
+    @allure.title("An expired on-disk copy is revalidated with its ETag")
+    def test_revalidates_with_etag(self, tmp_path):
+        """
+        Given an expired on-disk copy fetched with an ETag
+        When a new cache requests the catalog
+        Then it sends If-None-Match and keeps the stored products on 304
+        """
+        # Arrange
+        CatalogCache(ttl=0, cache_dir=tmp_path).get(FakeAPIClient(PRODUCTS, etag='"v1"'))
+        client = FakeAPIClient([], etag='"v1"')
+
+        # Act
+        catalog = CatalogCache(ttl=0, cache_dir=tmp_path).get(client)
+
+        # Assert
+        assert client.requests == [{"If-None-Match": '"v1"'}]
+        assert [p["id"] for p in catalog] == [1, 2, 3]
+
+    @allure.story("Revalidation")
+    @allure.title("A changed catalog replaces the on-disk copy")
+    def test_refetches_changed_catalog(self, tmp_path):
+        """
+        Given an expired on-disk copy whose ETag the server no longer has
+        When a new cache requests the catalog
+        Then the new products are returned
+        """
+        # Arrange
+        CatalogCache(ttl=0, cache_dir=tmp_path).get(FakeAPIClient(PRODUCTS, etag='"v1"'))
+
+        # Act
+        catalog = CatalogCache(ttl=0, cache_dir=tmp_path).get(FakeAPIClient(PRODUCTS[:1], etag='"v2"'))
+
+        # Assert
+        assert [p["id"] for p in catalog] == [1]
+
+    @allure.story("Shared Cache")
+    @allure.title("Caches sharing a directory fetch the catalog once")
+    def test_shares_disk_copy(self, tmp_path):
+        """
+        Given two caches over the same directory, as two xdist workers have
+        When both request the catalog within the TTL
+        Then only the first fetches it and the second reads the on-disk copy
+        """
+        # Arrange
+        first, second = FakeAPIClient(PRODUCTS), FakeAPIClient(PRODUCTS)
+
+        # Act
+        CatalogCache(cache_dir=tmp_path).get(first)
+        catalog = CatalogCache(cache_dir=tmp_path).get(second)
+
+        # Assert
+        assert (len(first.requests), len(second.requests)) == (1, 0)
+        assert catalog.by_name("Men Tshirt")["id"] == 2
+        assert [path.suffix for path in tmp_path.glob("catalog_*.json")] == [".json"]
+
+    @allure.story("Shared Cache")
+    @allure.title("Caches refreshing the disk copy at the same time fetch it once")
+    def test_concurrent_refresh(self, tmp_path):
+        """
+        Given several caches over the same directory and a slow server
+        When they all request the catalog at once
+        Then the file lock lets one fetch it while the others wait and read it
+        """
+        # Arrange
+        client = FakeAPIClient(PRODUCTS)
+        fetch = client.get_all_products
+        client.get_all_products = lambda headers=None: time.sleep(0.05) or fetch(headers)
+        workers = [
+            threading.Thread(target=CatalogCache(cache_dir=tmp_path).get, args=(client,)) for _ in range(4)
+        ]
+
+        # Act
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+
+        # Assert
+        assert len(client.requests) == 1
+
+    @allure.story("Errors")
+    @allure.title("An error response is not cached")
+    def test_error_response(self, tmp_path):
+        """
+        Given a server answering with an error responseCode
+        When the catalog is requested
+        Then RuntimeError is raised and nothing is written to disk
+        """
+        # Arrange
+        client = FakeAPIClient(PRODUCTS)
+        client.get_all_products = lambda headers=None: FakeResponse(200, {"responseCode": 500})
+
+        # Act & Assert
+        with pytest.raises(RuntimeError, match="Could not fetch product catalog"):
+            CatalogCache(cache_dir=tmp_path).get(client)
+        assert not list(tmp_path.glob("catalog_*.json"))
@@ -0,0 +1,97 @@
+"""
+Deferred, concurrent deletion of test accounts.
+
+Tests hand accounts to a session-level queue instead of deleting them in
+their own teardown. A background thread drains the queue through an
+AsyncAPIClient with bounded concurrency and retry/backoff; accounts that
+could not be deleted are reported when the queue is closed.
+"""
+import asyncio
+import concurrent.futures
+import threading
+
+from playwright.async_api import Error, async_playwright
+
+from utils.async_api_client import AsyncAPIClient
+from utils.helper import parse_async_api_response
+
+
+class AccountCleanupQueue:
+    """Delete accounts in the background via the /deleteAccount API."""
+
+    # responseCode values meaning the account no longer exists
+    DONE_CODES = (200, 404)
+
+    def __init__(self, max_concurrency: int = 4, retries: int = 3, backoff: float = 0.5):
+        self.max_concurrency = max_concurrency
+        self.retries = retries
+        self.backoff = backoff
+        self._pending: list[tuple[str, str, concurrent.futures.Future]] = []
+        self._start_lock = asyncio.Lock()
+        self._playwright = None
+        self._request = None
+        self._client = None
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(
+            target=self._loop.run_forever, name="account-cleanup", daemon=True
+        )
+        self._thread.start()
+
+    def enqueue(self, email: str, password: str) -> None:
+        """Schedule an account for deletion without waiting for it."""
+        future = asyncio.run_coroutine_threadsafe(self._delete(email, password), self._loop)
+        self._pending.append((email, password, future))
+
+    def close(self, timeout: float = 60) -> list[tuple[str, str]]:
+        """
+        Wait for scheduled deletions and stop the background thread.
+
+        Args:
+            timeout: Seconds to wait for the queue to drain.
+
+        Returns:
+            (email, password) of accounts that could not be deleted.
+        """
+        futures = [future for _, _, future in self._pending]
+        done, _ = concurrent.futures.wait(futures, timeout=timeout)
+        leaked = [
+            (email, password)
+            for email, password, future in self._pending
+            if future not in done or future.exception() or not future.result()
+        ]
+        try:
+            asyncio.run_coroutine_threadsafe(self._shutdown(), self._loop).result(timeout)
+        finally:
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread.join(timeout)
+        return leaked
+
+    async def _api_client(self) -> AsyncAPIClient:
+        async with self._start_lock:
+            if self._client is None:
+                self._playwright = await async_playwright().start()
+                self._request = await self._playwright.request.new_context()
+                # No Allure steps: deletions run outside of any test
+                self._client = AsyncAPIClient(
+                    self._request, self.max_concurrency, report_steps=False
+                )
+        return self._client
+
+    async def _delete(self, email: str, password: str) -> bool:
+        client = await self._api_client()
+        for attempt in range(self.retries):
+            try:
+                response = await client.delete_account(email, password)
+                body = await parse_async_api_response(response)
+                if body.get("responseCode") in self.DONE_CODES:
+                    return True
+            except (Error, ValueError):
+                pass
+            await asyncio.sleep(self.backoff * 2 ** attempt)
+        return False
+
+    async def _shutdown(self) -> None:
+        if self._request is not None:
+            await self._request.dispose()
+        if self._playwright is not None:
+            await self._playwright.stop()
@@ -0,0 +1,178 @@
+"""
+Pool of pre-registered accounts shared by xdist workers.
+
+Accounts are JSON files (APIClient.register_new_user form data) moving
+between three folders of a pool directory:
+- ready/   registered accounts waiting to be leased
+- leased/  accounts currently handed to a test
+- used/    released accounts waiting to be deleted
+
+Leasing is a single atomic rename, so workers never lock or wait on the
+network. A producer process keeps ready/ topped up, deletes used accounts
+and, once stopped, deletes everything left in the pool:
+
+    python -m utils.account_pool <pool_dir> --size 6
+"""
+import argparse
+import json
+import logging
+import os
+import shutil
+import time
+import uuid
+from pathlib import Path
+
+from playwright.sync_api import Error, sync_playwright
+
+from utils.api_client import APIClient
+from utils.config import configure_base_url
+from utils.constants import USER_DATA
+from utils.helper import parse_api_response
+
+
+logger = logging.getLogger(__name__)
+
+
+class AccountPool:
+    """File-based account pool; safe to use from any number of processes."""
+
+    READY = "ready"
+    LEASED = "leased"
+    USED = "used"
+    STOP_FILE = "stop"
+
+    def __init__(self, pool_dir: Path):
+        self.pool_dir = Path(pool_dir)
+        for folder in (self.READY, self.LEASED, self.USED):
+            (self.pool_dir / folder).mkdir(parents=True, exist_ok=True)
+
+    @staticmethod
+    def _file_name(account: dict) -> str:
+        return f"{account['email']}.json"
+
+    def add(self, account: dict) -> None:
+        """Publish a registered account as ready to lease."""
+        tmp_path = self.pool_dir / f".{uuid.uuid4().hex}.tmp"
+        tmp_path.write_text(json.dumps(account))
+        os.replace(tmp_path, self.pool_dir / self.READY / self._file_name(account))
+
+    def lease(self, timeout: float = 0) -> dict | None:
+        """
+        Take a ready account out of the pool.
+
+        Args:
+            timeout: Seconds to wait for the producer when the pool is empty.
+
+        Returns:
+            Account form data, or None if no account became ready in time.
+        """
+        deadline = time.monotonic() + timeout
+        while True:
+            for entry in os.scandir(self.pool_dir / self.READY):
+                leased_path = self.pool_dir / self.LEASED / entry.name
+                try:
+                    os.rename(entry.path, leased_path)
+                except FileNotFoundError:
+                    continue  # Another worker leased it first
+                return json.loads(leased_path.read_text())
+            if time.monotonic() >= deadline:
+                return None
+            time.sleep(0.1)
+
+    def release(self, account: dict, reusable: bool = False) -> None:
+        """
+        Hand a leased account back.
+
+        Args:
+            account: Account returned by `lease`.
+            reusable: Return it to ready/ instead of queueing it for deletion.
+        """
+        target = self.READY if reusable else self.USED
+        os.replace(
+            self.pool_dir / self.LEASED / self._file_name(account),
+            self.pool_dir / target / self._file_name(account),
+        )
+
+    def ready_count(self) -> int:
+        """Number of accounts waiting to be leased."""
+        return sum(1 for _ in os.scandir(self.pool_dir / self.READY))
+
+    def take(self, *folders: str) -> list[dict]:
+        """Remove and return all accounts from the given folders."""
+        accounts = []
+        for folder in folders:
+            for entry in os.scandir(self.pool_dir / folder):
+                path = Path(entry.path)
+                try:
+                    accounts.append(json.loads(path.read_text()))
+                    path.unlink()
+                except (FileNotFoundError, ValueError):
+                    continue
+        return accounts
+
+    def stop(self) -> None:
+        """Ask the producer to delete the remaining accounts and exit."""
+        (self.pool_dir / self.STOP_FILE).touch()
+
+    @property
+    def stop_requested(self) -> bool:
+        return (self.pool_dir / self.STOP_FILE).exists()
+
+
+def produce(pool: AccountPool, size: int, poll_interval: float = 0.2) -> None:
+    """
+    Keep `size` accounts ready until the pool is stopped, then empty it.
+
+    Args:
+        pool: Pool to fill.
+        size: Number of ready accounts to maintain.
+        poll_interval: Seconds to sleep when there is nothing to do.
+    """
+    with sync_playwright() as playwright:
+        request = playwright.request.new_context()
+        client = APIClient(request)
+
+        while not pool.stop_requested:
+            for account in pool.take(AccountPool.USED):
+                _delete(client, account)
+            if pool.ready_count() >= size:
+                time.sleep(poll_interval)
+                continue
+
+            try:
+                response, form_data = client.register_new_user(USER_DATA.get_new_user())
+                registered = parse_api_response(response).get("responseCode") == 201
+            except (Error, ValueError) as e:
+                logger.warning("Account pool registration failed: %s", e)
+                registered = False
+            if registered:
+                pool.add(form_data)
+            else:
+                time.sleep(poll_interval)
+
+        for account in pool.take(AccountPool.READY, AccountPool.LEASED, AccountPool.USED):
+            _delete(client, account)
+        request.dispose()
+    shutil.rmtree(pool.pool_dir, ignore_errors=True)
+
+
+def _delete(client: APIClient, account: dict) -> None:
+    try:
+        client.delete_account(account["email"], account["password"])
+    except Exception:
+        logger.warning("Could not delete pooled account %s", account["email"])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Account pool producer")
+    parser.add_argument("pool_dir", type=Path)
+    parser.add_argument("--size", type=int, default=6, help="Ready accounts to maintain")
+    parser.add_argument("--base-url", help="Register accounts on another deployment of the site")
+    args = parser.parse_args()
+    if args.base_url:
+        configure_base_url(args.base_url)
+    produce(AccountPool(args.pool_dir), args.size)
+
+
+if __name__ == "__main__":
+    main()
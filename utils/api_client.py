@@ -3,31 +3,80 @@ API client for automationexercise.com API interactions.
 
 This module provides a clean interface for API operations.
 Assertions are NOT included here - tests own their assertions.
+Every call's latency, status and response size is recorded into the
+client's APIMetrics, and with a SchemaRegistry its response is checked
+against the endpoint's contract.
 """
+import time
+import warnings
+
 from playwright.sync_api import APIRequestContext, APIResponse
 import allure
 
+from utils.api_metrics import APICall, APIMetrics, response_size
 from utils.constants import URLS, ADDRESS_DATA
+from utils.schemas import SchemaRegistry, SchemaViolationError, SchemaViolationWarning
 
 
 class APIClient:
     """Client for making API requests to Automation Exercise."""
     
-    BASE_URL = URLS.API_BASE_URL
-
-    def __init__(self, request: APIRequestContext):
+    def __init__(
+        self,
+        request: APIRequestContext,
+        metrics: APIMetrics = None,
+        schemas: SchemaRegistry = None,
+        on_violation: str = "warn",
+    ):
+        """
+        Args:
+            request: Request context the calls are made with.
+            metrics: Recorder of the calls; a new one when omitted.
+            schemas: Contracts responses are checked against; unchecked when omitted.
+            on_violation: "fail" raises SchemaViolationError from the call
+                that got a response breaking its contract, "warn" warns.
+        """
         self.request = request
+        self.metrics = metrics if metrics is not None else APIMetrics()
+        self.schemas = schemas
+        self.on_violation = on_violation
 
-    @allure.step("POST /createAccount - Register new user")
-    def register_new_user(self, user_data: dict) -> tuple[APIResponse, dict]:
-        """Register a new user via the API."""
+    @property
+    def base_url(self) -> str:
+        """API root of the configured site, read on every call."""
+        return URLS.API_BASE_URL
+
+    def _send(self, method: str, path: str, **kwargs) -> APIResponse:
+        """Make a request to an API path, record it under "METHOD /path" and check its contract."""
+        started = time.perf_counter()
+        response = self.request.fetch(f"{self.base_url}{path}", method=method, **kwargs)
+        latency = time.perf_counter() - started
+        endpoint = f"{method} {path.partition('?')[0]}"
+        self.metrics.record(APICall(endpoint, response.status, latency, response_size(response)))
+        # 304 Not Modified has no body to check
+        if self.schemas is not None and response.status != 304:
+            self._check_contract(endpoint, response)
+        return response
+
+    def _check_contract(self, endpoint: str, response: APIResponse) -> None:
+        violations = self.schemas.validate_response(endpoint, response)
+        if not violations:
+            return
+        message = f"{endpoint} response breaks its schema:\n" + "\n".join(violations)
+        if self.on_violation == "fail":
+            raise SchemaViolationError(message)
+        warnings.warn(SchemaViolationWarning(message))
+
+    @staticmethod
+    def build_registration_form(user_data: dict) -> dict:
+        """Build the /createAccount form for a user with the default address."""
         required_keys = ["email", "password", "name", "day", "month", "year"]
         missing = [k for k in required_keys if k not in user_data]
         if missing:
             raise ValueError(f"user_data missing required keys: {missing}")
         
         address = ADDRESS_DATA.DEFAULT
-        form_data = {
+        return {
             "name": user_data["name"],
             "email": user_data["email"],
             "password": user_data["password"],
@@ -46,28 +95,72 @@ class APIClient:
             "city": address["city"],
             "mobile_number": address["phone"],
         }
-        
-        response = self.request.post(f"{self.BASE_URL}/createAccount", form=form_data)
+
+    @allure.step("POST /createAccount - Register new user")
+    def register_new_user(self, user_data: dict) -> tuple[APIResponse, dict]:
+        """Register a new user via the API."""
+        form_data = self.build_registration_form(user_data)
+        response = self._send("POST", "/createAccount", form=form_data)
         return response, form_data
 
     @allure.step("GET /getUserDetailByEmail - Get user details by email")
     def get_user_details_by_email(self, email: str) -> APIResponse:
         """Get user details by email via the API."""
-        return self.request.get(f"{self.BASE_URL}/getUserDetailByEmail?email={email}")
+        return self._send("GET", f"/getUserDetailByEmail?email={email}")
 
     @allure.step("DELETE /deleteAccount - Delete user account")
     def delete_account(self, email: str, password: str) -> APIResponse:
         """Delete a user account via the API."""
         form_data = {"email": email, "password": password}
-        return self.request.delete(f"{self.BASE_URL}/deleteAccount", form=form_data)
+        return self._send("DELETE", "/deleteAccount", form=form_data)
     
     @allure.step("POST /verifyLogin - Verify user credentials")
     def verify_login(self, user_data: dict) -> APIResponse:
         """Verify user login credentials via the API."""
         form_data = {"email": user_data["email"], "password": user_data["password"]}
-        return self.request.post(f"{self.BASE_URL}/verifyLogin", form=form_data)
+        return self._send("POST", "/verifyLogin", form=form_data)
+
+    @allure.step("PUT /updateAccount - Update user account")
+    def update_account(self, form_data: dict) -> APIResponse:
+        """
+        Update a user account via the API.
+        
+        Args:
+            form_data: Registration form of the account (as returned by
+                register_new_user) with the changed fields.
+        """
+        return self._send("PUT", "/updateAccount", form=form_data)
 
     @allure.step("GET /productsList - Retrieve all products")
-    def get_all_products(self) -> APIResponse:
-        """Get all products from the API."""
-        return self.request.get(f"{self.BASE_URL}/productsList")
\ No newline at end of file
+    def get_all_products(self, headers: dict = None) -> APIResponse:
+        """
+        Get all products from the API.
+        
+        Args:
+            headers: Optional extra request headers (e.g. conditional request headers).
+        """
+        return self._send("GET", "/productsList", headers=headers)
+
+    @allure.step("GET /brandsList - Retrieve all brands")
+    def get_all_brands(self) -> APIResponse:
+        """Get all brands from the API."""
+        return self._send("GET", "/brandsList")
+
+    @allure.step("POST /searchProduct - Search products")
+    def search_products(self, term: str) -> APIResponse:
+        """Search products by name or category via the API."""
+        return self._send("POST", "/searchProduct", form={"search_product": term})
+
+    @allure.step("{method} {path}")
+    def call(self, method: str, path: str, form: dict = None, params: dict = None) -> APIResponse:
+        """
+        Make any request to the API, e.g. with an unsupported method or a
+        missing parameter.
+        
+        Args:
+            method: HTTP method.
+            path: Endpoint path, e.g. "/productsList".
+            form: Optional form fields.
+            params: Optional query parameters.
+        """
+        return self._send(method, path, form=form, params=params)
\ No newline at end of file
@@ -0,0 +1,180 @@
+"""
+Table-driven, concurrent runs of API cases.
+
+An endpoint matrix lists cases (method x path x payload x expected
+responseCode). APIMatrix runs a matrix concurrently through an
+AsyncAPIClient on a background event loop (the sync Playwright API cannot
+fan out requests) and reports each case's outcome and latency, attached to
+Allure as a table. A case's latency excludes the wait for a concurrency
+slot, and its call is recorded into the matrix's APIMetrics. Negative-method
+coverage and fast API-level equivalents of UI checks are written as matrices:
+
+    results = api_matrix.run(ENDPOINT_MATRIX)
+    failed = [result for result in results if not result.passed]
+"""
+import asyncio
+import threading
+import time
+import warnings
+from dataclasses import dataclass, field
+
+import allure
+from playwright.async_api import Error, async_playwright
+
+from utils.api_metrics import APIMetrics
+from utils.async_api_client import AsyncAPIClient
+from utils.helper import load_json
+from utils.schemas import SchemaRegistry, SchemaViolationWarning
+
+
+@dataclass(frozen=True)
+class APICase:
+    """One request and the response it must get."""
+    name: str
+    method: str
+    path: str
+    expected_code: int
+    form: dict | None = None
+    params: dict | None = None
+    expected_message: str | None = None
+
+    @property
+    def endpoint(self) -> str:
+        return f"{self.method} {self.path}"
+
+
+@dataclass(slots=True)
+class CaseResult:
+    """Outcome of one case; it passed when nothing is listed in problems."""
+    case: APICase
+    latency: float
+    response_code: int | None = None
+    problems: list[str] = field(default_factory=list)
+    # Schema violations that only warn
+    violations: list[str] = field(default_factory=list)
+
+    @property
+    def passed(self) -> bool:
+        return not self.problems
+
+
+def format_results(results: list[CaseResult]) -> str:
+    """Results as a text table, problems listed under their case."""
+    lines = [f"{'case':<40} {'endpoint':<28} {'expected':>8} {'got':>5} {'ms':>8}  result"]
+    for result in results:
+        case = result.case
+        lines.append(
+            f"{case.name:<40} {case.endpoint:<28} {case.expected_code:>8} "
+            f"{result.response_code if result.response_code is not None else '-':>5} "
+            f"{result.latency * 1000:>8.1f}  {'passed' if result.passed else 'FAILED'}"
+        )
+        lines.extend(f"    {problem}" for problem in result.problems)
+    return "\n".join(lines)
+
+
+class APIMatrix:
+    """Run API case matrices concurrently from synchronous tests."""
+
+    def __init__(
+        self,
+        max_concurrency: int = 10,
+        schemas: SchemaRegistry = None,
+        on_violation: str = "warn",
+        metrics: APIMetrics = None,
+    ):
+        """
+        Args:
+            max_concurrency: Maximum number of requests in flight at once.
+            schemas: Contracts responses are checked against; unchecked when omitted.
+            on_violation: "fail" fails the case of a response breaking its
+                contract, "warn" warns.
+            metrics: Recorder of the calls; a new one when omitted.
+        """
+        self.max_concurrency = max_concurrency
+        self.metrics = metrics if metrics is not None else APIMetrics()
+        self.schemas = schemas
+        self.on_violation = on_violation
+        self._start_lock = asyncio.Lock()
+        self._playwright = None
+        self._request = None
+        self._client = None
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, name="api-matrix", daemon=True)
+        self._thread.start()
+
+    def run(self, cases: list[APICase], timeout: float = 120) -> list[CaseResult]:
+        """
+        Run cases concurrently and attach their results to Allure.
+
+        Returns:
+            Results in the order of `cases`.
+        """
+        with allure.step(f"API matrix of {len(cases)} cases"):
+            results = asyncio.run_coroutine_threadsafe(self._run(cases), self._loop).result(timeout)
+            allure.attach(
+                format_results(results), name="API Matrix", attachment_type=allure.attachment_type.TEXT
+            )
+        violations = [
+            f"{result.case.name}: {violation}" for result in results for violation in result.violations
+        ]
+        if violations:
+            message = "API matrix responses break their schema:\n" + "\n".join(violations)
+            warnings.warn(SchemaViolationWarning(message))
+        return results
+
+    def close(self, timeout: float = 30) -> None:
+        """Dispose of the request context and stop the background thread."""
+        try:
+            asyncio.run_coroutine_threadsafe(self._shutdown(), self._loop).result(timeout)
+        finally:
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread.join(timeout)
+
+    async def _api_client(self) -> AsyncAPIClient:
+        async with self._start_lock:
+            if self._client is None:
+                self._playwright = await async_playwright().start()
+                self._request = await self._playwright.request.new_context()
+                # No Allure steps: the loop runs outside of the test's thread
+                self._client = AsyncAPIClient(
+                    self._request, self.max_concurrency, report_steps=False, metrics=self.metrics
+                )
+        return self._client
+
+    async def _run(self, cases: list[APICase]) -> list[CaseResult]:
+        client = await self._api_client()
+        return await client.gather(*(self._run_case(client, case) for case in cases))
+
+    async def _run_case(self, client: AsyncAPIClient, case: APICase) -> CaseResult:
+        started = time.perf_counter()
+        try:
+            response, latency = await client.call_timed(case.method, case.path, form=case.form, params=case.params)
+            body = await response.body()
+        except Error as e:
+            # Includes any wait for a slot: the request never completed
+            return CaseResult(case, time.perf_counter() - started, problems=[f"Request failed: {e}"])
+        result = CaseResult(case, latency)
+        try:
+            decoded = load_json(body)
+        except ValueError:
+            result.problems.append(f"Body is not JSON: {body[:200]!r}")
+            return result
+        if not isinstance(decoded, dict):
+            result.problems.append(f"Body is not an object: {decoded!r}")
+            return result
+
+        result.response_code = decoded.get("responseCode")
+        if result.response_code != case.expected_code:
+            result.problems.append(f"Expected responseCode {case.expected_code}, got {decoded}")
+        if case.expected_message is not None and decoded.get("message") != case.expected_message:
+            result.problems.append(f"Expected message {case.expected_message!r}, got {decoded.get('message')!r}")
+        if self.schemas is not None:
+            violations = self.schemas.validate(case.endpoint, decoded)
+            (result.problems if self.on_violation == "fail" else result.violations).extend(violations)
+        return result
+
+    async def _shutdown(self) -> None:
+        if self._request is not None:
+            await self._request.dispose()
+        if self._playwright is not None:
+            await self._playwright.stop()
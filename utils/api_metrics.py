@@ -0,0 +1,140 @@
+"""
+Latency and size metrics of API calls.
+
+APIClient records every call (endpoint, status, wall latency, response body
+size) into its APIMetrics. The api_client fixture gives each test its own:
+the per-endpoint summary is attached to Allure and the calls are merged
+into the session metrics (across xdist workers on the controller), written
+as JSON and CSV with --api-metrics. The session's calls over their latency
+budget are listed at its end, and fail the run with --api-budget-mode=fail.
+"""
+import csv
+import json
+import math
+from dataclasses import astuple, dataclass
+from pathlib import Path
+
+
+PERCENTILES = (50, 95, 99)
+
+
+@dataclass(frozen=True, slots=True)
+class APICall:
+    """One recorded API call."""
+    endpoint: str  # Method and path, e.g. "POST /verifyLogin"
+    status: int
+    latency: float  # Seconds
+    size: int  # Response body bytes
+
+
+def percentile(sorted_values: list[float], pct: float) -> float:
+    """Nearest-rank percentile of an ascending list."""
+    rank = max(math.ceil(pct / 100 * len(sorted_values)), 1)
+    return sorted_values[rank - 1]
+
+
+def response_size(response) -> int:
+    """Body size from Content-Length, reading the body only when the header is missing."""
+    length = response.headers.get("content-length")
+    return int(length) if length is not None else len(response.body())
+
+
+def parse_latency_budget(value: str) -> tuple[str, float]:
+    """
+    Parse an ENDPOINT=MS budget into (endpoint, seconds).
+
+    ENDPOINT is a method and path ("POST /verifyLogin"), a path for all
+    methods ("/productsList"), or "*" for every endpoint.
+    """
+    endpoint, _, milliseconds = value.rpartition("=")
+    if not endpoint or not milliseconds:
+        raise ValueError(f"Expected ENDPOINT=MS, got {value!r}")
+    return endpoint.strip(), float(milliseconds) / 1000
+
+
+def budget_for(endpoint: str, budgets: dict[str, float]) -> float | None:
+    """Most specific budget for an endpoint: exact, then path, then "*"."""
+    path = endpoint.partition(" ")[2]
+    for key in (endpoint, path, "*"):
+        if key in budgets:
+            return budgets[key]
+    return None
+
+
+class APIMetrics:
+    """Recorded API calls, summarized per endpoint."""
+
+    def __init__(self, calls: list[APICall] = None):
+        self.calls: list[APICall] = list(calls or [])
+
+    def record(self, call: APICall) -> None:
+        self.calls.append(call)
+
+    def extend(self, other: "APIMetrics") -> None:
+        self.calls.extend(other.calls)
+
+    def as_tuples(self) -> list[tuple]:
+        """Calls as plain tuples, e.g. to hand them from an xdist worker to the controller."""
+        return [astuple(call) for call in self.calls]
+
+    @classmethod
+    def from_tuples(cls, rows: list) -> "APIMetrics":
+        return cls([APICall(*row) for row in rows])
+
+    def summary(self) -> list[dict]:
+        """One row per endpoint: count, errors (HTTP >= 400), latency percentiles in ms and mean size."""
+        by_endpoint: dict[str, list[APICall]] = {}
+        for call in self.calls:
+            by_endpoint.setdefault(call.endpoint, []).append(call)
+        rows = []
+        for endpoint, calls in sorted(by_endpoint.items()):
+            latencies = sorted(call.latency for call in calls)
+            row = {
+                "endpoint": endpoint,
+                "count": len(calls),
+                "errors": sum(1 for call in calls if call.status >= 400),
+            }
+            for pct in PERCENTILES:
+                row[f"p{pct}_ms"] = round(percentile(latencies, pct) * 1000, 1)
+            row["max_ms"] = round(latencies[-1] * 1000, 1)
+            row["mean_bytes"] = round(sum(call.size for call in calls) / len(calls))
+            rows.append(row)
+        return rows
+
+    def format_summary(self) -> str:
+        """Summary as a text table."""
+        header = f"{'endpoint':<36} {'count':>6} {'errors':>6}" + "".join(
+            f" {f'p{pct} ms':>9}" for pct in PERCENTILES
+        ) + f" {'max ms':>9} {'bytes':>9}"
+        lines = [header]
+        for row in self.summary():
+            lines.append(
+                f"{row['endpoint']:<36} {row['count']:>6} {row['errors']:>6}"
+                + "".join(f" {row[f'p{pct}_ms']:>9.1f}" for pct in PERCENTILES)
+                + f" {row['max_ms']:>9.1f} {row['mean_bytes']:>9}"
+            )
+        return "\n".join(lines)
+
+    def over_budget(self, budgets: dict[str, float]) -> list[str]:
+        """Descriptions of the calls slower than their endpoint's budget."""
+        violations = []
+        for call in self.calls:
+            budget = budget_for(call.endpoint, budgets)
+            if budget is not None and call.latency > budget:
+                violations.append(
+                    f"{call.endpoint} took {call.latency * 1000:.0f} ms (budget {budget * 1000:.0f} ms)"
+                )
+        return violations
+
+    def write(self, path: str | Path) -> None:
+        """Write the summary to path with .json and .csv suffixes."""
+        rows = self.summary()
+        path = Path(path)
+        with open(path.with_suffix(".json"), "w") as f:
+            json.dump(rows, f, indent=2)
+            f.write("\n")
+        if rows:
+            with open(path.with_suffix(".csv"), "w", newline="") as f:
+                writer = csv.DictWriter(f, fieldnames=list(rows[0]))
+                writer.writeheader()
+                writer.writerows(rows)
@@ -0,0 +1,154 @@
+"""
+Typed records decoded from API responses.
+
+The body is read once as bytes. Full decodes go through
+utils.helper.decode_response (orjson when installed), which reuses a body
+APIClient already decoded to check its schema. iter_products walks the products
+array one entry at a time instead, so a search can stop at its match
+without decoding, or holding, the rest of a large catalog.
+"""
+import json
+import re
+from dataclasses import dataclass, fields
+from decimal import Decimal
+from typing import Iterator
+
+from utils.helper import decode_response, parse_price
+
+
+_decoder = json.JSONDecoder()
+_whitespace = re.compile(r"[ \t\n\r]*")
+_products_array = re.compile(r'"products"\s*:\s*\[')
+
+
+# Not frozen: frozen dataclasses construct about three times slower, which
+# shows when decoding a whole catalog
+@dataclass(slots=True)
+class Product:
+    """A /productsList entry."""
+    id: int
+    name: str
+    price: Decimal
+    brand: str
+    category: str
+    usertype: str
+
+    @classmethod
+    def from_json(cls, data: dict) -> "Product":
+        """
+        Validate and convert a decoded product.
+
+        Raises:
+            ValueError: If a field is missing or has the wrong type.
+        """
+        try:
+            category = data["category"]
+            product = cls(
+                id=data["id"],
+                name=data["name"],
+                price=parse_price(data["price"]),
+                brand=data["brand"],
+                category=category["category"],
+                usertype=category["usertype"]["usertype"],
+            )
+        except (KeyError, TypeError) as e:
+            raise ValueError(f"Invalid product, {type(e).__name__} {e}: {data!r}") from e
+        if not (
+            isinstance(product.id, int) and isinstance(product.name, str) and isinstance(product.brand, str)
+            and isinstance(product.category, str) and isinstance(product.usertype, str)
+        ):
+            raise ValueError(f"Invalid product, wrong field type: {data!r}")
+        return product
+
+
+@dataclass(slots=True)
+class User:
+    """The user of a /getUserDetailByEmail response."""
+    id: int
+    name: str
+    email: str
+    title: str = ""
+    birth_day: str = ""
+    birth_month: str = ""
+    birth_year: str = ""
+    first_name: str = ""
+    last_name: str = ""
+    company: str = ""
+    address1: str = ""
+    address2: str = ""
+    country: str = ""
+    state: str = ""
+    city: str = ""
+    zipcode: str = ""
+
+    @classmethod
+    def from_json(cls, data: dict) -> "User":
+        """
+        Validate and convert a decoded user; fields the record lacks are ignored.
+
+        Raises:
+            ValueError: If id, name or email is missing or a field has the wrong type.
+        """
+        missing = [key for key in ("id", "name", "email") if key not in data]
+        if missing:
+            raise ValueError(f"Invalid user, missing {missing}: {data!r}")
+        user = cls(**{field.name: data[field.name] for field in fields(cls) if field.name in data})
+        if not isinstance(user.id, int) or not all(
+            isinstance(getattr(user, field.name), str) for field in fields(cls)[1:]
+        ):
+            raise ValueError(f"Invalid user, wrong field type: {data!r}")
+        return user
+
+
+def decode_products(response) -> list[Product]:
+    """
+    Decode the products of a /productsList response into records.
+
+    Raises:
+        ValueError: If the body is not JSON, has no products or a product is invalid.
+    """
+    body = decode_response(response)
+    if not isinstance(body, dict) or not isinstance(body.get("products"), list):
+        raise ValueError(f"No products in response: {body!r}")
+    return [Product.from_json(product) for product in body["products"]]
+
+
+def iter_products(response) -> Iterator[Product]:
+    """
+    Lazily decode the products of a /productsList response.
+
+    Entries are decoded and validated as they are reached, so breaking out
+    early skips the rest of the array.
+
+    Raises:
+        ValueError: If the body has no products array or an entry is invalid.
+    """
+    text = response.body().decode()
+    match = _products_array.search(text)
+    if match is None:
+        raise ValueError(f"No products array in response: {text[:200]!r}")
+    position = _whitespace.match(text, match.end()).end()
+    if text.startswith("]", position):
+        return
+    while True:
+        product, position = _decoder.raw_decode(text, position)
+        yield Product.from_json(product)
+        position = _whitespace.match(text, position).end()
+        if text.startswith("]", position):
+            return
+        if not text.startswith(",", position):
+            raise ValueError(f"Malformed products array at offset {position}")
+        position = _whitespace.match(text, position + 1).end()
+
+
+def decode_user(response) -> User:
+    """
+    Decode the user of a /getUserDetailByEmail response.
+
+    Raises:
+        ValueError: If the body is not JSON, has no user or the user is invalid.
+    """
+    body = decode_response(response)
+    if not isinstance(body, dict) or not isinstance(body.get("user"), dict):
+        raise ValueError(f"No user in response: {body!r}")
+    return User.from_json(body["user"])
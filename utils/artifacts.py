@@ -0,0 +1,75 @@
+"""
+Failure artifacts for the Allure report.
+
+pytest-playwright already keeps a failed test's screenshots, videos and
+traces (--screenshot, --video, --tracing) once its context is closed and the
+video is written, and lists their paths on the teardown report.
+attach_report_artifacts() attaches those files to Allure by path: no second
+screenshot, no waiting for the video and no file read into memory.
+
+Pooled browser contexts (--context-pool) are not created by pytest-playwright,
+so the context fixture captures their screenshots with
+attach_page_screenshots(). They are only used without video and tracing.
+"""
+import hashlib
+from pathlib import Path
+
+import allure
+from playwright.sync_api import Error, Page
+
+
+# Teardown report user property -> Allure attachment name and type
+REPORT_ARTIFACTS = {
+    "playwright_screenshot": ("Failure Screenshot", allure.attachment_type.PNG),
+    "playwright_video": ("Failure Video", allure.attachment_type.WEBM),
+    "playwright_trace": ("Trace", allure.attachment_type.ZIP),
+}
+
+
+def _digest(path: Path) -> bytes:
+    with open(path, "rb") as f:
+        return hashlib.file_digest(f, "sha1").digest()
+
+
+def attach_report_artifacts(report, invocation_dir: Path) -> None:
+    """
+    Attach the artifacts pytest-playwright kept for a test to Allure.
+
+    Identical screenshots (e.g. several pages showing the same error page)
+    are attached once.
+
+    Args:
+        report: Teardown report of the test.
+        invocation_dir: Directory pytest was started from; relative artifact
+            paths are resolved against it.
+    """
+    screenshots = set()
+    for prop, value in report.user_properties:
+        if prop not in REPORT_ARTIFACTS:
+            continue
+        path = Path(invocation_dir, value)
+        if not path.is_file():
+            continue
+        if prop == "playwright_screenshot":
+            digest = _digest(path)
+            if digest in screenshots:
+                continue
+            screenshots.add(digest)
+        name, attachment_type = REPORT_ARTIFACTS[prop]
+        allure.attach.file(str(path), name=name, attachment_type=attachment_type)
+
+
+def attach_page_screenshots(pages: list[Page], output_dir: Path) -> None:
+    """Screenshot open pages into output_dir and attach them, identical ones once."""
+    screenshots = set()
+    for index, page in enumerate(pages):
+        path = output_dir / f"screenshot-{index + 1}.png"
+        try:
+            page.screenshot(path=path, timeout=5000)
+        except Error:
+            continue  # Page crashed or already closed
+        digest = _digest(path)
+        if digest not in screenshots:
+            screenshots.add(digest)
+            allure.attach.file(str(path), name="Failure Screenshot", attachment_type=allure.attachment_type.PNG)
+
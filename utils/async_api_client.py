@@ -0,0 +1,175 @@
+"""
+Async API client for automationexercise.com API interactions.
+
+Same surface as APIClient, built on playwright.async_api so one worker can
+fan out many requests at once. Assertions are NOT included here - tests
+own their assertions. Calls are recorded into the client's APIMetrics,
+timed from the moment a concurrency slot is free, so waiting for one is
+not counted as latency.
+"""
+import asyncio
+import time
+from contextvars import ContextVar
+from functools import wraps
+from typing import Any, Awaitable
+
+from playwright.async_api import APIRequestContext, APIResponse
+import allure
+
+from utils.api_client import APIClient
+from utils.api_metrics import APICall, APIMetrics
+from utils.constants import URLS
+
+
+# Set while a batch runs so its requests don't report as nested steps
+_in_batch: ContextVar[bool] = ContextVar("in_batch", default=False)
+
+
+def async_step(title: str):
+    """
+    Report a coroutine method as an Allure step.
+
+    allure.step only wraps synchronous callables, so the step would close
+    before the request is awaited.
+    """
+    def decorator(func):
+        @wraps(func)
+        async def wrapper(self, *args, **kwargs):
+            if not self.report_steps or _in_batch.get():
+                return await func(self, *args, **kwargs)
+            with allure.step(title):
+                return await func(self, *args, **kwargs)
+        return wrapper
+    return decorator
+
+
+class AsyncAPIClient:
+    """Async client for making API requests to Automation Exercise."""
+
+    def __init__(
+        self,
+        request: APIRequestContext,
+        max_concurrency: int = 10,
+        report_steps: bool = True,
+        metrics: APIMetrics = None,
+    ):
+        """
+        Args:
+            request: Async Playwright request context.
+            max_concurrency: Maximum number of requests in flight at once.
+            report_steps: Report calls as Allure steps; disable when used
+                outside of a test (e.g. from a background thread).
+            metrics: Recorder of the calls; a new one when omitted.
+        """
+        self.request = request
+        self.report_steps = report_steps
+        self.metrics = metrics if metrics is not None else APIMetrics()
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+
+    @property
+    def base_url(self) -> str:
+        """API root of the configured site, read on every call."""
+        return URLS.API_BASE_URL
+
+    async def _send(self, method: str, path: str, **kwargs) -> APIResponse:
+        response, _ = await self._send_timed(method, path, **kwargs)
+        return response
+
+    async def _send_timed(self, method: str, path: str, **kwargs) -> tuple[APIResponse, float]:
+        """Make a request once a slot is free, record it and return it with its latency."""
+        async with self._semaphore:
+            started = time.perf_counter()
+            response = await self.request.fetch(f"{self.base_url}{path}", method=method, **kwargs)
+            latency = time.perf_counter() - started
+        # response_size reads the body synchronously, which the async API cannot
+        length = response.headers.get("content-length")
+        size = int(length) if length is not None else len(await response.body())
+        self.metrics.record(APICall(f"{method} {path.partition('?')[0]}", response.status, latency, size))
+        return response, latency
+
+    @async_step("POST /createAccount - Register new user")
+    async def register_new_user(self, user_data: dict) -> tuple[APIResponse, dict]:
+        """Register a new user via the API."""
+        form_data = APIClient.build_registration_form(user_data)
+        response = await self._send("POST", "/createAccount", form=form_data)
+        return response, form_data
+
+    @async_step("GET /getUserDetailByEmail - Get user details by email")
+    async def get_user_details_by_email(self, email: str) -> APIResponse:
+        """Get user details by email via the API."""
+        return await self._send("GET", "/getUserDetailByEmail", params={"email": email})
+
+    @async_step("DELETE /deleteAccount - Delete user account")
+    async def delete_account(self, email: str, password: str) -> APIResponse:
+        """Delete a user account via the API."""
+        form_data = {"email": email, "password": password}
+        return await self._send("DELETE", "/deleteAccount", form=form_data)
+
+    @async_step("POST /verifyLogin - Verify user credentials")
+    async def verify_login(self, user_data: dict) -> APIResponse:
+        """Verify user login credentials via the API."""
+        form_data = {"email": user_data["email"], "password": user_data["password"]}
+        return await self._send("POST", "/verifyLogin", form=form_data)
+
+    @async_step("PUT /updateAccount - Update user account")
+    async def update_account(self, form_data: dict) -> APIResponse:
+        """Update a user account via the API (see APIClient.update_account)."""
+        return await self._send("PUT", "/updateAccount", form=form_data)
+
+    @async_step("GET /productsList - Retrieve all products")
+    async def get_all_products(self) -> APIResponse:
+        """Get all products from the API."""
+        return await self._send("GET", "/productsList")
+
+    @async_step("GET /brandsList - Retrieve all brands")
+    async def get_all_brands(self) -> APIResponse:
+        """Get all brands from the API."""
+        return await self._send("GET", "/brandsList")
+
+    @async_step("POST /searchProduct - Search products")
+    async def search_products(self, term: str) -> APIResponse:
+        """Search products by name or category via the API."""
+        return await self._send("POST", "/searchProduct", form={"search_product": term})
+
+    async def call(self, method: str, path: str, form: dict = None, params: dict = None) -> APIResponse:
+        """Make any request to the API (see APIClient.call)."""
+        response, _ = await self.call_timed(method, path, form=form, params=params)
+        return response
+
+    async def call_timed(
+        self, method: str, path: str, form: dict = None, params: dict = None
+    ) -> tuple[APIResponse, float]:
+        """
+        Make any request to the API, like call.
+
+        Returns:
+            The response and its latency in seconds, without the time spent
+            waiting for a concurrency slot.
+        """
+        if not self.report_steps or _in_batch.get():
+            return await self._send_timed(method, path, form=form, params=params)
+        with allure.step(f"{method} {path}"):
+            return await self._send_timed(method, path, form=form, params=params)
+
+    async def gather(self, *calls: Awaitable, return_exceptions: bool = False) -> list[Any]:
+        """
+        Run client calls concurrently, bounded by max_concurrency.
+
+        The batch is reported as a single Allure step.
+
+        Usage:
+            responses = await client.gather(
+                *(client.verify_login(user) for user in users)
+            )
+
+        Returns:
+            Results in the order of `calls`.
+        """
+        token = _in_batch.set(True)
+        try:
+            if not self.report_steps:
+                return await asyncio.gather(*calls, return_exceptions=return_exceptions)
+            with allure.step(f"Batch of {len(calls)} API requests"):
+                return await asyncio.gather(*calls, return_exceptions=return_exceptions)
+        finally:
+            _in_batch.reset(token)
@@ -0,0 +1,128 @@
+"""
+Authenticated session helpers.
+
+- AuthStateCache: logs in through the UI once, persists cookies/localStorage
+  to disk and lets fixtures seed new browser contexts from the saved state
+  instead of driving the login form in every test.
+- login_with_form_post: logs a context in by posting the login form through
+  its request API, without rendering any page.
+"""
+import json
+import re
+import time
+from contextlib import nullcontext
+from pathlib import Path
+
+from filelock import FileLock
+from playwright.sync_api import Browser, BrowserContext
+
+from pages.auth_page import AuthPage
+
+
+CSRF_TOKEN_PATTERN = re.compile(r'name="csrfmiddlewaretoken" value="([^"]+)"')
+
+
+class AuthStateCache:
+    """
+    Disk-backed cache of a logged-in storage state for a single user.
+
+    Worker-scoped by default. With ``shared=True`` the state file lives in a
+    directory common to all xdist workers and every read and write holds a
+    file lock, so only one worker performs the login and no worker reads the
+    file while another one replaces or removes it.
+    """
+
+    MAX_AGE_SECONDS = 30 * 60
+    EXPIRY_MARGIN_SECONDS = 60
+
+    def __init__(self, state_dir: Path, user_data: dict, shared: bool = False):
+        self.user_data = user_data
+        file_name = "auth_state_" + user_data["email"].replace("@", "_at_") + ".json"
+        self.path = Path(state_dir) / file_name
+        self._lock = FileLock(f"{self.path}.lock") if shared else nullcontext()
+
+    def get(self, browser: Browser, context_args: dict = None) -> dict:
+        """
+        Return a valid storage state, logging in if needed.
+
+        The state is read while holding the lock, so it cannot be removed
+        by another worker between the check and the read.
+
+        Args:
+            browser: Browser used to create the one-off login context.
+            context_args: Context options the tests run with (base_url, viewport...).
+
+        Returns:
+            Storage state to pass as a new context's storage_state.
+        """
+        with self._lock:
+            state = self._load()
+            if state is None:
+                state = self._login(browser, context_args or {})
+        return state
+
+    def is_valid(self) -> bool:
+        """Check the state file exists, is fresh and holds no expired cookies."""
+        return self._load() is not None
+
+    def _load(self) -> dict | None:
+        """Read the state file, or None when it is missing, stale or holds expired cookies."""
+        try:
+            if time.time() - self.path.stat().st_mtime > self.MAX_AGE_SECONDS:
+                return None
+            state = json.loads(self.path.read_text())
+        except (OSError, ValueError):
+            return None
+        deadline = time.time() + self.EXPIRY_MARGIN_SECONDS
+        # Session cookies are stored with expires == -1
+        cookies = state.get("cookies", [])
+        if all(c.get("expires", -1) <= 0 or c["expires"] > deadline for c in cookies):
+            return state
+        return None
+
+    def invalidate(self) -> None:
+        """Drop the cached state so the next `get` logs in again."""
+        with self._lock:
+            self.path.unlink(missing_ok=True)
+
+    def save(self, context: BrowserContext) -> None:
+        """Persist the storage state of an already logged-in context."""
+        with self._lock:
+            context.storage_state(path=self.path)
+
+    def _login(self, browser: Browser, context_args: dict) -> dict:
+        """Log in through the UI in a throwaway context, persist its state and return it."""
+        context = browser.new_context(**context_args)
+        try:
+            auth_page = AuthPage(context.new_page())
+            auth_page.navigate_to_auth_page()
+            auth_page.fill_login_form(self.user_data)
+            auth_page.user_account_name.wait_for()
+            return context.storage_state(path=self.path)
+        finally:
+            context.close()
+
+
+def login_with_form_post(context: BrowserContext, user_data: dict) -> None:
+    """
+    Log a browser context in by submitting the login form over HTTP.
+    
+    The context's request API shares its cookie jar, so pages opened
+    afterwards are authenticated without a login page render.
+    
+    Args:
+        context: Browser context to authenticate.
+        user_data: Dict with 'email' and 'password' keys.
+    
+    Raises:
+        RuntimeError: If the server does not accept the credentials.
+    """
+    login_url = AuthPage.URL
+    form_data = {"email": user_data["email"], "password": user_data["password"]}
+    match = CSRF_TOKEN_PATTERN.search(context.request.get(login_url).text())
+    if match:
+        form_data["csrfmiddlewaretoken"] = match.group(1)
+    
+    response = context.request.post(login_url, form=form_data, headers={"Referer": login_url})
+    if "Logged in as" not in response.text():
+        raise RuntimeError(f"Form login failed for {user_data['email']} (HTTP {response.status})")
@@ -0,0 +1,161 @@
+"""
+Product catalog cache for /productsList.
+
+The catalog is fetched and decoded once per worker, kept for a TTL and
+exposed through indexed lookups so data-driven tests can pick products by
+id, name, brand, category or price without fetching it again. An optional
+on-disk copy, keyed by API base URL, is shared by xdist workers and
+revalidated with ETag/Last-Modified when the server provides them; a
+file lock per base URL lets one worker refresh it while the others wait.
+"""
+import hashlib
+import json
+import os
+import time
+import uuid
+from contextlib import nullcontext
+from decimal import Decimal
+from pathlib import Path
+
+from filelock import FileLock
+
+from utils.api_client import APIClient
+from utils.helper import parse_api_response, parse_price
+
+
+class ProductCatalog:
+    """Indexed, read-only view of the product list."""
+
+    def __init__(self, products: list[dict]):
+        self.products = products
+        self._by_id = {p["id"]: p for p in products}
+        self._by_name = {p["name"].lower(): p for p in products}
+        self._by_brand: dict[str, list[dict]] = {}
+        self._by_category: dict[str, list[dict]] = {}
+        for product in products:
+            self._by_brand.setdefault(product["brand"].lower(), []).append(product)
+            category = product["category"]
+            for key in (category["category"], category["usertype"]["usertype"]):
+                self._by_category.setdefault(key.lower(), []).append(product)
+
+    def __len__(self) -> int:
+        return len(self.products)
+
+    def __iter__(self):
+        return iter(self.products)
+
+    @staticmethod
+    def price_of(product: dict) -> Decimal:
+        """Numeric price of a product ('Rs. 500' -> Decimal('500'))."""
+        return parse_price(product["price"])
+
+    def by_id(self, product_id: int) -> dict | None:
+        return self._by_id.get(product_id)
+
+    def by_name(self, name: str) -> dict | None:
+        """Product with exactly this name (case-insensitive)."""
+        return self._by_name.get(name.lower())
+
+    def by_brand(self, brand: str) -> list[dict]:
+        return self._by_brand.get(brand.lower(), [])
+
+    def by_category(self, category: str) -> list[dict]:
+        """Products of a category ('Tops') or user type ('Women')."""
+        return self._by_category.get(category.lower(), [])
+
+    def search(self, term: str) -> list[dict]:
+        """Products whose name contains the term (case-insensitive)."""
+        term = term.lower()
+        return [p for p in self.products if term in p["name"].lower()]
+
+    def priced_between(self, low: int | Decimal, high: int | Decimal) -> list[dict]:
+        """Products priced within [low, high], cheapest first."""
+        matches = [p for p in self.products if low <= self.price_of(p) <= high]
+        return sorted(matches, key=self.price_of)
+
+
+class CatalogCache:
+    """Per-worker catalog cache with an optional on-disk copy shared by workers."""
+
+    def __init__(self, ttl: float = 300, cache_dir: Path | None = None):
+        """
+        Args:
+            ttl: Seconds a fetched catalog is used without asking the server.
+            cache_dir: Directory of the shared on-disk cache; memory only if None.
+        """
+        self.ttl = ttl
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        self._entries: dict[str, tuple[float, ProductCatalog]] = {}
+
+    def get(self, api_client: APIClient) -> ProductCatalog:
+        """Return a fresh catalog, fetching or revalidating it when expired."""
+        base_url = api_client.base_url
+        entry = self._entries.get(base_url)
+        if entry and time.time() - entry[0] < self.ttl:
+            return entry[1]
+
+        # Held from the freshness check to the write, so an expired copy is
+        # refreshed by one worker and read by the others
+        with self._lock(base_url):
+            stored = self._read(base_url)
+            if not stored or time.time() - stored["fetched_at"] >= self.ttl:
+                stored = self._fetch(api_client, stored)
+                self._write(base_url, stored)
+        return self._remember(base_url, stored["fetched_at"], stored["products"])
+
+    def _remember(self, base_url: str, fetched_at: float, products: list[dict]) -> ProductCatalog:
+        catalog = ProductCatalog(products)
+        self._entries[base_url] = (fetched_at, catalog)
+        return catalog
+
+    def _fetch(self, api_client: APIClient, stored: dict | None) -> dict:
+        """Fetch the catalog, revalidating the stored copy if there is one."""
+        headers = {}
+        if stored and stored.get("etag"):
+            headers["If-None-Match"] = stored["etag"]
+        if stored and stored.get("last_modified"):
+            headers["If-Modified-Since"] = stored["last_modified"]
+
+        response = api_client.get_all_products(headers=headers or None)
+        if response.status == 304 and stored:
+            return {**stored, "fetched_at": time.time()}
+
+        body = parse_api_response(response)
+        if body.get("responseCode") != 200:
+            raise RuntimeError(f"Could not fetch product catalog: {body}")
+        return {
+            "fetched_at": time.time(),
+            "etag": response.headers.get("etag"),
+            "last_modified": response.headers.get("last-modified"),
+            "products": body["products"],
+        }
+
+    def _path(self, base_url: str) -> Path | None:
+        if self.cache_dir is None:
+            return None
+        key = hashlib.sha1(base_url.encode()).hexdigest()[:12]
+        return self.cache_dir / f"catalog_{key}.json"
+
+    def _lock(self, base_url: str) -> FileLock | nullcontext:
+        path = self._path(base_url)
+        if path is None:
+            return nullcontext()
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        return FileLock(f"{path}.lock")
+
+    def _read(self, base_url: str) -> dict | None:
+        path = self._path(base_url)
+        if path is None or not path.exists():
+            return None
+        try:
+            return json.loads(path.read_text())
+        except (OSError, ValueError):
+            return None
+
+    def _write(self, base_url: str, stored: dict) -> None:
+        path = self._path(base_url)
+        if path is None:
+            return
+        tmp_path = path.with_suffix(f".{uuid.uuid4().hex}.tmp")
+        tmp_path.write_text(json.dumps(stored))
+        os.replace(tmp_path, path)
@@ -0,0 +1,44 @@
+"""
+Environment configuration, resolved once per session.
+
+The suite targets the public site unless pointed elsewhere. In order of precedence:
+1. --local-site (the bundled stand-in, see local_site/server.py)
+2. --base-url, the base_url ini value or PYTEST_BASE_URL (pytest-playwright option)
+3. APP_BASE_URL environment variable
+4. https://automationexercise.com/
+
+The resolved URL is applied to URLS, which page objects and API clients
+read on every navigation/request.
+"""
+import os
+
+import pytest
+
+from utils.constants import URLS
+
+
+BASE_URL_ENV_VAR = "APP_BASE_URL"
+
+
+def resolve_base_url(config: pytest.Config) -> str:
+    """
+    Resolve the base URL of the site under test from options and environment.
+
+    Args:
+        config: Pytest config of the controller process.
+
+    Returns:
+        Base URL with a trailing slash.
+    """
+    base_url = (
+        config.getoption("--base-url", None)
+        or config.getini("base_url")
+        or os.environ.get(BASE_URL_ENV_VAR)
+        or URLS.BASE_URL
+    )
+    return base_url.rstrip("/") + "/"
+
+
+def configure_base_url(base_url: str) -> None:
+    """Point URLS, and through it all page objects and API clients, at base_url."""
+    URLS.rebase(base_url)
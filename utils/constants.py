@@ -2,14 +2,27 @@ from utils.helper import get_unique_email
 
 
 class URLS:
-    """Application URLs."""
+    """Application URLs, rebased at startup onto the configured site (see utils/config.py)."""
     BASE_URL = "https://automationexercise.com/"
-    API_BASE_URL = "https://automationexercise.com/api"
-    PRODUCTS_URL = "https://automationexercise.com/products"
-    CART_URL = "https://automationexercise.com/view_cart"
-    CHECKOUT_URL = "https://automationexercise.com/checkout"
-    PAYMENT_URL = "https://automationexercise.com/payment"
-    CONTACT_US_URL = "https://automationexercise.com/contact_us"
+    API_BASE_URL = BASE_URL + "api"
+    PRODUCTS_URL = BASE_URL + "products"
+    CART_URL = BASE_URL + "view_cart"
+    CHECKOUT_URL = BASE_URL + "checkout"
+    PAYMENT_URL = BASE_URL + "payment"
+    CONTACT_US_URL = BASE_URL + "contact_us"
+
+    @classmethod
+    def rebase(cls, base_url: str) -> None:
+        """
+        Point every URL at another deployment of the site.
+        
+        Args:
+            base_url: Root URL of the deployment, e.g. the local stand-in site.
+        """
+        old_base, new_base = cls.BASE_URL, base_url.rstrip("/") + "/"
+        for name, value in list(vars(cls).items()):
+            if name.endswith("URL") and isinstance(value, str) and value.startswith(old_base):
+                setattr(cls, name, new_base + value[len(old_base):])
 
 
 class USER_DATA:
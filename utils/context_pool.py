@@ -0,0 +1,118 @@
+"""
+Pool of reusable browser contexts.
+
+Creating a context per test costs a renderer process round trip, plus a
+tracing start and stop with --tracing. The pool keeps released contexts
+warm for the next test of the same worker, resetting what a test can
+leave behind: pages, routes, cookies, permissions and offline mode.
+Contexts whose origins picked up localStorage cannot be reset cheaply and
+are recreated instead, as are contexts of failed tests.
+"""
+import json
+
+from playwright.sync_api import Browser, BrowserContext, Error
+
+
+class BrowserContextPool:
+    """
+    Reusable BrowserContexts for one worker, keyed by their creation options.
+
+    A login state (storage_state) is applied to a pooled context as cookies,
+    so authenticated and anonymous tests share the same warm contexts.
+    """
+
+    def __init__(self, browser: Browser, size: int = 2):
+        """
+        Args:
+            browser: Browser creating the contexts.
+            size: Maximum number of idle contexts kept per set of options.
+        """
+        self.size = size
+        self._browser = browser
+        self._idle: dict[str, list[BrowserContext]] = {}
+        self._keys: dict[BrowserContext, str | None] = {}
+        self.stats = {"acquired": 0, "reused": 0, "created": 0, "discarded": 0}
+
+    def acquire(self, context_args: dict) -> BrowserContext:
+        """
+        Get a context with the given options, reusing an idle one when possible.
+
+        Args:
+            context_args: Options for browser.new_context(); a storage_state
+                path or dict is applied to the context after acquiring it.
+        """
+        self.stats["acquired"] += 1
+        context_args = dict(context_args)
+        state = context_args.pop("storage_state", None)
+        if isinstance(state, (str, bytes)) or hasattr(state, "__fspath__"):
+            with open(state) as f:
+                state = json.load(f)
+        if state and state.get("origins"):
+            # localStorage can only be seeded at creation: not poolable
+            self.stats["created"] += 1
+            context = self._browser.new_context(**context_args, storage_state=state)
+            self._keys[context] = None
+            return context
+
+        key = json.dumps(context_args, sort_keys=True, default=str)
+        idle = self._idle.get(key)
+        if idle:
+            self.stats["reused"] += 1
+            context = idle.pop()
+        else:
+            self.stats["created"] += 1
+            context = self._browser.new_context(**context_args)
+            self._keys[context] = key
+        if state and state.get("cookies"):
+            context.add_cookies(state["cookies"])
+        return context
+
+    def release(self, context: BrowserContext, reusable: bool = True) -> None:
+        """
+        Reset a context and return it to the pool, or close it if it cannot be reused.
+
+        Args:
+            context: Context obtained from acquire().
+            reusable: False to always close it, e.g. after a failed test.
+        """
+        key = self._keys.get(context)
+        idle = self._idle.setdefault(key, []) if key else None
+        if reusable and idle is not None and len(idle) < self.size and self._reset(context):
+            idle.append(context)
+            return
+        self.stats["discarded"] += 1
+        self._keys.pop(context, None)
+        try:
+            context.close()
+        except Error:
+            pass  # Browser already gone
+
+    @staticmethod
+    def _reset(context: BrowserContext) -> bool:
+        """Clear per-test state; False if the context is dirty beyond repair."""
+        try:
+            for page in context.pages:
+                page.close()
+            context.unroute_all(behavior="ignoreErrors")
+            context.clear_cookies()
+            context.clear_permissions()
+            context.set_offline(False)
+            return not context.storage_state()["origins"]
+        except Error:
+            return False
+
+    @property
+    def reuse_rate(self) -> float:
+        """Fraction of acquired contexts served from the pool."""
+        return self.stats["reused"] / self.stats["acquired"] if self.stats["acquired"] else 0.0
+
+    def close(self) -> None:
+        """Close all idle contexts."""
+        for idle in self._idle.values():
+            for context in idle:
+                try:
+                    context.close()
+                except Error:
+                    pass
+        self._idle.clear()
+        self._keys.clear()
@@ -0,0 +1,110 @@
+"""
+HAR record/replay for browser contexts.
+
+Archives live under one directory per test module, one archive per test:
+
+    hars/tests/ui/test_products/test_product_search[chromium].har
+
+A module-wide archive can hold only one response per URL, while tests of
+the same module see the same URL in different states (logged in or out,
+empty or filled cart). Only requests to the site under test are captured,
+so ads and analytics never make it into an archive.
+
+Archives are normalized when saved (timings, dates and other per-run
+headers stripped, JSON indented) so re-recording only shows real changes
+in a diff.
+"""
+import json
+import re
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+from playwright.sync_api import BrowserContext
+
+
+# Entry fields that change on every recording without changing the response
+VOLATILE_ENTRY_FIELDS = ("startedDateTime", "time", "timings", "serverIPAddress", "connection", "pageref")
+VOLATILE_HEADERS = frozenset({"date", "expires", "age", "cf-ray", "report-to", "nel", "server-timing"})
+
+
+class HarArchive:
+    """Recorded traffic of one test, stamped with where and when it was recorded."""
+
+    def __init__(self, har_dir: Path, nodeid: str):
+        """
+        Args:
+            har_dir: Root directory of the archives.
+            nodeid: Pytest node id of the test, e.g. "tests/ui/test_auth.py::test_logout[chromium]".
+        """
+        module, _, name = nodeid.partition("::")
+        file_name = re.sub(r"[^\w.\-\[\]]", "_", name.replace("::", ".")) + ".har"
+        self.path = Path(har_dir) / Path(module).with_suffix("") / file_name
+
+    def metadata(self) -> dict | None:
+        """Recording stamp of the archive, or None if there is no usable archive."""
+        try:
+            with open(self.path) as f:
+                return json.load(f)["log"].get("_recording")
+        except (OSError, ValueError, KeyError):
+            return None
+
+    def is_fresh(self, base_url: str, max_age: timedelta) -> bool:
+        """Whether the archive was recorded against base_url within max_age."""
+        stamp = self.metadata()
+        if not stamp or stamp.get("base_url") != base_url:
+            return False
+        recorded_at = datetime.fromisoformat(stamp["recorded_at"])
+        return datetime.now(timezone.utc) - recorded_at <= max_age
+
+    def replay(self, context: BrowserContext, base_url: str, not_found: str = "fallback") -> None:
+        """
+        Serve the context's requests to the site from the archive.
+
+        Args:
+            context: Browser context to route.
+            base_url: Root URL of the site; other hosts are not routed.
+            not_found: "fallback" to send unrecorded requests to the network, or "abort".
+        """
+        context.route_from_har(self.path, url=base_url + "**", not_found=not_found)
+
+    @staticmethod
+    def record(context: BrowserContext, recording_path: Path, base_url: str) -> None:
+        """Capture the context's requests to the site; written when the context closes."""
+        context.route_from_har(
+            recording_path,
+            url=base_url + "**",
+            update=True,
+            update_content="embed",
+            update_mode="minimal",
+        )
+
+    def save(self, recording_path: Path, base_url: str) -> None:
+        """Normalize a finished recording and store it as this test's archive (if it captured anything)."""
+        try:
+            with open(recording_path) as f:
+                har = json.load(f)
+        except FileNotFoundError:
+            return
+        if not har["log"]["entries"]:
+            return
+
+        for entry in har["log"]["entries"]:
+            for field in VOLATILE_ENTRY_FIELDS:
+                entry.pop(field, None)
+            for message in (entry["request"], entry["response"]):
+                message["headers"] = [
+                    header for header in message.get("headers", [])
+                    if header["name"].lower() not in VOLATILE_HEADERS
+                ]
+        har["log"].pop("pages", None)
+        har["log"]["_recording"] = {
+            "base_url": base_url,
+            "recorded_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        }
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix(".tmp")
+        with open(tmp_path, "w") as f:
+            json.dump(har, f, indent=2, sort_keys=True, ensure_ascii=False)
+            f.write("\n")
+        tmp_path.replace(self.path)
@@ -1,8 +1,23 @@
 """
 Utility functions for test data generation and common operations.
 """
+import json
+import re
 import uuid
-from typing import TypedDict
+import weakref
+from decimal import Decimal
+from typing import Any, TypedDict
+
+try:
+    import orjson
+except ImportError:  # Optional, faster JSON backend
+    orjson = None
+
+PRICE_PATTERN = re.compile(r"\d[\d,]*(\.\d+)?")
+
+# Decoded bodies by response, so a body APIClient checked against its schema
+# is not decoded again by the test
+_decoded_bodies = weakref.WeakKeyDictionary()
 
 
 class APIResponse(TypedDict, total=False):
@@ -26,10 +41,63 @@ def get_unique_email(prefix: str = "testuser") -> str:
     return f"{prefix}_{uuid.uuid4().hex[:8]}@example.com"
 
 
+def parse_price(text: str) -> Decimal:
+    """
+    Parse a displayed price into a Decimal.
+    
+    Args:
+        text: Price as shown on the site, e.g. "Rs. 1,299".
+    
+    Returns:
+        Amount without currency, e.g. Decimal("1299").
+    
+    Raises:
+        ValueError: If the text contains no amount.
+    """
+    match = PRICE_PATTERN.search(text)
+    if not match:
+        raise ValueError(f"No price in: {text!r}")
+    return Decimal(match.group().replace(",", ""))
+
+
+def load_json(body: bytes) -> Any:
+    """
+    Decode a JSON body with orjson when installed, else the json module.
+    
+    Raises:
+        ValueError: If the body is not valid JSON (both backends' errors subclass it).
+    """
+    if orjson is not None:
+        return orjson.loads(body)
+    return json.loads(body)
+
+
+def decode_response(response) -> Any:
+    """
+    Decode a response's JSON body, once per response.
+    
+    Later calls with the same response return the same object, so callers
+    must not modify it.
+    
+    Raises:
+        ValueError: If the body is not valid JSON.
+    """
+    try:
+        return _decoded_bodies[response]
+    except KeyError:
+        pass
+    decoded = _decoded_bodies[response] = load_json(response.body())
+    return decoded
+
+
 def parse_api_response(response) -> APIResponse:
     """
     Parse API response and return typed dict.
     
+    The body is read once, as bytes, and decoded once per response (see
+    decode_response). utils.api_records decodes responses into validated
+    records instead.
+    
     Args:
         response: Playwright APIResponse object.
     
@@ -39,8 +107,27 @@ def parse_api_response(response) -> APIResponse:
     Raises:
         ValueError: If response body is not valid JSON.
     """
-    import json
     try:
-        return json.loads(response.text())
-    except json.JSONDecodeError as e:
-        raise ValueError(f"Invalid JSON response: {response.text()}") from e
\ No newline at end of file
+        return decode_response(response)
+    except ValueError as e:
+        raise ValueError(f"Invalid JSON response: {response.body().decode(errors='replace')}") from e
+
+
+async def parse_async_api_response(response) -> APIResponse:
+    """
+    Parse an async API response and return typed dict.
+    
+    Args:
+        response: Playwright async APIResponse object.
+    
+    Returns:
+        Parsed response body as APIResponse TypedDict.
+    
+    Raises:
+        ValueError: If response body is not valid JSON.
+    """
+    body = await response.body()
+    try:
+        return load_json(body)
+    except ValueError as e:
+        raise ValueError(f"Invalid JSON response: {body.decode(errors='replace')}") from e
\ No newline at end of file
@@ -0,0 +1,96 @@
+"""
+Request blocking for browser contexts.
+
+The live site pulls ads, analytics, fonts and third-party iframes that
+dominate page load time but never matter to our assertions. RequestBlocker
+aborts them before they leave the browser:
+
+- Domains are matched by one regex route, evaluated inside the Playwright
+  driver, so requests that are not blocked cost no extra round trip.
+- Resource types (image, media, font, ...) can only be told apart in a
+  handler, so that catch-all route is installed only when asked for.
+"""
+import re
+from collections import Counter
+from urllib.parse import urlsplit
+
+from playwright.sync_api import BrowserContext, Route
+
+
+# Ad, analytics and web font hosts requested by automationexercise.com pages
+THIRD_PARTY_DOMAINS = (
+    "googlesyndication.com",
+    "doubleclick.net",
+    "googleadservices.com",
+    "googletagmanager.com",
+    "googletagservices.com",
+    "google-analytics.com",
+    "adtrafficquality.google",
+    "fundingchoicesmessages.google.com",
+    "amazon-adsystem.com",
+    "facebook.net",
+    "fonts.googleapis.com",
+    "fonts.gstatic.com",
+)
+
+# Resource types safe to drop when a test only asserts on text and structure
+STATIC_RESOURCE_TYPES = ("image", "media", "font")
+
+
+class RequestBlocker:
+    """
+    Abort requests to given domains and of given resource types.
+
+    Usage:
+        blocker = RequestBlocker(resource_types=STATIC_RESOURCE_TYPES)
+        blocker.install(context)
+        ...
+        print(blocker.report())
+    """
+
+    def __init__(self, domains=THIRD_PARTY_DOMAINS, resource_types=()):
+        """
+        Args:
+            domains: Hosts to block, subdomains included.
+            resource_types: Playwright resource types to block on any host.
+        """
+        self.domains = tuple(domains)
+        self.resource_types = frozenset(resource_types)
+        self.blocked_types: Counter[str] = Counter()
+        self.blocked_hosts: Counter[str] = Counter()
+
+    @property
+    def blocked_count(self) -> int:
+        return sum(self.blocked_types.values())
+
+    def domain_pattern(self) -> re.Pattern:
+        """Regex matching URLs on any of the blocked domains or their subdomains."""
+        hosts = "|".join(re.escape(domain) for domain in self.domains)
+        return re.compile(rf"^[a-z]+://([^/?#]*\.)?({hosts})(:\d+)?([/?#]|$)")
+
+    def install(self, context: BrowserContext) -> None:
+        """Route the context's requests through the blocker."""
+        if self.domains:
+            context.route(self.domain_pattern(), self._abort)
+        if self.resource_types:
+            context.route("**/*", self._filter_resource_type)
+
+    def _filter_resource_type(self, route: Route) -> None:
+        if route.request.resource_type in self.resource_types:
+            self._abort(route)
+        else:
+            route.fallback()
+
+    def _abort(self, route: Route) -> None:
+        request = route.request
+        self.blocked_types[request.resource_type] += 1
+        self.blocked_hosts[urlsplit(request.url).hostname or ""] += 1
+        route.abort("blockedbyclient")
+
+    def report(self) -> str:
+        """Summarize blocked requests by resource type and host."""
+        lines = [f"{self.blocked_count} requests blocked", "", "By resource type:"]
+        lines += [f"  {name}: {count}" for name, count in self.blocked_types.most_common()]
+        lines += ["", "By host:"]
+        lines += [f"  {name}: {count}" for name, count in self.blocked_hosts.most_common()]
+        return "\n".join(lines)
@@ -0,0 +1,190 @@
+"""
+Test-duration profiler.
+
+Times every allure step, page navigation, Playwright action and expect()
+assertion of a test:
+
+- Steps are timed through the allure_commons start_step/stop_step hooks,
+  so every @allure.step page-object method is covered without changes.
+- Navigations, actions and assertions are timed by wrapping the sync API
+  methods of Page, Locator and the assertion classes while the profiler
+  is installed.
+
+Per test, the timings form a tree (actions nested under the step that ran
+them) rendered as text for an Allure attachment. Across tests they are
+aggregated per step name, and per action name within its step (e.g.
+"Add product at index 0 to cart > hover"), and can be merged from xdist
+workers into one session report.
+"""
+import functools
+import json
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+import allure_commons
+from playwright.sync_api import Locator, LocatorAssertions, Page, PageAssertions
+
+
+# Wrapped methods and the kind they are reported as
+NAVIGATIONS = {Page: ("goto", "reload", "go_back", "go_forward", "wait_for_url", "wait_for_load_state")}
+ACTIONS = {
+    Page: ("evaluate", "screenshot", "wait_for_selector", "wait_for_timeout"),
+    Locator: (
+        "click", "dblclick", "tap", "fill", "clear", "type", "press", "press_sequentially",
+        "check", "uncheck", "set_checked", "select_option", "set_input_files", "hover",
+        "focus", "wait_for", "count", "text_content", "inner_text", "input_value",
+        "all_text_contents", "is_visible", "evaluate", "evaluate_all", "screenshot",
+    ),
+}
+ASSERTION_CLASSES = (LocatorAssertions, PageAssertions)
+
+
+@dataclass(slots=True)
+class Timing:
+    """One timed step, navigation, action or assertion of a test."""
+    kind: str  # "step", "navigation", "action" or "assertion"
+    name: str
+    key: str  # Aggregation key: the name, prefixed with the enclosing step for non-steps
+    depth: int
+    duration: float = 0.0
+
+
+class StepProfiler:
+    """
+    Collect step timings of the running test and aggregate them per session.
+
+    Usage:
+        profiler = StepProfiler()
+        profiler.install()
+        profiler.start_test()
+        ...  # run the test
+        breakdown = profiler.finish_test(nodeid)
+        profiler.write("profile.json")
+    """
+
+    def __init__(self, top: int = 25):
+        """
+        Args:
+            top: Number of slowest individual timings kept for the session report.
+        """
+        self.top = top
+        self.tests = 0
+        self.stats: dict[str, dict] = {}
+        self.slowest: list[dict] = []
+        self._timings: list[Timing] = []
+        self._open: list[tuple[Timing, float]] = []
+        self._originals: list[tuple[type, str, object]] = []
+
+    def install(self) -> None:
+        """Start receiving allure steps and wrap the Playwright methods."""
+        allure_commons.plugin_manager.register(self)
+        for kind, methods in (("navigation", NAVIGATIONS), ("action", ACTIONS)):
+            for cls, names in methods.items():
+                for name in names:
+                    self._wrap(cls, name, kind)
+        for cls in ASSERTION_CLASSES:
+            for name in dir(cls):
+                if name.startswith(("to_", "not_to_")):
+                    self._wrap(cls, name, "assertion")
+
+    def uninstall(self) -> None:
+        """Restore the Playwright methods and stop receiving allure steps."""
+        for cls, name, original in reversed(self._originals):
+            setattr(cls, name, original)
+        self._originals.clear()
+        allure_commons.plugin_manager.unregister(self)
+
+    def _wrap(self, cls: type, name: str, kind: str) -> None:
+        original = getattr(cls, name)
+
+        @functools.wraps(original)
+        def timed(*args, **kwargs):
+            self._start(kind, name)
+            try:
+                return original(*args, **kwargs)
+            finally:
+                self._stop()
+
+        self._originals.append((cls, name, original))
+        setattr(cls, name, timed)
+
+    @allure_commons.hookimpl
+    def start_step(self, uuid, title, params):
+        self._start("step", title)
+
+    @allure_commons.hookimpl
+    def stop_step(self, uuid, exc_type, exc_val, exc_tb):
+        self._stop()
+
+    def _start(self, kind: str, name: str) -> None:
+        step = next((timing.name for timing, _ in reversed(self._open) if timing.kind == "step"), None)
+        key = name if kind == "step" or step is None else f"{step} > {name}"
+        timing = Timing(kind, name, key, depth=len(self._open))
+        self._timings.append(timing)
+        self._open.append((timing, time.perf_counter()))
+
+    def _stop(self) -> None:
+        if self._open:
+            timing, started = self._open.pop()
+            timing.duration = time.perf_counter() - started
+
+    def start_test(self) -> None:
+        """Forget the timings of the previous test."""
+        self._timings = []
+        self._open = []
+
+    def finish_test(self, nodeid: str) -> str:
+        """
+        Add the test's timings to the session totals.
+
+        Returns:
+            The test's timings as an indented tree, or "" if nothing was timed.
+        """
+        self.tests += 1
+        for timing in self._timings:
+            entry = self.stats.setdefault(
+                timing.key, {"kind": timing.kind, "name": timing.key, "count": 0, "total": 0.0, "max": 0.0}
+            )
+            entry["count"] += 1
+            entry["total"] += timing.duration
+            entry["max"] = max(entry["max"], timing.duration)
+        self._keep_slowest(
+            {"kind": t.kind, "name": t.key, "nodeid": nodeid, "duration": t.duration}
+            for t in self._timings
+        )
+        return "\n".join(
+            f"{timing.duration * 1000:9.1f} ms  {'  ' * timing.depth}{timing.name}"
+            + ("" if timing.kind == "step" else f" ({timing.kind})")
+            for timing in self._timings
+        )
+
+    def _keep_slowest(self, timings) -> None:
+        self.slowest = sorted([*self.slowest, *timings], key=lambda t: t["duration"], reverse=True)[:self.top]
+
+    def as_dict(self) -> dict:
+        """Session totals, slowest step names first; JSON-serializable."""
+        steps = sorted(self.stats.values(), key=lambda entry: entry["total"], reverse=True)
+        return {
+            "tests": self.tests,
+            "steps": [{**entry, "mean": entry["total"] / entry["count"]} for entry in steps],
+            "slowest": self.slowest,
+        }
+
+    def merge(self, profile: dict) -> None:
+        """Add the session totals of another process (e.g. an xdist worker)."""
+        self.tests += profile.get("tests", 0)
+        for step in profile.get("steps", []):
+            entry = self.stats.setdefault(
+                step["name"], {"kind": step["kind"], "name": step["name"], "count": 0, "total": 0.0, "max": 0.0}
+            )
+            entry["count"] += step["count"]
+            entry["total"] += step["total"]
+            entry["max"] = max(entry["max"], step["max"])
+        self._keep_slowest(profile.get("slowest", []))
+
+    def write(self, path: str | Path) -> None:
+        """Write the session totals as JSON."""
+        with open(path, "w") as f:
+            json.dump(self.as_dict(), f, indent=2)
+            f.write("\n")
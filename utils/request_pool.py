@@ -0,0 +1,72 @@
+"""
+Pool of reusable Playwright API request contexts.
+
+Creating and disposing an APIRequestContext per test throws away its
+connections (TLS handshake, keep-alive). The pool keeps released contexts
+for the next test of the same worker and counts how often that happens.
+"""
+from playwright.sync_api import APIRequestContext, Playwright
+
+
+class RequestContextPool:
+    """
+    Reusable APIRequestContexts for one worker.
+
+    A context that picked up cookies is disposed on release instead of
+    being reused, so cookie state never leaks into the next test.
+    """
+
+    def __init__(self, playwright: Playwright, size: int = 1, **context_args):
+        """
+        Args:
+            playwright: Playwright instance creating the contexts.
+            size: Maximum number of idle contexts kept for reuse.
+            **context_args: Options for playwright.request.new_context().
+        """
+        self.size = size
+        self._playwright = playwright
+        self._context_args = context_args
+        self._idle: list[APIRequestContext] = []
+        self._isolated: list[APIRequestContext] = []
+        self.stats = {"acquired": 0, "reused": 0, "created": 0, "isolated": 0, "discarded": 0}
+
+    def acquire(self, isolated: bool = False) -> APIRequestContext:
+        """
+        Get a context, reusing an idle one when possible.
+
+        Args:
+            isolated: Always create a fresh context, disposed on release.
+        """
+        self.stats["acquired"] += 1
+        if isolated:
+            self.stats["isolated"] += 1
+            context = self._playwright.request.new_context(**self._context_args)
+            self._isolated.append(context)
+            return context
+        if self._idle:
+            self.stats["reused"] += 1
+            return self._idle.pop()
+        self.stats["created"] += 1
+        return self._playwright.request.new_context(**self._context_args)
+
+    def release(self, context: APIRequestContext) -> None:
+        """Return a context to the pool, or dispose it if it cannot be reused."""
+        if context in self._isolated:
+            self._isolated.remove(context)
+            context.dispose()
+            return
+        if len(self._idle) >= self.size or context.storage_state()["cookies"]:
+            self.stats["discarded"] += 1
+            context.dispose()
+            return
+        self._idle.append(context)
+
+    @property
+    def reuse_rate(self) -> float:
+        """Share of acquisitions served by an already open context."""
+        return self.stats["reused"] / self.stats["acquired"] if self.stats["acquired"] else 0.0
+
+    def close(self) -> None:
+        """Dispose all idle contexts."""
+        while self._idle:
+            self._idle.pop().dispose()
@@ -0,0 +1,125 @@
+"""
+Duration-aware xdist scheduling.
+
+--dist=loadfile pins each test file to one worker, so the worker that gets
+test_auth.py or test_checkout.py finishes long after the others.
+DurationScheduling hands out tests individually, longest first, using their
+durations from previous runs (kept in the pytest cache), so the short tests
+fill the gaps at the end of the run.
+
+It is opt-in and takes the place of the loadgroup scheduler, so it runs
+with --dist=loadgroup (pytest.ini keeps --dist=loadfile):
+
+    pytest --dist=loadgroup --schedule-by-duration
+
+Tests that must share a worker are marked @pytest.mark.xdist_group("name"):
+a group is scheduled as one unit, with the summed duration of its tests.
+"""
+import heapq
+import statistics
+import time
+
+import pytest
+from xdist.scheduler import LoadGroupScheduling
+
+
+CACHE_KEY = "duration_scheduling/durations"
+# Assumed duration of a test without history when no test has any
+DEFAULT_DURATION = 1.0
+# Weight of the latest run in the stored duration; smooths out one-off slow runs
+SMOOTHING = 0.5
+
+
+def strip_group(nodeid: str) -> str:
+    """Node id without the "@group" suffix --dist=loadgroup adds."""
+    if nodeid.rfind("@") > nodeid.rfind("]"):
+        return nodeid.rsplit("@", 1)[0]
+    return nodeid
+
+
+class DurationScheduling(LoadGroupScheduling):
+    """
+    xdist scheduler running the longest work units first.
+
+    Returned from the pytest_xdist_make_scheduler hook. After the run,
+    save() stores the measured durations for the next one and report()
+    compares the predicted and actual makespan.
+    """
+
+    def __init__(self, config: pytest.Config, log=None):
+        super().__init__(config, log)
+        cache = getattr(config, "cache", None)
+        self.history: dict[str, float] = cache.get(CACHE_KEY, {}) if cache else {}
+        self._default = statistics.median(self.history.values()) if self.history else DEFAULT_DURATION
+        self.durations: dict[str, float] = {}
+        self.busy: dict[str, float] = {}
+        self.predicted_makespan: float | None = None
+        self.started_at: float | None = None
+        self.finished_at: float | None = None
+        self._sorted = False
+
+    def estimate(self, nodeid: str) -> float:
+        """Expected duration of a test: its history, else the median of all known tests."""
+        return self.history.get(strip_group(nodeid), self._default)
+
+    def _sort_workqueue(self) -> None:
+        """Order the pending work units longest first and predict the makespan."""
+        units = sorted(
+            self.workqueue.items(),
+            key=lambda unit: sum(self.estimate(nodeid) for nodeid in unit[1]),
+            reverse=True,
+        )
+        self.workqueue.clear()
+        self.workqueue.update(units)
+        self._sorted = True
+
+        if self.predicted_makespan is None:
+            # Greedy list scheduling, as the workers will pull the units
+            loads = [0.0] * max(len(self.nodes), 1)
+            for _, work_unit in units:
+                heapq.heapreplace(loads, loads[0] + sum(self.estimate(nodeid) for nodeid in work_unit))
+            self.predicted_makespan = max(loads)
+            self.started_at = time.perf_counter()
+
+    def _assign_work_unit(self, node) -> None:
+        if not self._sorted:
+            self._sort_workqueue()
+        super()._assign_work_unit(node)
+
+    def remove_node(self, node):
+        # A crashed node's tests go back to the end of the queue: re-sort them in
+        self._sorted = False
+        return super().remove_node(node)
+
+    def mark_test_complete(self, node, item_index: int, duration: float = 0) -> None:
+        nodeid = self.registered_collections[node][item_index]
+        self.durations[strip_group(nodeid)] = duration
+        self.busy[node.gateway.id] = self.busy.get(node.gateway.id, 0.0) + duration
+        self.finished_at = time.perf_counter()
+        super().mark_test_complete(node, item_index, duration)
+
+    def save(self) -> None:
+        """Merge the durations of this run into the history in the pytest cache."""
+        cache = getattr(self.config, "cache", None)
+        if cache is None or not self.durations:
+            return
+        history = dict(self.history)
+        for nodeid, duration in self.durations.items():
+            previous = history.get(nodeid)
+            history[nodeid] = duration if previous is None else (
+                SMOOTHING * duration + (1 - SMOOTHING) * previous
+            )
+        cache.set(CACHE_KEY, history)
+
+    def report(self) -> str | None:
+        """Predicted vs actual makespan of the run, None if nothing ran."""
+        if self.predicted_makespan is None or self.finished_at is None:
+            return None
+        actual = self.finished_at - self.started_at
+        known = sum(1 for nodeid in self.durations if nodeid in self.history)
+        busy = sorted(self.busy.values())
+        return (
+            f"Duration scheduling: predicted makespan {self.predicted_makespan:.1f}s, "
+            f"actual {actual:.1f}s; worker busy time {busy[0]:.1f}s-{busy[-1]:.1f}s; "
+            f"{known}/{len(self.durations)} tests had a recorded duration"
+        )
@@ -0,0 +1,336 @@
+"""
+Response contracts of the API endpoints APIClient calls.
+
+Schemas use a subset of JSON Schema (type, properties, required, items,
+minItems, minimum, minLength, enum, pattern) and are compiled once into
+nested closures, so validating a response walks the data, not the schema.
+Every violation is reported in one pass, with its path:
+
+    $.products[12].category.usertype: expected object, got str
+
+Paths are kept as (parent, key) links and only formatted for violations,
+which keeps a full-catalog pass cheap enough for every API test. A
+response is decoded and checked once: the decoded body is shared with the
+test (utils.helper.decode_response) and validate_response keeps its result.
+"""
+import re
+import weakref
+from typing import Callable
+
+from utils.helper import decode_response
+
+
+class SchemaViolationError(AssertionError):
+    """An API response does not match its endpoint's schema."""
+
+
+class SchemaViolationWarning(UserWarning):
+    """An API response does not match its endpoint's schema."""
+
+
+# (parent, key) links from the root, None at the root
+Path = tuple | None
+Check = Callable[[object, Path, list], None]
+
+TYPES = {
+    "string": (str,),
+    "integer": (int,),
+    "number": (int, float),
+    "boolean": (bool,),
+    "object": (dict,),
+    "array": (list,),
+    "null": (type(None),),
+}
+
+
+def format_path(path: Path) -> str:
+    keys = []
+    while path is not None:
+        path, key = path
+        keys.append(f"[{key}]" if isinstance(key, int) else f".{key}")
+    return "$" + "".join(reversed(keys))
+
+
+def _expected_types(schema: dict) -> tuple[frozenset, str]:
+    names = schema["type"] if isinstance(schema["type"], list) else [schema["type"]]
+    unknown = [name for name in names if name not in TYPES]
+    if unknown:
+        raise ValueError(f"Unsupported schema types: {unknown}")
+    # Exact type membership, so True is not an integer
+    return frozenset(t for name in names for t in TYPES[name]), " or ".join(names)
+
+
+def compile_schema(schema: dict) -> Check:
+    """
+    Compile a schema into a check(value, path, violations) function.
+    
+    Raises:
+        ValueError: If the schema uses an unsupported keyword or type.
+    """
+    unsupported = set(schema) - {
+        "type", "properties", "required", "items", "minItems", "minimum", "minLength", "enum", "pattern",
+        "description",
+    }
+    if unsupported:
+        raise ValueError(f"Unsupported schema keywords: {sorted(unsupported)}")
+
+    checks = []
+    if "properties" in schema or "required" in schema:
+        checks.append(_compile_properties(schema.get("properties", {}), schema.get("required", [])))
+    if "items" in schema:
+        checks.append(_compile_items(compile_schema(schema["items"])))
+    if "minItems" in schema:
+        checks.append(_compile_min_items(schema["minItems"]))
+    if "minimum" in schema:
+        checks.append(_compile_minimum(schema["minimum"]))
+    if "minLength" in schema:
+        checks.append(_compile_min_length(schema["minLength"]))
+    if "enum" in schema:
+        checks.append(_compile_enum(schema["enum"]))
+    if "pattern" in schema:
+        checks.append(_compile_pattern(schema["pattern"]))
+
+    if "type" not in schema:
+        def check(value, path, violations):
+            for keyword_check in checks:
+                keyword_check(value, path, violations)
+        return check
+
+    expected, expected_name = _expected_types(schema)
+
+    def check(value, path, violations):
+        if type(value) not in expected:
+            violations.append(f"{format_path(path)}: expected {expected_name}, got {type(value).__name__}")
+            return
+        for keyword_check in checks:
+            keyword_check(value, path, violations)
+    return check
+
+
+def _compile_properties(properties: dict, required: list) -> Check:
+    children = [(key, compile_schema(child)) for key, child in properties.items()]
+
+    def check(value, path, violations):
+        if not isinstance(value, dict):
+            return
+        for key in required:
+            if key not in value:
+                violations.append(f"{format_path(path)}: missing {key!r}")
+        for key, child in children:
+            if key in value:
+                child(value[key], (path, key), violations)
+    return check
+
+
+def _compile_items(child: Check) -> Check:
+    def check(value, path, violations):
+        if not isinstance(value, list):
+            return
+        for index, item in enumerate(value):
+            child(item, (path, index), violations)
+    return check
+
+
+def _compile_min_items(minimum: int) -> Check:
+    def check(value, path, violations):
+        if isinstance(value, list) and len(value) < minimum:
+            violations.append(f"{format_path(path)}: expected at least {minimum} items, got {len(value)}")
+    return check
+
+
+def _compile_minimum(minimum: float) -> Check:
+    def check(value, path, violations):
+        if type(value) in (int, float) and value < minimum:
+            violations.append(f"{format_path(path)}: {value!r} is less than {minimum!r}")
+    return check
+
+
+def _compile_min_length(minimum: int) -> Check:
+    def check(value, path, violations):
+        if isinstance(value, str) and len(value) < minimum:
+            violations.append(f"{format_path(path)}: {value!r} is shorter than {minimum} characters")
+    return check
+
+
+def _compile_enum(allowed: list) -> Check:
+    def check(value, path, violations):
+        if value not in allowed:
+            violations.append(f"{format_path(path)}: {value!r} is not one of {allowed!r}")
+    return check
+
+
+def _compile_pattern(pattern: str) -> Check:
+    search = re.compile(pattern).search
+
+    def check(value, path, violations):
+        if isinstance(value, str) and search(value) is None:
+            violations.append(f"{format_path(path)}: {value!r} does not match {pattern!r}")
+    return check
+
+
+# =============================================================================
+# Endpoint schemas
+# =============================================================================
+
+MESSAGE = {
+    "description": "Status message, the body of every response without data",
+    "type": "object",
+    "required": ["responseCode", "message"],
+    "properties": {
+        "responseCode": {"type": "integer"},
+        "message": {"type": "string"},
+    },
+}
+
+PRODUCT = {
+    "type": "object",
+    "required": ["id", "name", "price", "brand", "category"],
+    "properties": {
+        "id": {"type": "integer", "minimum": 1},
+        "name": {"type": "string", "minLength": 1},
+        "price": {"type": "string", "pattern": r"^Rs\. \d[\d,]*$"},
+        "brand": {"type": "string", "minLength": 1},
+        "category": {
+            "type": "object",
+            "required": ["usertype", "category"],
+            "properties": {
+                "usertype": {
+                    "type": "object",
+                    "required": ["usertype"],
+                    "properties": {"usertype": {"type": "string", "minLength": 1}},
+                },
+                "category": {"type": "string", "minLength": 1},
+            },
+        },
+    },
+}
+
+PRODUCTS_LIST = {
+    "type": "object",
+    "required": ["responseCode", "products"],
+    "properties": {
+        "responseCode": {"type": "integer", "enum": [200]},
+        "products": {"type": "array", "minItems": 1, "items": PRODUCT},
+    },
+}
+
+SEARCH_RESULTS = {
+    "type": "object",
+    "required": ["responseCode", "products"],
+    "properties": {
+        "responseCode": {"type": "integer", "enum": [200]},
+        "products": {"type": "array", "items": PRODUCT},
+    },
+}
+
+BRANDS_LIST = {
+    "type": "object",
+    "required": ["responseCode", "brands"],
+    "properties": {
+        "responseCode": {"type": "integer", "enum": [200]},
+        "brands": {
+            "type": "array",
+            "minItems": 1,
+            "items": {
+                "type": "object",
+                "required": ["id", "brand"],
+                "properties": {
+                    "id": {"type": "integer", "minimum": 1},
+                    "brand": {"type": "string", "minLength": 1},
+                },
+            },
+        },
+    },
+}
+
+USER_DETAIL = {
+    "type": "object",
+    "required": ["responseCode", "user"],
+    "properties": {
+        "responseCode": {"type": "integer", "enum": [200]},
+        "user": {
+            "type": "object",
+            "required": ["id", "name", "email"],
+            "properties": {
+                "id": {"type": "integer", "minimum": 1},
+                "email": {"type": "string", "pattern": r"^[^@\s]+@[^@\s]+$"},
+                **{
+                    key: {"type": "string"}
+                    for key in (
+                        "name", "title", "birth_day", "birth_month", "birth_year", "first_name",
+                        "last_name", "company", "address1", "address2", "country", "state",
+                        "city", "zipcode",
+                    )
+                },
+            },
+        },
+    },
+}
+
+# Schema of each endpoint's data-carrying response, by responseCode; all
+# other responses of a listed endpoint, and every response to another
+# method on its path, are status messages
+API_SCHEMAS = {
+    "GET /productsList": {200: PRODUCTS_LIST},
+    "GET /brandsList": {200: BRANDS_LIST},
+    "POST /searchProduct": {200: SEARCH_RESULTS},
+    "POST /createAccount": {},
+    "PUT /updateAccount": {},
+    "GET /getUserDetailByEmail": {200: USER_DETAIL},
+    "DELETE /deleteAccount": {},
+    "POST /verifyLogin": {},
+}
+
+
+class SchemaRegistry:
+    """Compiled response schemas per endpoint and responseCode."""
+
+    def __init__(self, schemas: dict[str, dict[int, dict]] = None, default: dict = MESSAGE):
+        """
+        Args:
+            schemas: Schemas by endpoint ("METHOD /path") and responseCode.
+            default: Schema of the other responses of the listed endpoints.
+        """
+        schemas = API_SCHEMAS if schemas is None else schemas
+        self._default = compile_schema(default)
+        self._paths = {endpoint.partition(" ")[2] for endpoint in schemas}
+        self._checks = {
+            (endpoint, code): compile_schema(schema)
+            for endpoint, by_code in schemas.items()
+            for code, schema in by_code.items()
+        }
+        # (endpoint, violations) by response already checked
+        self._checked: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+    def validate(self, endpoint: str, body) -> list[str]:
+        """
+        Violations of a decoded body against its endpoint's contract.
+
+        Paths without a schema are not checked.
+        """
+        if endpoint.partition(" ")[2] not in self._paths:
+            return []
+        code = body.get("responseCode") if isinstance(body, dict) else None
+        check = self._checks.get((endpoint, code), self._default)
+        violations = []
+        check(body, None, violations)
+        return violations
+
+    def validate_response(self, endpoint: str, response) -> list[str]:
+        """
+        Violations of a response against its endpoint's contract, a non-JSON body included.
+
+        The result is kept, so checking a response APIClient already
+        checked costs nothing.
+        """
+        if endpoint.partition(" ")[2] not in self._paths:
+            return []
+        checked = self._checked.get(response)
+        if checked is not None and checked[0] == endpoint:
+            return list(checked[1])
+        try:
+            violations = self.validate(endpoint, decode_response(response))
+        except ValueError:
+            violations = [f"$: body is not JSON: {response.body()[:200]!r}"]
+        self._checked[response] = (endpoint, violations)
+        return list(violations)